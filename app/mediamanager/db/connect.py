@@ -24,4 +24,7 @@ def connect_db(db_path: str) -> sqlite3.Connection:
     # can report success before later writes fail with disk I/O errors. Keep the
     # app on MEMORY journaling so scan/import writes remain functional.
     conn.execute("PRAGMA journal_mode=MEMORY;")
+    # Scans write in large batched transactions; don't fsync more than needed.
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
     return conn
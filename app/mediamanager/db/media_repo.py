@@ -7,6 +7,7 @@ from typing import List, Optional, Iterable
 
 from app.mediamanager.db.pagination import page_to_limit_offset
 from app.mediamanager.db.scope_query import build_scope_where
+from app.mediamanager.utils.hashing import calculate_file_hash, is_fast_fingerprint
 from app.mediamanager.utils.pathing import normalize_windows_path
 
 
@@ -40,6 +41,7 @@ def add_media_item(
     height: Optional[int] = None,
     duration_ms: Optional[int] = None,
     is_hidden: int = 0,
+    commit: bool = True,
 ) -> int:
     now = _utc_now_iso()
     normalized = normalize_windows_path(path)
@@ -68,14 +70,15 @@ def add_media_item(
     row = conn.execute("SELECT id FROM media_items WHERE path = ?", (normalized,)).fetchone()
     if not row:
         raise RuntimeError("failed to insert media item")
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(row[0])
 
 
 def get_media_by_path(conn: sqlite3.Connection, path: str) -> Optional[dict]:
     normalized = normalize_windows_path(path)
     row = conn.execute(
-        "SELECT id, path, media_type, file_size_bytes, file_created_time_utc, modified_time_utc, exif_date_taken, metadata_date, width, height, duration_ms, is_hidden FROM media_items WHERE path = ?",
+        "SELECT id, path, media_type, file_size_bytes, file_created_time_utc, modified_time_utc, exif_date_taken, metadata_date, width, height, duration_ms, is_hidden, content_hash FROM media_items WHERE path = ?",
         (normalized,),
     ).fetchone()
     if not row:
@@ -93,6 +96,7 @@ def get_media_by_path(conn: sqlite3.Connection, path: str) -> Optional[dict]:
         "height": row[9],
         "duration_ms": row[10],
         "is_hidden": bool(row[11]),
+        "content_hash": row[12],
     }
 
 
@@ -123,6 +127,31 @@ def get_media_by_hash(conn: sqlite3.Connection, content_hash: str) -> Optional[d
     return {"id": row[0], "path": row[1], "media_type": row[2]}
 
 
+def _get_moved_legacy_media(conn: sqlite3.Connection, path: str, size: int) -> Optional[dict]:
+    """Find a row still keyed by a full SHA-256 hash whose file has moved to path.
+
+    Rows hashed before scans switched to fast fingerprints can't be matched by
+    hash any more; candidates of the same size whose stored path is gone are
+    compared against the SHA-256 of the file at path instead.
+    """
+    rows = conn.execute(
+        "SELECT id, path, media_type, content_hash FROM media_items "
+        "WHERE file_size_bytes = ? AND content_hash IS NOT NULL AND instr(content_hash, ':') = 0",
+        (size,),
+    ).fetchall()
+    candidates = [r for r in rows if not Path(r[1]).exists()]
+    if not candidates:
+        return None
+    try:
+        full_hash = calculate_file_hash(path)
+    except OSError:
+        return None
+    for row in candidates:
+        if row[3] == full_hash:
+            return {"id": row[0], "path": row[1], "media_type": row[2]}
+    return None
+
+
 def upsert_media_item(
     conn: sqlite3.Connection,
     path: str,
@@ -131,8 +160,13 @@ def upsert_media_item(
     width: Optional[int] = None,
     height: Optional[int] = None,
     duration_ms: Optional[int] = None,
+    commit: bool = True,
 ) -> int:
-    """Upsert media item, handling renames/moves via content hash."""
+    """Upsert media item, handling renames/moves via content hash.
+
+    Pass ``commit=False`` to batch several upserts into one transaction; the
+    caller is then responsible for committing.
+    """
     now = _utc_now_iso()
     normalized = normalize_windows_path(path)
 
@@ -154,7 +188,8 @@ def upsert_media_item(
             """,
             (content_hash, size, created_time, mtime, width, height, duration_ms, now, existing_by_path[0]),
         )
-        conn.commit()
+        if commit:
+            conn.commit()
         return int(existing_by_path[0])
 
     # 2. Path doesn't exist. Check if the hash exists (indicates a move/rename or a copy)
@@ -162,6 +197,8 @@ def upsert_media_item(
     # If the old path still exists, this is a distinct copy (duplicate content).
     # If the old path is gone, it's almost certainly a move.
     existing_by_hash = get_media_by_hash(conn, content_hash)
+    if existing_by_hash is None and is_fast_fingerprint(content_hash) and size:
+        existing_by_hash = _get_moved_legacy_media(conn, path, size)
     if existing_by_hash:
         old_path = existing_by_hash["path"]
         media_id = existing_by_hash["id"]
@@ -174,16 +211,17 @@ def upsert_media_item(
                 (media_id, old_path, normalized, now),
             )
 
-            # Update path AND stats
+            # Update path, hash AND stats (the hash changes when a legacy row is matched)
             conn.execute(
                 """
                 UPDATE media_items 
-                SET path = ?, file_size_bytes = ?, file_created_time_utc = ?, modified_time_utc = ?, width = ?, height = ?, duration_ms = ?, updated_at_utc = ? 
+                SET path = ?, content_hash = ?, file_size_bytes = ?, file_created_time_utc = ?, modified_time_utc = ?, width = ?, height = ?, duration_ms = ?, updated_at_utc = ? 
                 WHERE id = ?
                 """,
-                (normalized, size, created_time, mtime, width, height, duration_ms, now, media_id),
+                (normalized, content_hash, size, created_time, mtime, width, height, duration_ms, now, media_id),
             )
-            conn.commit()
+            if commit:
+                conn.commit()
             return int(media_id)
         else:
             # Old path still exists -> Duplicate content at new path
@@ -191,7 +229,39 @@ def upsert_media_item(
             pass
 
     # 3. Brand new item (or duplicate content at new path)
-    return add_media_item(conn, normalized, media_type, content_hash, width=width, height=height, duration_ms=duration_ms)
+    return add_media_item(conn, normalized, media_type, content_hash, width=width, height=height, duration_ms=duration_ms, commit=commit)
+
+
+def upsert_media_items_bulk(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple],
+) -> list[int]:
+    """Upsert many media items in a single write transaction.
+
+    Each row is ``(path, media_type, content_hash, width, height, duration_ms)``.
+    Either every row is applied or, on error, the rows are rolled back and the
+    exception re-raised. The rows go in a savepoint, so a transaction the
+    caller already has open is neither committed nor rolled back here.
+    """
+    owns_tx = not conn.in_transaction
+    if owns_tx:
+        conn.execute("BEGIN IMMEDIATE")
+    conn.execute("SAVEPOINT upsert_media_items_bulk")
+    try:
+        ids = [
+            upsert_media_item(conn, path, media_type, content_hash, width=width, height=height, duration_ms=duration_ms, commit=False)
+            for path, media_type, content_hash, width, height, duration_ms in rows
+        ]
+    except Exception:
+        conn.execute("ROLLBACK TO upsert_media_items_bulk")
+        conn.execute("RELEASE upsert_media_items_bulk")
+        if owns_tx:
+            conn.rollback()
+        raise
+    conn.execute("RELEASE upsert_media_items_bulk")
+    if owns_tx:
+        conn.commit()
+    return ids
 
 
 def list_media_in_scope(
@@ -204,6 +274,28 @@ def list_media_in_scope(
     return _list_media_with_where(conn, where_sql, params, limit=limit, offset=offset)
 
 
+def count_media_in_scope(
+    conn: sqlite3.Connection,
+    selected_roots: list[str],
+    include_hidden: bool = True,
+) -> int:
+    where_sql, params = build_scope_where(selected_roots)
+    if not include_hidden:
+        where_sql = f"({where_sql}) AND COALESCE(is_hidden, 0) = 0"
+    row = conn.execute(f"SELECT COUNT(*) FROM media_items WHERE {where_sql}", params).fetchone()
+    return int(row[0] if row else 0)
+
+
+def list_media_paths_in_scope(
+    conn: sqlite3.Connection,
+    selected_roots: list[str],
+) -> list[tuple[str, int]]:
+    """Return just (path, is_hidden) for items in scope, without the metadata joins."""
+    where_sql, params = build_scope_where(selected_roots)
+    rows = conn.execute(f"SELECT path, is_hidden FROM media_items WHERE {where_sql}", params).fetchall()
+    return [(str(r[0]), int(r[1] or 0)) for r in rows]
+
+
 def list_media_in_collection(
     conn: sqlite3.Connection,
     collection_id: int,
@@ -334,6 +426,7 @@ def update_media_dates(
     *,
     exif_date_taken: str | None = None,
     metadata_date: str | None = None,
+    commit: bool = True,
 ) -> None:
     conn.execute(
         """
@@ -343,7 +436,8 @@ def update_media_dates(
         """,
         (exif_date_taken, metadata_date, _utc_now_iso(), int(media_id)),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def list_media_page(
@@ -20,6 +20,8 @@ def upsert_media_metadata(
     ai_prompt: Optional[str] = None,
     ai_negative_prompt: Optional[str] = None,
     ai_params: Optional[str] = None,
+    *,
+    commit: bool = True,
 ) -> None:
     now = _utc_now_iso()
     conn.execute(
@@ -39,7 +41,8 @@ def upsert_media_metadata(
         """,
         (media_id, title, description, notes, embedded_tags, embedded_comments, ai_prompt, ai_negative_prompt, ai_params, now),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_media_metadata(conn: sqlite3.Connection, media_id: int) -> Optional[dict]:
@@ -9,7 +9,7 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-def get_or_create_tag(conn: sqlite3.Connection, name: str, category: str | None = None) -> int:
+def get_or_create_tag(conn: sqlite3.Connection, name: str, category: str | None = None, *, commit: bool = True) -> int:
     now = _utc_now_iso()
     conn.execute(
         """
@@ -22,14 +22,15 @@ def get_or_create_tag(conn: sqlite3.Connection, name: str, category: str | None
     row = conn.execute("SELECT id FROM tags WHERE name = ?", (name,)).fetchone()
     if not row:
         raise RuntimeError(f"failed to create or load tag: {name}")
-    conn.commit()
+    if commit:
+        conn.commit()
     return int(row[0])
 
 
-def attach_tags(conn: sqlite3.Connection, media_id: int, tag_names: Iterable[str]) -> None:
+def attach_tags(conn: sqlite3.Connection, media_id: int, tag_names: Iterable[str], *, commit: bool = True) -> None:
     now = _utc_now_iso()
     for tag_name in sorted({t.strip() for t in tag_names if t.strip()}):
-        tag_id = get_or_create_tag(conn, tag_name)
+        tag_id = get_or_create_tag(conn, tag_name, commit=False)
         conn.execute(
             """
             INSERT INTO media_tags(media_id, tag_id, created_at_utc)
@@ -38,7 +39,8 @@ def attach_tags(conn: sqlite3.Connection, media_id: int, tag_names: Iterable[str
             """,
             (media_id, tag_id, now),
         )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def list_media_tags(conn: sqlite3.Connection, media_id: int) -> List[str]:
@@ -55,11 +57,15 @@ def list_media_tags(conn: sqlite3.Connection, media_id: int) -> List[str]:
     return [r[0] for r in rows]
 
 
-def set_media_tags(conn: sqlite3.Connection, media_id: int, tag_names: Iterable[str]) -> None:
-    """Clear existing tags and set the new ones."""
+def set_media_tags(conn: sqlite3.Connection, media_id: int, tag_names: Iterable[str], *, commit: bool = True) -> None:
+    """Clear existing tags and set the new ones.
+
+    With commit=False the caller owns the transaction (see Bridge.save_media_bundle_async).
+    """
     conn.execute("DELETE FROM media_tags WHERE media_id = ?", (media_id,))
-    attach_tags(conn, media_id, tag_names)
-    conn.commit()
+    attach_tags(conn, media_id, tag_names, commit=False)
+    if commit:
+        conn.commit()
 
 
 def clear_all_media_tags(conn: sqlite3.Connection, media_id: int) -> None:
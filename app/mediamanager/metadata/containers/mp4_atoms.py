@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+
+MP4_SUFFIXES = frozenset({".mp4", ".m4v", ".mov"})
+
+# moov is normally a few hundred KB; anything far larger is not worth parsing here.
+_MAX_MOOV_BYTES = 16 * 1024 * 1024
+
+
+def _iter_boxes(data: bytes, start: int = 0, end: int | None = None):
+    """Yield (type, payload_start, payload_end) for the boxes in data[start:end]."""
+    end = len(data) if end is None else end
+    offset = start
+    while offset + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from(">Q", data, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header or offset + size > end:
+            return
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+def _child(data: bytes, start: int, end: int, box_type: bytes) -> tuple[int, int] | None:
+    for found, payload_start, payload_end in _iter_boxes(data, start, end):
+        if found == box_type:
+            return payload_start, payload_end
+    return None
+
+
+def _read_moov(path: Path) -> bytes | None:
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        offset = 0
+        while offset + 8 <= file_size:
+            f.seek(offset)
+            header = f.read(16)
+            if len(header) < 8:
+                return None
+            size, box_type = struct.unpack_from(">I4s", header)
+            header_len = 8
+            if size == 1:
+                if len(header) < 16:
+                    return None
+                size = struct.unpack_from(">Q", header, 8)[0]
+                header_len = 16
+            elif size == 0:
+                size = file_size - offset
+            if size < header_len:
+                return None
+            if box_type == b"moov":
+                if size > _MAX_MOOV_BYTES:
+                    return None
+                f.seek(offset + header_len)
+                payload = f.read(size - header_len)
+                return payload if len(payload) == size - header_len else None
+            offset += size
+    return None
+
+
+def read_mp4_video_size(path: Path) -> tuple[int, int] | None:
+    """Return the displayed (width, height) of the first video track of an MP4/MOV.
+
+    Reads the track header (tkhd) and the coded size from the sample description
+    (stsd) without spawning ffprobe. Returns None when the file can't be parsed
+    or when the two disagree (anamorphic/cropped tracks), so callers can fall back
+    to ffprobe for anything non-trivial. 90/270 degree rotations swap the result.
+    """
+    try:
+        moov = _read_moov(Path(path))
+    except OSError:
+        return None
+    if not moov:
+        return None
+
+    for box_type, trak_start, trak_end in _iter_boxes(moov):
+        if box_type != b"trak":
+            continue
+        mdia = _child(moov, trak_start, trak_end, b"mdia")
+        if mdia is None:
+            continue
+        hdlr = _child(moov, mdia[0], mdia[1], b"hdlr")
+        if hdlr is None or moov[hdlr[0] + 8 : hdlr[0] + 12] != b"vide":
+            continue
+
+        tkhd = _child(moov, trak_start, trak_end, b"tkhd")
+        if tkhd is None or tkhd[0] >= tkhd[1]:
+            return None
+        version = moov[tkhd[0]]
+        matrix_at = tkhd[0] + (52 if version == 1 else 40)
+        if matrix_at + 44 > tkhd[1]:
+            return None
+        a, b = struct.unpack_from(">ii", moov, matrix_at)
+        track_w, track_h = struct.unpack_from(">II", moov, matrix_at + 36)
+
+        minf = _child(moov, mdia[0], mdia[1], b"minf")
+        stbl = _child(moov, minf[0], minf[1], b"stbl") if minf else None
+        stsd = _child(moov, stbl[0], stbl[1], b"stsd") if stbl else None
+        if stsd is None or stsd[0] + 44 > stsd[1]:
+            return None
+        coded_w, coded_h = struct.unpack_from(">HH", moov, stsd[0] + 40)
+
+        # tkhd sizes are 16.16 fixed point; only trust them when they match the
+        # coded size, i.e. no pixel-aspect or clean-aperture adjustments.
+        if coded_w <= 0 or coded_h <= 0 or (track_w >> 16, track_h >> 16) != (coded_w, coded_h):
+            return None
+        if a == 0 and abs(b) == 0x10000:
+            return coded_h, coded_w
+        return coded_w, coded_h
+    return None
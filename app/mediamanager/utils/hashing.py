@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from pathlib import Path
 
 
@@ -19,3 +20,38 @@ def calculate_file_hash(path: str | Path, block_size: int = 65536) -> str:
         for block in iter(lambda: f.read(block_size), b""):
             hasher.update(block)
     return hasher.hexdigest()
+
+
+def fast_fingerprint(path: str | Path, sample_size: int = 65536) -> str:
+    """Calculate a cheap identity fingerprint for a file.
+
+    Combines the file size, modification time and a BLAKE2b digest of the first
+    and last ``sample_size`` bytes, so large media files are never read in full.
+    Renames and moves keep the fingerprint, which is all the scanner needs to
+    track items; use :func:`calculate_file_hash` when true content identity matters.
+
+    Args:
+        path: Path to the file.
+        sample_size: Number of bytes sampled from each end of the file.
+
+    Returns:
+        String of the form ``"<size>:<mtime_ns>:<sample digest>"`` (hex fields).
+    """
+    st = os.stat(path)
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        hasher.update(f.read(sample_size))
+        if st.st_size > sample_size * 2:
+            f.seek(-sample_size, os.SEEK_END)
+            hasher.update(f.read(sample_size))
+        elif st.st_size > sample_size:
+            hasher.update(f.read())
+    return f"{st.st_size:x}:{st.st_mtime_ns:x}:{hasher.hexdigest()}"
+
+
+def is_fast_fingerprint(content_hash: str | None) -> bool:
+    """Return True if content_hash came from :func:`fast_fingerprint`.
+
+    Rows stored before fingerprinting carry a bare SHA-256 hex digest instead.
+    """
+    return bool(content_hash) and ":" in content_hash
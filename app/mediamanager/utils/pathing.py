@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import PureWindowsPath
+from urllib.parse import quote
 
 
 def normalize_windows_path(path: str) -> str:
@@ -19,3 +20,19 @@ def is_under_root(candidate: str, root: str) -> bool:
     cand = normalize_windows_path(candidate)
     rt = normalize_windows_path(root).rstrip('/')
     return cand == rt or cand.startswith(rt + '/')
+
+
+def local_file_url(path: str) -> str:
+    """Build a file:// URL for a local path with plain string ops.
+
+    Equivalent to QUrl.fromLocalFile(path).toString() for loading purposes
+    (reserved characters such as '#', '?' and '%' are percent-encoded), but
+    cheap enough to call per gallery row.
+    """
+    posix = str(path).replace("\\", "/")
+    encoded = quote(posix, safe="/:")
+    if posix.startswith("//"):
+        return "file:" + encoded  # UNC: //server/share/...
+    if not posix.startswith("/"):
+        encoded = "/" + encoded  # drive letter: C:/...
+    return "file://" + encoded
@@ -9,6 +9,8 @@ except Exception:
 
 import sys
 import os
+import base64
+import collections
 import faulthandler
 import hashlib
 import subprocess
@@ -16,11 +18,20 @@ import shutil
 import random
 import threading
 import time
+import functools
+import operator
+import struct
+import queue
 import re
 import json
 import html
+import mimetypes
+import posixpath
 import shlex
+import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from packaging.version import Version
 from pathlib import Path
@@ -51,8 +62,10 @@ def _install_stderr_filter() -> None:
         os.dup2(write_fd, 2)            # All C-level stderr now goes to the pipe
         os.close(write_fd)
 
+        suppress_re = re.compile(b"|".join(map(re.escape, _SUPPRESS)))
+
         def _relay() -> None:
-            buf = b""
+            buf = bytearray()
             with (
                 os.fdopen(read_fd, "rb", buffering=0) as pipe_in,
                 os.fdopen(real_stderr_fd, "wb", buffering=0) as real_out,
@@ -61,17 +74,24 @@ def _install_stderr_filter() -> None:
                     chunk = pipe_in.read(4096)
                     if not chunk:
                         break
-                    buf += chunk
+                    buf.extend(chunk)
                     # Process complete lines; hold back any partial trailing line.
-                    while b"\n" in buf:
-                        line, buf = buf.split(b"\n", 1)
-                        if not any(s in line for s in _SUPPRESS):
-                            real_out.write(line + b"\n")
-                            real_out.flush()
+                    # Surviving lines are written in one unbuffered call per chunk.
+                    out = bytearray()
+                    start = 0
+                    idx = buf.find(b"\n")
+                    while idx != -1:
+                        line = buf[start:idx + 1]
+                        if not suppress_re.search(line):
+                            out.extend(line)
+                        start = idx + 1
+                        idx = buf.find(b"\n", start)
+                    del buf[:start]
+                    if out:
+                        real_out.write(out)
                 # Flush any remaining partial line.
-                if buf and not any(s in buf for s in _SUPPRESS):
+                if buf and not suppress_re.search(buf):
                     real_out.write(buf)
-                    real_out.flush()
 
         t = threading.Thread(target=_relay, daemon=True, name="stderr-filter")
         t.start()
@@ -99,6 +119,12 @@ from PySide6.QtCore import (
     QTimer,
     QMetaObject,
     QRect,
+    QFileSystemWatcher,
+    QSignalBlocker,
+    QBuffer,
+    QIODevice,
+    QAbstractItemModel,
+    QThreadPool,
 )
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PySide6.QtGui import (
@@ -134,7 +160,6 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QTreeView,
     QFileIconProvider,
-    QFileSystemModel,
     QDialog,
     QPushButton,
     QHBoxLayout,
@@ -153,7 +178,12 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtWebChannel import QWebChannel
 from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEnginePage
+from PySide6.QtWebEngineCore import (
+    QWebEnginePage,
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
 from native.mediamanagerx_app.video_overlay import LightboxVideoOverlay, VideoRequest
 from PySide6.QtCore import QSortFilterProxyModel, QModelIndex
 
@@ -177,12 +207,219 @@ if os.name == "nt":
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _shell_api():
+    """Bind the few shell32/ole32 entry points used to reveal files; None off Windows."""
+    if os.name != "nt":
+        return None
+    try:
+        shell32, ole32 = ctypes.windll.shell32, ctypes.windll.ole32
+        parse = shell32.SHParseDisplayName
+        parse.argtypes = [wintypes.LPCWSTR, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), wintypes.ULONG, ctypes.POINTER(wintypes.ULONG)]
+        parse.restype = ctypes.HRESULT
+        select = shell32.SHOpenFolderAndSelectItems
+        select.argtypes = [ctypes.c_void_p, wintypes.UINT, ctypes.c_void_p, wintypes.DWORD]
+        select.restype = ctypes.HRESULT
+        execute = shell32.ShellExecuteW
+        execute.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int]
+        execute.restype = ctypes.c_void_p
+        free = ole32.CoTaskMemFree
+        free.argtypes = [ctypes.c_void_p]
+        free.restype = None
+        co_init = ole32.CoInitialize
+        co_init.argtypes = [ctypes.c_void_p]
+        co_init.restype = ctypes.c_long
+        return parse, select, execute, free, co_init
+    except Exception:
+        return None
+
+
+_DWMWA_USE_IMMERSIVE_DARK_MODE = 20
+_DWMWA_USE_IMMERSIVE_DARK_MODE_OLD = 19  # pre-20H1 Windows 10 builds
+_DWMWA_CAPTION_COLOR = 35
+_DWMWA_TEXT_COLOR = 36
+_C_INT_SIZE = ctypes.sizeof(ctypes.c_int)
+
+
+@functools.lru_cache(maxsize=1)
+def _dwm_set_attribute():
+    """Bind dwmapi.DwmSetWindowAttribute once; None off Windows."""
+    if os.name != "nt":
+        return None
+    try:
+        fn = ctypes.windll.dwmapi.DwmSetWindowAttribute
+        fn.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+        fn.restype = ctypes.c_long
+        return fn
+    except Exception:
+        return None
+
+
+def _shell_reveal(path: str, is_dir: bool) -> bool:
+    """Open a folder, or select a file in its folder, without spawning a shell."""
+    api = _shell_api()
+    if api is None:
+        return False
+    parse, select, execute, free, co_init = api
+    try:
+        if is_dir:
+            return (execute(None, "open", path, None, None, 1) or 0) > 32  # SW_SHOWNORMAL
+        co_init(None)  # S_FALSE when COM is already up on this thread
+        pidl = ctypes.c_void_p()
+        parse(path, None, ctypes.byref(pidl), 0, None)
+        try:
+            select(pidl, 0, None, 0)
+        finally:
+            free(pidl)
+        return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _copy_file_ex():
+    """kernel32.CopyFileExW, bound once; None off Windows."""
+    if os.name != "nt":
+        return None
+    try:
+        fn = ctypes.windll.kernel32.CopyFileExW
+        fn.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD]
+        fn.restype = wintypes.BOOL
+        return fn
+    except Exception:
+        return None
+
+
+def _copy_file(src, dst) -> str:
+    """copy2-compatible file copy that lets Windows do the copy in-kernel when it can.
+
+    CopyFileExW carries data, attributes and timestamps and uses the OS's
+    large-buffer/offloaded copy paths; elsewhere shutil.copy2 already uses
+    sendfile/fcopyfile.
+    """
+    copy_ex = _copy_file_ex()
+    if copy_ex is not None:
+        target = os.path.join(dst, os.path.basename(src)) if os.path.isdir(dst) else dst
+        if copy_ex(str(src), str(target), None, None, None, 0):
+            return str(target)
+    return shutil.copy2(src, dst)
+
+# Even-dimension re-encodes are written to the temp dir with this prefix and
+# deleted again when the video overlay closes.
+_FIXED_VIDEO_PREFIX = "mmx_fixed_"
+_TMPDIR = Path(tempfile.gettempdir())
+_TMP_PREFIX = str(_TMPDIR / _FIXED_VIDEO_PREFIX)
+
+
 def _run_hidden_subprocess(cmd: list[str], **kwargs):
     if _WINDOWS_NO_CONSOLE_SUBPROCESS_KWARGS:
         kwargs = {**_WINDOWS_NO_CONSOLE_SUBPROCESS_KWARGS, **kwargs}
     return subprocess.run(cmd, **kwargs)
 
 
+# ffmpeg children of the pool workers; killed on exit so a running job can't
+# keep the process (and the interpreter's join of the pool threads) alive.
+_LIVE_PROCS: set[subprocess.Popen] = set()
+_LIVE_PROCS_LOCK = threading.Lock()
+_SHUTTING_DOWN = threading.Event()
+
+
+def _track_proc(proc: subprocess.Popen) -> None:
+    with _LIVE_PROCS_LOCK:
+        if _SHUTTING_DOWN.is_set():
+            proc.kill()
+        else:
+            _LIVE_PROCS.add(proc)
+
+
+def _untrack_proc(proc: subprocess.Popen) -> None:
+    with _LIVE_PROCS_LOCK:
+        _LIVE_PROCS.discard(proc)
+
+
+def _kill_live_procs() -> None:
+    """Kill every tracked ffmpeg and refuse to track (i.e. kill) any started later."""
+    with _LIVE_PROCS_LOCK:
+        _SHUTTING_DOWN.set()
+        procs = list(_LIVE_PROCS)
+        _LIVE_PROCS.clear()
+    for proc in procs:
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+
+def _run_ffmpeg(cmd: list[str], timeout: float | None = None) -> tuple[int, bytes]:
+    """Run ffmpeg with stdout discarded and only the last ~4 KiB of stderr kept.
+
+    stderr is drained on a thread into a bounded deque, so a chatty encoder can
+    never fill the pipe and stall, and nothing is decoded to text.
+    """
+    kwargs = {**_WINDOWS_NO_CONSOLE_SUBPROCESS_KWARGS}
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, bufsize=0, **kwargs)
+    _track_proc(proc)
+    tail: collections.deque[bytes] = collections.deque(maxlen=4)
+
+    def _drain() -> None:
+        for chunk in iter(lambda: proc.stderr.read(1024), b""):
+            tail.append(chunk)
+
+    drain = threading.Thread(target=_drain, daemon=True, name="ffmpeg-stderr")
+    drain.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        _untrack_proc(proc)
+        drain.join()
+        proc.stderr.close()
+    return proc.returncode, b"".join(tail)[-4096:]
+
+
+_TOOL_HITS: dict[tuple[str, str], str] = {}  # (name, PATH) -> resolved binary
+_TOOL_MISSES: dict[tuple[str, str], float] = {}  # (name, PATH) -> monotonic time of last miss
+_TOOL_MISS_TTL = 30.0
+
+
+def _which_tool(name: str, path_env: str) -> str | None:
+    """Resolve a bundled or PATH copy of ffmpeg/ffprobe.
+
+    Hits are cached per PATH value; a miss is only remembered for
+    ``_TOOL_MISS_TTL`` seconds so a tool installed while the app runs is found.
+    """
+    key = (name, path_env)
+    found = _TOOL_HITS.get(key)
+    if found:
+        return found
+    missed_at = _TOOL_MISSES.get(key)
+    if missed_at is not None and time.monotonic() - missed_at < _TOOL_MISS_TTL:
+        return None
+    found = _probe_tool(name, path_env)
+    if found:
+        _TOOL_HITS[key] = found
+        _TOOL_MISSES.pop(key, None)
+    else:
+        _TOOL_MISSES[key] = time.monotonic()
+    return found
+
+
+def _probe_tool(name: str, path_env: str) -> str | None:
+    exe = f"{name}.exe" if sys.platform == "win32" else name
+    bundle_dirs = []
+    if getattr(sys, "frozen", False):
+        bundle_dirs.append(Path(getattr(sys, "_MEIPASS", Path(sys.executable).parent)))
+        bundle_dirs.append(Path(sys.executable).parent)
+    for base in bundle_dirs:
+        for cand in (base / exe, base / "bin" / exe):
+            if cand.is_file():
+                return str(cand)
+    return shutil.which(name, path=path_env or None)
+
+
 _FAULT_HANDLER_STREAM = None
 
 
@@ -254,18 +491,35 @@ def _install_crash_reporting() -> None:
 
 _install_crash_reporting()
 
+# Resolved once; MainWindow.eventFilter compares against it for every window event.
+_MOUSE_BUTTON_PRESS = QEvent.Type.MouseButtonPress
+
 
 class Theme:
     """Centralized theme system with neutral surfaces and restrained accent usage."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_hex(color: str) -> tuple[int, int, int]:
+        """Parse a color string to an (r, g, b) tuple once per distinct value."""
+        c = QColor(color)
+        return c.red(), c.green(), c.blue()
+
     @staticmethod
     def mix(base_hex: str, accent_color: QColor | str, strength: float) -> str:
         """Mix a base hex color with an accent QColor (or hex string)."""
-        base = QColor(base_hex)
-        acc = QColor(accent_color) if isinstance(accent_color, str) else accent_color
-        r = int(base.red() + (acc.red() - base.red()) * strength)
-        g = int(base.green() + (acc.green() - base.green()) * strength)
-        b = int(base.blue() + (acc.blue() - base.blue()) * strength)
-        return QColor(r, g, b).name()
+        return Theme.mix_many([base_hex], accent_color, [strength])[0]
+
+    @staticmethod
+    def mix_many(bases: list[str], accent_color: QColor | str, strengths: list[float]) -> list[str]:
+        """Mix several base colors against one accent in a single pass."""
+        acc = Theme._parse_hex(accent_color if isinstance(accent_color, str) else accent_color.name())
+        out: list[str] = []
+        for base_hex, strength in zip(bases, strengths):
+            base = Theme._parse_hex(base_hex)
+            out.append("#%02x%02x%02x" % tuple(
+                min(255, max(0, int(c + (a - c) * strength))) for c, a in zip(base, acc)
+            ))
+        return out
 
     BASE_BG_DARK = "#1e1e1e"
     BASE_SIDEBAR_BG_DARK = "#252526"
@@ -276,13 +530,46 @@ class Theme:
     BASE_SIDEBAR_BG_LIGHT = "#fbfbfc"
     BASE_CONTROL_BG_LIGHT = "#ffffff"
     BASE_BORDER_LIGHT = "#d9dde3"
-    
+
+    # Theme mode is read on every color lookup; cache it until the setting changes.
+    _is_light_cached: bool | None = None
+    # Resolved palette per (accent, is_light); rebuilt lazily after invalidate().
+    _resolved: dict[tuple[str, bool], dict[str, str]] = {}
+
+    @staticmethod
+    def invalidate() -> None:
+        Theme._is_light_cached = None
+        Theme._resolved.clear()
+
+    @staticmethod
+    def resolve(accent_hex: str) -> dict[str, str]:
+        """Return every accent-derived color for the current theme mode, cached."""
+        key = (accent_hex, Theme.get_is_light())
+        palette = Theme._resolved.get(key)
+        if palette is None:
+            accent = QColor(accent_hex)
+            palette = {
+                "bg": Theme.get_bg(accent),
+                "sidebar_bg": Theme.get_sidebar_bg(accent),
+                "control_bg": Theme.get_control_bg(accent),
+                "border": Theme.get_border(accent),
+                "scrollbar_track": Theme.get_scrollbar_track(accent),
+                "scrollbar_thumb": Theme.get_scrollbar_thumb(accent),
+                "scrollbar_thumb_hover": Theme.get_scrollbar_thumb_hover(accent),
+                "splitter_idle": Theme.get_splitter_idle(accent),
+                "accent_soft": Theme.get_accent_soft(accent),
+            }
+            Theme._resolved[key] = palette
+        return palette
+
     @staticmethod
     def get_is_light() -> bool:
-        settings = QSettings("G1enB1and", "MediaManagerX")
-        val = settings.value("ui/theme_mode", "dark")
-        # Ensure we handle both string and potential type-wrapped values cleanly
-        return str(val).lower() == "light"
+        if Theme._is_light_cached is None:
+            settings = QSettings("G1enB1and", "MediaManagerX")
+            val = settings.value("ui/theme_mode", "dark")
+            # Ensure we handle both string and potential type-wrapped values cleanly
+            Theme._is_light_cached = str(val).lower() == "light"
+        return Theme._is_light_cached
 
     @staticmethod
     def get_bg(accent: QColor) -> str:
@@ -350,6 +637,148 @@ class Theme:
     ACCENT_DEFAULT = "#8ab4f8"
 
 
+@functools.lru_cache(maxsize=32)
+def _scrollbar_qss(accent_rgba: tuple[int, int, int, int], is_light: bool) -> str:
+    """Build the native scrollbar sheet once per (accent, theme mode)."""
+    accent = QColor(*accent_rgba)
+    track = Theme.get_scrollbar_track(accent)
+
+    # We use physical SVG files for maximum compatibility with Qt's QSS engine,
+    # which often fails to render SVG data URIs.
+    base_svg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web", "scrollbar_arrows").replace("\\", "/")
+    mode = "light" if is_light else "dark"
+
+    up_path = f"{base_svg_path}/{mode}_up.svg"
+    dn_path = f"{base_svg_path}/{mode}_down.svg"
+    lt_path = f"{base_svg_path}/{mode}_left.svg"
+    rt_path = f"{base_svg_path}/{mode}_right.svg"
+
+    thumb_bg = Theme.get_scrollbar_thumb(accent)
+    thumb_hover_bg = Theme.get_scrollbar_thumb_hover(accent)
+
+    return f"""
+        QScrollBar:vertical {{
+            background: {track};
+            width: 12px;
+            margin: 12px 0 12px 0;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {thumb_bg};
+            min-height: 20px;
+            border-radius: 10px;
+            border: 2px solid {track};
+        }}
+        QScrollBar::handle:vertical:hover, QScrollBar::handle:vertical:pressed {{
+            background: {thumb_hover_bg};
+        }}
+        QScrollBar::add-line:vertical {{
+            background: {track};
+            height: 12px;
+            subcontrol-position: bottom;
+            subcontrol-origin: margin;
+        }}
+        QScrollBar::sub-line:vertical {{
+            background: {track};
+            height: 12px;
+            subcontrol-position: top;
+            subcontrol-origin: margin;
+        }}
+        QScrollBar::up-arrow:vertical {{
+            image: url("{up_path}");
+            width: 8px;
+            height: 8px;
+        }}
+        QScrollBar::down-arrow:vertical {{
+            image: url("{dn_path}");
+            width: 8px;
+            height: 8px;
+        }}
+        
+        QScrollBar:horizontal {{
+            background: {track};
+            height: 12px;
+            margin: 0 12px 0 12px;
+        }}
+        QScrollBar::handle:horizontal {{
+            background: {thumb_bg};
+            min-width: 20px;
+            border-radius: 10px;
+            border: 2px solid {track};
+        }}
+        QScrollBar::handle:horizontal:hover, QScrollBar::handle:horizontal:pressed {{
+            background: {thumb_hover_bg};
+        }}
+        QScrollBar::add-line:horizontal {{
+            background: {track};
+            width: 12px;
+            subcontrol-position: right;
+            subcontrol-origin: margin;
+        }}
+        QScrollBar::sub-line:horizontal {{
+            background: {track};
+            width: 12px;
+            subcontrol-position: left;
+            subcontrol-origin: margin;
+        }}
+        QScrollBar::left-arrow:horizontal {{
+            image: url("{lt_path}");
+            width: 8px;
+            height: 8px;
+        }}
+        QScrollBar::right-arrow:horizontal {{
+            image: url("{rt_path}");
+            width: 8px;
+            height: 8px;
+        }}
+        QScrollBar::add-page, QScrollBar::sub-page {{
+            background: none;
+        }}
+    """
+
+
+@functools.lru_cache(maxsize=32)
+def _menu_qss(sb_bg: str, text: str, border: str, highlight_bg: str) -> str:
+    """QMenu sheet shared by the menu bar drop-downs and context menus."""
+    return f"""
+        QMenu {{
+            background-color: {sb_bg};
+            color: {text};
+            border: 1px solid {border};
+            padding: 4px 0;
+        }}
+        QMenu::item {{
+            padding: 4px 24px 4px 14px;
+        }}
+        QMenu::item:selected {{
+            background-color: {highlight_bg};
+        }}
+        QMenu::separator {{
+            height: 1px;
+            background: {border};
+            margin: 4px 0;
+        }}
+    """
+
+
+@functools.lru_cache(maxsize=32)
+def _menubar_qss(sb_bg: str, text: str, border: str, highlight_bg: str) -> str:
+    return f"""
+        QMenuBar {{
+            background-color: {sb_bg};
+            color: {text};
+            border-bottom: 1px solid {border};
+        }}
+        QMenuBar::item {{
+            background: transparent;
+            padding: 4px 10px;
+        }}
+        QMenuBar::item:selected {{
+            background: {highlight_bg};
+        }}
+        {_menu_qss(sb_bg, text, border, highlight_bg)}
+    """
+
+
 class FileConflictDialog(QDialog):
     def __init__(self, existing_path: Path, incoming_path: Path, bridge, parent=None):
         super().__init__(parent)
@@ -621,20 +1050,27 @@ class CustomSplitterHandle(QSplitterHandle):
         super().__init__(orientation, parent)
         self.setMouseTracking(True)
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._track: QColor | None = None
+        self._idle_pen: QPen | None = None
+        self._hover_pen: QPen | None = None
+
+    def set_accent(self, accent_str: str) -> None:
+        """Resolve paint colors once per accent/theme change instead of per repaint."""
+        palette = Theme.resolve(accent_str)
+        self._track = QColor(palette["bg"])
+        self._idle_pen = QPen(QColor(palette["splitter_idle"]))
+        self._idle_pen.setWidth(1)
+        self._hover_pen = QPen(QColor(accent_str))
+        self._hover_pen.setWidth(2)
+        self.update()
 
     def paintEvent(self, event) -> None:
+        if self._track is None:
+            self.set_accent(str(self.parent().window().bridge._cached("ui/accent_color", "#8ab4f8", str) or "#8ab4f8"))
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
-        accent_str = str(self.parent().window().bridge.settings.value("ui/accent_color", "#8ab4f8"))
-        accent = QColor(accent_str)
-        track = QColor(Theme.get_bg(accent))
-        idle = QColor(Theme.get_splitter_idle(accent))
-        color = accent if self.underMouse() else idle
-
-        painter.fillRect(self.rect(), track)
-        pen = QPen(color)
-        pen.setWidth(2 if self.underMouse() else 1)
-        painter.setPen(pen)
+        painter.fillRect(self.rect(), self._track)
+        painter.setPen(self._hover_pen if self.underMouse() else self._idle_pen)
         mid_x = self.rect().center().x()
         mid_y = self.rect().center().y()
         if self.orientation() == Qt.Orientation.Horizontal:
@@ -760,12 +1196,12 @@ class FolderTreeView(QTreeView):
             if isinstance(model, QSortFilterProxyModel):
                 source_idx = model.mapToSource(idx)
                 fs_model = model.sourceModel()
-                if isinstance(fs_model, QFileSystemModel):
+                if isinstance(fs_model, LazyFsModel):
                     if fs_model.isDir(source_idx):
                         target_path = fs_model.filePath(source_idx)
                     else:
                         target_path = fs_model.filePath(source_idx.parent())
-            elif isinstance(model, QFileSystemModel):
+            elif isinstance(model, LazyFsModel):
                 if model.isDir(idx):
                     target_path = model.filePath(idx)
                 else:
@@ -881,21 +1317,395 @@ class CollectionListWidget(QListWidget):
         event.ignore()
 
 
+_FOLDER_ICON: QIcon | None = None
+_DRIVE_ICON: QIcon | None = None
+_WEBP_HEADER = struct.Struct("<4s4x4s4s4xB")
+
+
+def _folder_icon() -> QIcon:
+    """Return the standard folder icon, shared by every tree proxy."""
+    global _FOLDER_ICON
+    if _FOLDER_ICON is None:
+        _FOLDER_ICON = QFileIconProvider().icon(QFileIconProvider.IconType.Folder)
+    return _FOLDER_ICON
+
+
+def _drive_icon() -> QIcon:
+    global _DRIVE_ICON
+    if _DRIVE_ICON is None:
+        _DRIVE_ICON = QFileIconProvider().icon(QFileIconProvider.IconType.Drive)
+    return _DRIVE_ICON
+
+
+_FILE_ATTRIBUTE_HIDDEN = 0x2
+
+
+def _list_subdirs(path: str) -> list[str]:
+    """Names of the visible subdirectories of path, sorted case-insensitively."""
+    names: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if not entry.is_dir():
+                        continue
+                    if os.name == "nt":
+                        # Free on Windows: the attributes come from the directory listing.
+                        if entry.stat().st_file_attributes & _FILE_ATTRIBUTE_HIDDEN:
+                            continue
+                    elif entry.name.startswith("."):
+                        continue
+                except OSError:
+                    continue
+                names.append(entry.name)
+    except OSError:
+        return []
+    names.sort(key=str.casefold)
+    return names
+
+
+def _dir_mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _drive_roots() -> list[str]:
+    if os.name != "nt":
+        return ["/"]
+    try:
+        drives = os.listdrives()
+    except AttributeError:
+        drives = [f"{c}:\\" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if os.path.exists(f"{c}:\\")]
+    return [d.replace("\\", "/") for d in drives]
+
+
+@dataclass(eq=False)
+class _FsNode:
+    name: str
+    path: str
+    is_dir: bool = True
+    parent: "_FsNode | None" = None
+    row: int = 0
+    children: list["_FsNode"] = field(default_factory=list)
+    children_loaded: bool = False
+    loading: bool = False
+    mtime_ns: int = 0  # directory mtime when the children were last listed
+
+
+class LazyFsModel(QAbstractItemModel):
+    """Folder-only file system model that lists a directory when it is expanded.
+
+    Stands in for QFileSystemModel in the folder tree: no background watcher
+    walking loaded directories and no per-directory stat storm, just one
+    os.scandir of the immediate children on fetchMore(), run on the global
+    QThreadPool. Paths use forward slashes like QFileSystemModel, and the
+    subset of its API the tree relies on (filePath, isDir, index(path),
+    setRootPath, directoryLoaded) is kept so callers don't change. Instead of
+    watching, revalidate() re-lists an already listed folder on expand when
+    its mtime has moved.
+    """
+
+    directoryLoaded = Signal(str)
+    # node, subdirectory names (None = unchanged), directory mtime (from a worker thread)
+    _scanned = Signal(object, object, object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._root = _FsNode("", "", children_loaded=True)
+        for row, drive in enumerate(_drive_roots()):
+            name = drive.rstrip("/") or drive
+            self._root.children.append(_FsNode(name, drive, parent=self._root, row=row))
+        self._scanned.connect(self._on_scanned)
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.casefold() if os.name == "nt" else name
+
+    def _node(self, index: QModelIndex) -> _FsNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _index_of(self, node: _FsNode) -> QModelIndex:
+        if node is self._root or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _attached(self, node: _FsNode) -> bool:
+        while node is not self._root:
+            if node.parent is None:
+                return False
+            node = node.parent
+        return True
+
+    # --- QAbstractItemModel ---
+
+    def index(self, row, column: int = 0, parent: QModelIndex | None = None) -> QModelIndex:
+        if isinstance(row, str):
+            node = self._node_for_path(row)
+            return self._index_of(node) if node is not None else QModelIndex()
+        node = self._node(parent) if parent is not None else self._root
+        if column != 0 or row < 0 or row >= len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index: QModelIndex | None = None):
+        if index is None:
+            return QObject.parent(self)
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        # Unlisted directories are assumed to have children; expanding settles it.
+        return bool(node.children) if node.children_loaded else node.is_dir
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        return node.is_dir and not node.children_loaded and not node.loading
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        if node.children_loaded or node.loading:
+            return
+        node.loading = True
+
+        def scan() -> None:
+            mtime = _dir_mtime_ns(node.path)
+            names = _list_subdirs(node.path)
+            try:
+                self._scanned.emit(node, names, mtime)
+            except RuntimeError:
+                pass  # model already destroyed
+
+        QThreadPool.globalInstance().start(scan)
+
+    def revalidate(self, index: QModelIndex) -> None:
+        """Re-list an already listed folder (on a worker) if it changed on disk since."""
+        node = self._node(index)
+        if not node.is_dir or not node.children_loaded or node.loading:
+            return
+        node.loading = True
+        known = node.mtime_ns
+
+        def check() -> None:
+            mtime = _dir_mtime_ns(node.path)
+            names = _list_subdirs(node.path) if mtime != known else None
+            try:
+                self._scanned.emit(node, names, mtime)
+            except RuntimeError:
+                pass  # model already destroyed
+
+        QThreadPool.globalInstance().start(check)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return node.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return _drive_icon() if node.parent is self._root else _folder_icon()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.path
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+            | Qt.ItemFlag.ItemIsDropEnabled
+        )
+
+    def mimeTypes(self) -> list[str]:
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes) -> QMimeData:
+        mime = QMimeData()
+        paths = list(dict.fromkeys(self.filePath(i) for i in indexes if i.isValid()))
+        mime.setUrls([QUrl.fromLocalFile(p) for p in paths if p])
+        return mime
+
+    def supportedDragActions(self) -> Qt.DropAction:
+        return Qt.DropAction.CopyAction | Qt.DropAction.MoveAction
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.CopyAction | Qt.DropAction.MoveAction
+
+    # --- QFileSystemModel-compatible helpers ---
+
+    def filePath(self, index: QModelIndex) -> str:
+        return index.internalPointer().path if index.isValid() else ""
+
+    def isDir(self, index: QModelIndex) -> bool:
+        return index.isValid() and index.internalPointer().is_dir
+
+    def setRootPath(self, path: str) -> QModelIndex:
+        """Make sure path is listed down to its own node and return its index."""
+        return self.index(str(path))
+
+    def refresh(self, path: str) -> None:
+        """Re-list path if it has been listed before; unlisted folders load fresh on expand."""
+        node = self._node_for_path(path, load=False)
+        if node is not None and node.children_loaded:
+            self._relist(node)
+
+    def refresh_loaded(self) -> None:
+        """Re-list every folder that has been expanded (e.g. after a move)."""
+        stack = list(self._root.children)
+        while stack:
+            node = stack.pop()
+            if node.children_loaded:
+                self._relist(node)
+                stack.extend(node.children)
+
+    # --- internals ---
+
+    def _on_scanned(self, node: _FsNode, names: list | None, mtime: int) -> None:
+        node.loading = False
+        if names is None or not self._attached(node):
+            return
+        first = not node.children_loaded
+        node.mtime_ns = mtime
+        self._apply_listing(node, names)
+        if first:
+            self.directoryLoaded.emit(node.path)
+
+    def _relist(self, node: _FsNode) -> None:
+        node.mtime_ns = _dir_mtime_ns(node.path)
+        self._apply_listing(node, _list_subdirs(node.path))
+
+    def _child_path(self, node: _FsNode, name: str) -> str:
+        return node.path + name if node.path.endswith("/") else f"{node.path}/{name}"
+
+    def _renumber(self, node: _FsNode, start: int = 0) -> None:
+        for row in range(start, len(node.children)):
+            node.children[row].row = row
+
+    def _apply_listing(self, node: _FsNode, names: list[str]) -> None:
+        parent_idx = self._index_of(node)
+        if not node.children_loaded:
+            node.children_loaded = True
+            if not names:
+                # Drop the speculative expand arrow.
+                if parent_idx.isValid():
+                    self.dataChanged.emit(parent_idx, parent_idx)
+                return
+            self.beginInsertRows(parent_idx, 0, len(names) - 1)
+            node.children = [
+                _FsNode(name, self._child_path(node, name), parent=node, row=row)
+                for row, name in enumerate(names)
+            ]
+            self.endInsertRows()
+            return
+
+        key = self._key
+        wanted = {key(n) for n in names}
+        for row in reversed(range(len(node.children))):
+            if key(node.children[row].name) not in wanted:
+                self.beginRemoveRows(parent_idx, row, row)
+                node.children.pop(row).parent = None
+                self._renumber(node, row)
+                self.endRemoveRows()
+        have = {key(c.name) for c in node.children}
+        for name in names:
+            k = key(name)
+            if k in have:
+                continue
+            folded = name.casefold()
+            row = next((i for i, c in enumerate(node.children) if c.name.casefold() > folded), len(node.children))
+            self.beginInsertRows(parent_idx, row, row)
+            node.children.insert(row, _FsNode(name, self._child_path(node, name), parent=node, row=row))
+            self._renumber(node, row)
+            self.endInsertRows()
+            have.add(k)
+        if not node.children and parent_idx.isValid():
+            self.dataChanged.emit(parent_idx, parent_idx)
+
+    def _top_node(self, drive: str, load: bool) -> _FsNode | None:
+        key = self._key(drive)
+        for node in self._root.children:
+            if self._key(node.path) == key:
+                return node
+        if not load or not os.path.isdir(drive):
+            return None
+        # e.g. a UNC share or a drive mounted after start-up
+        row = len(self._root.children)
+        self.beginInsertRows(QModelIndex(), row, row)
+        node = _FsNode(drive.rstrip("/") or drive, drive, parent=self._root, row=row)
+        self._root.children.append(node)
+        self.endInsertRows()
+        return node
+
+    def _node_for_path(self, path: str, load: bool = True) -> _FsNode | None:
+        """Walk to path's node, listing (synchronously) only the folders on the way."""
+        if not path:
+            return None
+        full = os.path.abspath(str(path)).replace("\\", "/")
+        drive, rest = os.path.splitdrive(full)
+        node = self._top_node((drive + "/") if drive else "/", load)
+        for part in (p for p in rest.split("/") if p):
+            if node is None:
+                return None
+            if not node.children_loaded:
+                if not load:
+                    return None
+                self._relist(node)
+            key = self._key(part)
+            child = next((c for c in node.children if self._key(c.name) == key), None)
+            if child is None and load and os.path.isdir(self._child_path(node, part)):
+                # Created since this folder was listed.
+                self._relist(node)
+                child = next((c for c in node.children if self._key(c.name) == key), None)
+            node = child
+        return node
+
+
 class RootFilterProxyModel(QSortFilterProxyModel):
-    """Filters a QFileSystemModel to only show a specific root folder and its children.
+    """Filters a LazyFsModel to only show a specific root folder and its children.
     
     Siblings of the root folder are hidden.
     """
+    _ACCEPT_CACHE_MAX = 8192
+
     def __init__(self, bridge: Bridge, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self.bridge = bridge
         self._root_path = ""
-        self._fallback_icon: QIcon | None = None
+        self._root_norm = ""
+        self._root_prefix = ""
+        # Accept/reject decisions keyed by normalized path. Keyed by path rather
+        # than (parent, row) so inserts/removals can't shift entries onto the wrong row.
+        self._accept_cache: dict[str, bool] = {}
 
     def setRootPath(self, path: str) -> None:
+        from app.mediamanager.utils.pathing import normalize_windows_path
         self._root_path = str(Path(path).absolute()).replace("\\", "/").lower()
+        # Normalized once here so filterAcceptsRow only does plain string compares.
+        self._root_norm = normalize_windows_path(self._root_path).rstrip("/")
+        self._root_prefix = self._root_norm + "/"
         self.invalidateFilter()
 
+    def invalidateFilter(self) -> None:
+        # Hidden state or the root changed; every cached decision is suspect.
+        self._accept_cache.clear()
+        super().invalidateFilter()
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         if not self._root_path:
             return True
@@ -904,17 +1714,27 @@ class RootFilterProxyModel(QSortFilterProxyModel):
         source_index = fs_model.index(source_row, 0, source_parent)
         raw_path = fs_model.filePath(source_index)
         
-        # Consistent normalization for all path checks
-        from app.mediamanager.utils.pathing import normalize_windows_path
-        normalized_path = normalize_windows_path(raw_path)
-        
+        # LazyFsModel paths are already clean, so slash/case folding matches
+        # normalize_windows_path without building a PureWindowsPath per row.
+        normalized_path = raw_path.replace("\\", "/").casefold()
+        cached = self._accept_cache.get(normalized_path)
+        if cached is not None:
+            return cached
+        accepted = self._accepts_path(raw_path, normalized_path)
+        if len(self._accept_cache) >= self._ACCEPT_CACHE_MAX:
+            # Browsing many large trees in one session; start over rather than grow.
+            self._accept_cache.clear()
+        self._accept_cache[normalized_path] = accepted
+        return accepted
+
+    def _accepts_path(self, raw_path: str, normalized_path: str) -> bool:
         # Hidden logic: if show_hidden is False, skip database-marked hidden paths
         # This check must come before the root path inclusion logic.
         if not self.bridge._show_hidden_enabled():
             if self.bridge.repo.is_path_hidden(raw_path):
                 return False
 
-        root = normalize_windows_path(self._root_path).rstrip("/")
+        root = self._root_norm
         norm_path = normalized_path.rstrip("/")
 
         # Show the root path itself
@@ -922,11 +1742,11 @@ class RootFilterProxyModel(QSortFilterProxyModel):
             return True
             
         # Show children/descendants of the root path
-        if normalized_path.startswith(root + "/"):
+        if normalized_path.startswith(self._root_prefix):
             return True
             
         # Show ancestors of the root path (so we can reach it from the top)
-        if (root + "/").startswith(norm_path + "/"):
+        if self._root_prefix.startswith(norm_path + "/"):
             return True
             
         # Special case: show Windows drives if they are ancestors
@@ -935,20 +1755,6 @@ class RootFilterProxyModel(QSortFilterProxyModel):
 
         return False
 
-    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        # Prevent "customized" folder icons (which sometimes fail to load or are empty)
-        # by forcing the standard folder icon for all directories.
-        if role == Qt.ItemDataRole.DecorationRole:
-            source_idx = self.mapToSource(index)
-            source_model = self.sourceModel()
-            if isinstance(source_model, QFileSystemModel) and source_model.isDir(source_idx):
-                if not self._fallback_icon:
-                    provider = QFileIconProvider()
-                    self._fallback_icon = provider.icon(QFileIconProvider.IconType.Folder)
-                return self._fallback_icon
-                
-        return super().data(index, role)
-
 
 class Bridge(QObject):
     selectedFolderChanged = Signal(str)
@@ -975,6 +1781,7 @@ class Bridge(QObject):
     accentColorChanged = Signal(str)
     # Async file ops (so WebEngine UI doesn't freeze during rename)
     fileOpFinished = Signal(str, bool, str, str)  # op, ok, old_path, new_path
+    mediaBundleSaved = Signal(str, str, bool)  # old_path, new_path, ok
 
     # Media scanning signals
     scanStarted = Signal(str)
@@ -985,6 +1792,9 @@ class Bridge(QObject):
     childFoldersListed = Signal(str, list)  # request_id, folders
     mediaCounted = Signal(str, int)  # request_id, count
     mediaListed = Signal(str, list)  # request_id, items
+    videoPosterReady = Signal(str, str)  # video_path, poster_url (empty = failed)
+    toolsStatusChanged = Signal()  # an ffmpeg/ffprobe path was (re)resolved
+    _watchDirsRequested = Signal(list)  # directories backing the disk cache (worker -> GUI thread)
     
     # Update Signals
     updateAvailable = Signal(str, bool)  # version, manual
@@ -998,15 +1808,31 @@ class Bridge(QObject):
     hideTooltipRequested = Signal()
     conflictDialogRequested = Signal(str, str)
     nativeDragFinished = Signal()
+    # Re-mark a card as selected after a splitter drag re-lays out the grid.
+    currentPathChanged = Signal(str)
+    # Name of a no-argument window.* function for the gallery to call.
+    webCommand = Signal(str)
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         print("Bridge: Initializing...")
         self._selected_folders: list[str] = []
+        # Mirrors the gallery's context menu visibility so native clicks only
+        # ask the page to hide it when it is actually open.
+        self.web_menu_open = False
         self._active_collection_id: int | None = None
         self._active_collection_name: str = ""
-        self._scan_abort = False
+        # Folder scans run one at a time on a persistent worker; each request
+        # carries its own cancel Event, which the next request sets.
+        self._scan_queue: queue.Queue = queue.Queue()
+        self._scan_cancel: threading.Event | None = None
+        self._scan_thread: threading.Thread | None = None
         self._scan_lock = threading.Lock()
+        # Connection for read_media_metadata on worker threads; opened on first use.
+        self._meta_conn = None
+        self._meta_conn_lock = threading.Lock()
+        # Set by shutdown_pools; long pool jobs check it between steps.
+        self._closing = threading.Event()
         self.drag_paths: list[str] = []
         self.drag_target_folder: str = ""
         self._last_dlg_res = None
@@ -1069,6 +1895,14 @@ class Bridge(QObject):
             print(f"Migration Error: {e}")
 
         self.settings = QSettings("G1enB1and", "MediaManagerX")
+        # In-memory mirror of settings read on hot paths (avoids registry reads).
+        self._settings_cache: dict[str, object] = {}
+        self._settings_lock = threading.Lock()
+        # Persisting to disk/registry is debounced so bursts of writes cost one sync.
+        self._settings_sync_timer = QTimer(self)
+        self._settings_sync_timer.setSingleShot(True)
+        self._settings_sync_timer.setInterval(250)
+        self._settings_sync_timer.timeout.connect(self._flush_settings)
         self.nam = QNetworkAccessManager(self)
         self.nam.setRedirectPolicy(QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
         self._update_reply = None
@@ -1076,9 +1910,38 @@ class Bridge(QObject):
         self._session_shuffle_seed = random.getrandbits(32)
         
         # Hybrid Fast-Load Cache
-        self._disk_cache: dict[str, Path] = {}
-        self._disk_cache_key: str = "" # Hash of selected folders list
-        self._last_full_scan_key: str = ""
+        self._disk_cache: dict[str, str] = {}  # normalized path -> on-disk path
+        self._disk_cache_key: tuple[str, ...] | str = ""  # sorted folders; "" = nothing cached
+        # (folders, filter, query, show_hidden) -> (monotonic time, candidates); lets
+        # count_media and list_media share one DB reconciliation per user action.
+        self._reconcile_cache: dict[tuple, tuple[float, list[dict]]] = {}
+        # Bumped by every invalidation and DB write; a reconciliation that started
+        # under an older generation is returned but not cached.
+        self._reconcile_generation = 0
+        # Serializes walks/reconciliations so a count and a list arriving together
+        # do the work once; the second caller is served from the caches above.
+        self._reconcile_lock = threading.RLock()
+        self._io_pool = None  # ThreadPoolExecutor for list/count requests from the gallery
+        # Bounded pool for file ops, previews and other one-off work; workers are
+        # only spawned on first use. Called from worker threads too, so built eagerly.
+        self._bg_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mmx-bg")
+        # Direct so the cache is dropped in the emitting thread, before the gallery
+        # reacts to the signal and asks for a fresh listing.
+        self.fileOpFinished.connect(self._invalidate_listing_caches, Qt.ConnectionType.DirectConnection)
+        # Watch the walked folders so external adds/deletes drop the disk cache;
+        # otherwise it is only refreshed by our own file ops or a folder switch.
+        self._dir_watcher = QFileSystemWatcher(self)
+        self._dir_change_timer = QTimer(self)
+        self._dir_change_timer.setSingleShot(True)
+        self._dir_change_timer.setInterval(300)
+        self._dir_change_timer.timeout.connect(self._invalidate_listing_caches)
+        self._dir_watcher.directoryChanged.connect(self._on_watched_dir_changed)
+        self._watchDirsRequested.connect(self._set_watched_dirs)
+        self._poster_pool = None  # ThreadPoolExecutor for batched poster generation
+        self._anim_cache: dict[str, tuple[int, bool]] = {}  # path -> (mtime_ns, animated)
+        self._probe_cache: dict[tuple[str, str], tuple[tuple[int, int], object]] = {}  # (kind, path) -> ((mtime_ns, size), result)
+        self._tool_paths: dict[str, str] = {}  # "ffmpeg"/"ffprobe" -> resolved binary
+        self._last_full_scan_key: tuple[str, ...] | str = ""
 
         # Connect blocking signal for cross-thread dialogs
         self.conflictDialogRequested.connect(self._invoke_conflict_dialog, Qt.BlockingQueuedConnection)
@@ -1092,23 +1955,50 @@ class Bridge(QObject):
         print(f"JS Debug: {msg}")
 
     def _thumb_key(self, path: Path) -> str:
+        s = str(path).replace("\\", "/").lower().encode("utf-8")
+        return hashlib.blake2b(s, digest_size=16).hexdigest()
+
+    def _legacy_thumb_key(self, path: Path) -> str:
+        # Posters generated before the switch to blake2b were keyed by SHA-1.
         s = str(path).replace("\\", "/").lower().encode("utf-8")
         return hashlib.sha1(s).hexdigest()
 
     def _video_poster_path(self, video_path: Path) -> Path:
         return self._thumb_dir / f"{self._thumb_key(video_path)}.jpg"
 
+    def _legacy_video_poster_path(self, video_path: Path) -> Path:
+        return self._thumb_dir / f"{self._legacy_thumb_key(video_path)}.jpg"
+
+    def _tool_bin(self, name: str) -> str | None:
+        # Found binaries are pinned on the instance; a miss falls through to
+        # _which_tool, which re-probes PATH once its short miss TTL has expired,
+        # so installing ffmpeg while the app runs is noticed within ~30s.
+        found = self._tool_paths.get(name)
+        if found is None:
+            found = _which_tool(name, os.environ.get("PATH", ""))
+            if found:
+                self._tool_paths[name] = found
+                self.toolsStatusChanged.emit()
+        return found
+
     def _ffmpeg_bin(self) -> str | None:
-        return shutil.which("ffmpeg")
+        return self._tool_bin("ffmpeg")
 
     def _ffprobe_bin(self) -> str | None:
-        return shutil.which("ffprobe")
+        return self._tool_bin("ffprobe")
 
     def _ensure_video_poster(self, video_path: Path) -> Path | None:
         """Generate a poster jpg for a video or image using ffmpeg (if missing)."""
         out = self._video_poster_path(video_path)
         if out.exists():
             return out
+        legacy = self._legacy_video_poster_path(video_path)
+        if legacy.exists():
+            try:
+                os.replace(legacy, out)
+                return out
+            except Exception:
+                return legacy
         ffmpeg = self._ffmpeg_bin()
         if not ffmpeg:
             return None
@@ -1119,30 +2009,52 @@ class Bridge(QObject):
             # For images, don't use -ss as it can fail for 0-duration files
             vf = "thumbnail,scale=min(640\\,iw):-2" if is_vid else "scale=min(640\\,iw):-2"
             
-            cmd = [ffmpeg, "-y", "-hide_banner", "-loglevel", "error"]
+            # Keep container probing short and skip audio/subtitle/data streams:
+            # only a single video frame is needed.
+            # -threads before -i is a decoder option; after it, it would only
+            # apply to the (trivial) JPEG encoder.
+            cmd = [ffmpeg, "-y", "-hide_banner", "-loglevel", "error", "-analyzeduration", "1M", "-probesize", "1M", "-threads", "1"]
             if is_vid:
                 cmd += ["-ss", "0.5"]
-            cmd += ["-i", str(video_path), "-frames:v", "1", "-vf", vf, "-q:v", "4", str(out)]
+            # Written under a temp name: ffmpeg may be killed on exit mid-write.
+            tmp = out.with_name(f"{out.stem}.part{out.suffix}")
+            cmd += ["-i", str(video_path), "-an", "-sn", "-dn", "-frames:v", "1", "-vf", vf, "-q:v", "4", str(tmp)]
             
-            r = _run_hidden_subprocess(cmd, capture_output=True, text=True)
-            if r.returncode != 0:
-                return None
-            return out if out.exists() else None
+            try:
+                returncode, _ = _run_ffmpeg(cmd)
+                if returncode != 0 or not tmp.is_file():
+                    return None
+                os.replace(tmp, out)
+            finally:
+                tmp.unlink(missing_ok=True)
+            return out
         except Exception as e:
             return None
         
-    def _is_animated(self, path: Path) -> bool:
+    def _is_animated(self, path: Path | str) -> bool:
         """Check if image is animated (GIF or animated WebP)."""
-        suffix = path.suffix.lower()
+        suffix = self._lower_suffix(str(path))
         if suffix == ".gif":
             return True
         if suffix == ".webp":
             try:
-                with open(path, "rb") as f:
-                    header = f.read(32)
-                if header[0:4] == b"RIFF" and header[8:12] == b"WEBP" and header[12:16] == b"VP8X":
-                    flags = header[20]
-                    return bool(flags & 2)
+                key = str(path)
+                mtime = os.stat(key).st_mtime_ns
+                cached = self._anim_cache.get(key)
+                if cached is not None and cached[0] == mtime:
+                    return cached[1]
+                header = bytearray(21)
+                with open(key, "rb") as f:
+                    n = f.readinto(header)
+                animated = False
+                if n == 21:
+                    # RIFF <size> WEBP VP8X <chunk size> <flags>; bit 1 of flags = animation
+                    riff, webp, vp8x, flags = _WEBP_HEADER.unpack_from(header)
+                    animated = riff == b"RIFF" and webp == b"WEBP" and vp8x == b"VP8X" and bool(flags & 2)
+                if len(self._anim_cache) > 8192:
+                    self._anim_cache.clear()
+                self._anim_cache[key] = (mtime, animated)
+                return animated
             except Exception:
                 pass
         return False
@@ -1157,9 +2069,8 @@ class Bridge(QObject):
             self._active_collection_name = ""
         try:
             # Persistent settings
-            settings = QSettings("G1enB1and", "MediaManagerX")
             primary = folders[0] if folders else ""
-            settings.setValue("gallery/last_folder", primary)
+            self._store_setting("gallery/last_folder", primary)
         except Exception:
             pass
         self.selectionChanged.emit(self._selected_folders)
@@ -1215,20 +2126,23 @@ class Bridge(QObject):
 
     def _list_child_folders_impl(self, folder_path: str) -> list:
         try:
-            root = Path(str(folder_path or ""))
-            if not root.exists() or not root.is_dir():
+            # Path() once for the root keeps the emitted child paths in the same
+            # form as before; the children themselves come straight from scandir.
+            root = str(Path(str(folder_path or "")))
+            if not os.path.isdir(root):
                 return []
             children: list[dict] = []
-            for child in root.iterdir():
-                try:
-                    if not child.is_dir():
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                        children.append({
+                            "name": entry.name or entry.path,
+                            "path": entry.path,
+                        })
+                    except OSError:
                         continue
-                    children.append({
-                        "name": child.name or str(child),
-                        "path": str(child),
-                    })
-                except Exception:
-                    continue
             children.sort(key=lambda item: str(item.get("name", "")).lower())
             return children
         except Exception:
@@ -1247,7 +2161,7 @@ class Bridge(QObject):
             items = self._list_child_folders_impl(path)
             self.childFoldersListed.emit(req, items)
 
-        threading.Thread(target=work, daemon=True).start()
+        self._run_background(work)
 
     @Slot(int, result=bool)
     def set_active_collection(self, collection_id: int) -> bool:
@@ -1369,26 +2283,50 @@ class Bridge(QObject):
         except Exception:
             return False
 
+    def _cached(self, qkey: str, default, type_=str):
+        """Return a QSettings value, reading the backing store only on first use."""
+        with self._settings_lock:
+            if qkey not in self._settings_cache:
+                self._settings_cache[qkey] = self.settings.value(qkey, default, type=type_)
+            return self._settings_cache[qkey]
+
+    def _store_setting(self, qkey: str, value) -> None:
+        """Write a QSettings value and keep the in-memory cache in step.
+
+        The value is visible to every QSettings reader in the process right away;
+        the sync to persistent storage happens 250 ms after the last write.
+        """
+        with self._settings_lock:
+            self.settings.setValue(qkey, value)
+            self._settings_cache[qkey] = value
+        self._settings_sync_timer.start()
+
+    def _flush_settings(self) -> None:
+        try:
+            self.settings.sync()
+        except Exception:
+            pass
+
     def _randomize_enabled(self) -> bool:
-        return bool(self.settings.value("gallery/randomize", False, type=bool))
+        return bool(self._cached("gallery/randomize", False, bool))
 
     def _restore_last_enabled(self) -> bool:
-        return bool(self.settings.value("gallery/restore_last", False, type=bool))
+        return bool(self._cached("gallery/restore_last", False, bool))
 
     def _show_hidden_enabled(self) -> bool:
-        return bool(self.settings.value("gallery/show_hidden", False, type=bool))
+        return bool(self._cached("gallery/show_hidden", False, bool))
 
     def _preview_above_details_enabled(self) -> bool:
-        return bool(self.settings.value("ui/preview_above_details", True, type=bool))
+        return bool(self._cached("ui/preview_above_details", True, bool))
 
     def _start_folder_setting(self) -> str:
-        return str(self.settings.value("gallery/start_folder", "", type=str) or "")
+        return str(self._cached("gallery/start_folder", "", str) or "")
 
     def _last_folder(self) -> str:
-        return str(self.settings.value("gallery/last_folder", "", type=str) or "")
+        return str(self._cached("gallery/last_folder", "", str) or "")
 
     def _gallery_view_mode(self) -> str:
-        mode = str(self.settings.value("gallery/view_mode", "masonry", type=str) or "masonry")
+        mode = str(self._cached("gallery/view_mode", "masonry", str) or "masonry")
         allowed = {
             "masonry",
             "grid_small",
@@ -1402,12 +2340,12 @@ class Bridge(QObject):
         return mode if mode in allowed else "masonry"
 
     def _gallery_group_by(self) -> str:
-        value = str(self.settings.value("gallery/group_by", "none", type=str) or "none")
+        value = str(self._cached("gallery/group_by", "none", str) or "none")
         allowed = {"none", "date"}
         return value if value in allowed else "none"
 
     def _gallery_group_date_granularity(self) -> str:
-        value = str(self.settings.value("gallery/group_date_granularity", "day", type=str) or "day")
+        value = str(self._cached("gallery/group_date_granularity", "day", str) or "day")
         allowed = {"day", "month", "year"}
         return value if value in allowed else "day"
 
@@ -1582,9 +2520,8 @@ class Bridge(QObject):
             if key not in allowed and not key.startswith("metadata.display."):
                 return False
             qkey = key.replace(".", "/")
-            self.settings.setValue(qkey, bool(value))
+            self._store_setting(qkey, bool(value))
             if key.startswith("ui.") or key.startswith("metadata.display.") or key == "gallery.show_hidden":
-                self.settings.sync()
                 self.uiFlagChanged.emit(key, bool(value))
             return True
         except Exception:
@@ -1606,17 +2543,15 @@ class Bridge(QObject):
                 if value not in {"day", "month", "year"}:
                     return False
             qkey = key.replace(".", "/")
-            self.settings.setValue(qkey, str(value or ""))
+            self._store_setting(qkey, str(value or ""))
             if key == "ui.accent_color":
                 self.accentColorChanged.emit(str(value or "#8ab4f8"))
             elif key == "ui.theme_mode":
-                self.settings.sync()
+                Theme.invalidate()
                 self.uiFlagChanged.emit(key, value == "light")
             elif key in ("gallery.view_mode", "gallery.group_by", "gallery.group_date_granularity"):
-                self.settings.sync()
                 self.uiFlagChanged.emit(key, True)
             elif key == "metadata.display.order" or key.startswith("metadata.layout."):
-                self.settings.sync()
                 self.uiFlagChanged.emit(key, True)
             return True
         except Exception:
@@ -1657,15 +2592,39 @@ class Bridge(QObject):
     @Slot(result=str)
     def pick_folder(self) -> str:
         try:
-            from PySide6.QtWidgets import QFileDialog
             folder = QFileDialog.getExistingDirectory(None, "Choose folder")
             return str(folder) if folder else ""
         except Exception:
             return ""
 
-    def _unique_path(self, target: Path) -> Path:
-        if not target.exists(): return target
-        suffix, stem, parent, i = target.suffix, target.stem, target.parent, 2
+    @staticmethod
+    def _name_key(name: str) -> str:
+        # Always case-insensitive: Windows and default macOS volumes fold case, and
+        # a spurious " (2)" on a case-sensitive one is harmless where a clobber isn't.
+        return name.casefold()
+
+    def _dir_names(self, parent: Path) -> set[str] | None:
+        """Keys (see _name_key) of every entry in parent, or None if it can't be listed."""
+        try:
+            with os.scandir(parent) as it:
+                return {self._name_key(e.name) for e in it}
+        except OSError:
+            return None
+
+    def _unique_path(self, target: Path, existing: set[str] | None = None) -> Path:
+        """First free "stem (n)" variant of target; pass existing to reuse a listing of its folder."""
+        if existing is None:
+            if not target.exists(): return target
+            # One directory listing instead of a stat per candidate.
+            existing = self._dir_names(target.parent)
+        elif self._name_key(target.name) not in existing:
+            return target
+        suffix, stem, parent = target.suffix, target.stem, target.parent
+        if existing is not None:
+            for i in range(2, 10000):
+                name = f"{stem} ({i}){suffix}"
+                if self._name_key(name) not in existing: return parent / name
+        i = 10000 if existing is not None else 2
         while True:
             cand = parent / f"{stem} ({i}){suffix}"
             if not cand.exists(): return cand
@@ -1682,12 +2641,14 @@ class Bridge(QObject):
     @Slot(str, bool, result=bool)
     def set_media_hidden(self, path: str, hidden: bool) -> bool:
         success = self.repo.set_media_hidden(path, hidden)
+        self._invalidate_reconcile_cache()
         self.fileOpFinished.emit("hide" if hidden else "unhide", success, path, path)
         return success
 
     @Slot(str, bool, result=bool)
     def set_folder_hidden(self, path: str, hidden: bool) -> bool:
         success = self.repo.set_folder_hidden(path, hidden)
+        self._invalidate_reconcile_cache()
         self.fileOpFinished.emit("hide" if hidden else "unhide", success, path, path)
         return success
 
@@ -1765,8 +2726,6 @@ class Bridge(QObject):
             try:
                 is_video = path.lower().endswith(('.mp4', '.mkv', '.avi', '.mov', '.webm'))
                 if is_video:
-                    import subprocess, json, tempfile
-                    
                     # 1. Probe current rotation
                     current_ccw_rot = 0.0
                     try:
@@ -1811,7 +2770,6 @@ class Bridge(QObject):
                     _run_hidden_subprocess(cmd_ffmpeg, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     
                     # 3. Replace original file
-                    import shutil
                     shutil.move(tmp_name, path)
                 else:
                     from PIL import Image
@@ -1825,10 +2783,10 @@ class Bridge(QObject):
                 
                 # If this is a video, delete the cached poster so it regenerates on next view
                 if is_video:
-                    poster = self._video_poster_path(Path(path))
-                    if poster.exists():
-                        try: poster.unlink()
-                        except Exception: pass
+                    for poster in (self._video_poster_path(Path(path)), self._legacy_video_poster_path(Path(path))):
+                        if poster.exists():
+                            try: poster.unlink()
+                            except Exception: pass
                         
                 # Update SQLite so width and height are inverted
                 try:
@@ -1847,7 +2805,7 @@ class Bridge(QObject):
                 print(f"Failed to rotate media: {e}")
 
         # Run in background to prevent freezing the UI on large videos
-        threading.Thread(target=work, daemon=True).start()
+        self._run_background(work)
 
     @Slot(str, result=str)
     def hide_by_renaming_dot(self, path: str) -> str:
@@ -1862,9 +2820,8 @@ class Bridge(QObject):
             try: newp = self._hide_by_renaming_dot(old)
             except Exception: pass
             self.fileOpFinished.emit("hide", bool(newp), old, newp)
-            self._disk_cache = {}
-            self._disk_cache_key = ""
-        threading.Thread(target=work, daemon=True).start()
+            self._invalidate_listing_caches()
+        self._run_background(work)
         return True
 
     def _unhide_by_renaming_dot(self, path: str) -> str:
@@ -1887,9 +2844,8 @@ class Bridge(QObject):
             try: newp = self._unhide_by_renaming_dot(old)
             except Exception: pass
             self.fileOpFinished.emit("unhide", bool(newp), old, newp)
-            self._disk_cache = {}
-            self._disk_cache_key = ""
-        threading.Thread(target=work, daemon=True).start()
+            self._invalidate_listing_caches()
+        self._run_background(work)
         return True
 
     def _rename_path(self, path: str, new_name: str) -> str:
@@ -1899,6 +2855,7 @@ class Bridge(QObject):
         # Use shutil.move for robustness across drives if necessary, 
         # though usually rename is fine for same folder.
         shutil.move(str(p), str(target))
+        self._forget_probes(path)
         return str(target)
 
     @Slot(str, str, result=str)
@@ -1909,21 +2866,91 @@ class Bridge(QObject):
     @Slot(str, str, result=bool)
     def rename_path_async(self, path: str, new_name: str) -> bool:
         old, newn = str(path), str(new_name)
+        self._run_background(lambda: self._rename_and_record(old, newn))
+        return True
+
+    def _rename_and_record(self, old: str, new_name: str, conn=None) -> str:
+        """Rename on disk + in the DB, announce it, and return the new path ("" on failure)."""
+        ok, newp = False, ""
+        try:
+            newp = self._rename_path(old, new_name)
+            ok = bool(newp)
+            if ok:
+                from app.mediamanager.db.media_repo import rename_media_path
+                try: rename_media_path(conn or self.conn, old, newp)
+                except Exception: pass
+        except Exception: pass
+        self.fileOpFinished.emit("rename", ok, old, newp)
+        self._invalidate_listing_caches()
+        return newp if ok else ""
+
+    def save_media_bundle_async(
+        self,
+        path: str,
+        new_name: str,
+        desc: str,
+        notes: str,
+        ai_prompt: str,
+        ai_negative_prompt: str,
+        ai_params: str,
+        exif_date_taken: str,
+        metadata_date: str,
+        tags: list,
+    ) -> None:
+        """Save the metadata panel for one file on a worker: rename first, then one DB transaction.
+
+        Doing the rename in the same job means the metadata lands on the renamed
+        row instead of racing a separate rename_path_async. The job writes
+        through its own connection, like the scan worker, so its commit and
+        rollback never touch work other threads have open on self.conn.
+        mediaBundleSaved reports the outcome once the job is done.
+        """
+        old = str(path)
+
         def work():
-            ok, newp = False, ""
+            from app.mediamanager.db.connect import connect_db
+            from app.mediamanager.db.media_repo import get_media_by_path, update_media_dates
+            from app.mediamanager.db.metadata_repo import upsert_media_metadata
+            from app.mediamanager.db.tags_repo import set_media_tags
+
+            target, ok = old, False
             try:
-                newp = self._rename_path(old, newn)
-                ok = bool(newp)
-                if ok:
-                    from app.mediamanager.db.media_repo import rename_media_path
-                    try: rename_media_path(self.conn, old, newp)
-                    except Exception: pass
-            except Exception: pass
-            self.fileOpFinished.emit("rename", ok, old, newp)
-            self._disk_cache = {}
-            self._disk_cache_key = ""
-        threading.Thread(target=work, daemon=True).start()
-        return True
+                conn = connect_db(str(self.db_path))
+            except Exception:
+                self.mediaBundleSaved.emit(old, target, False)
+                return
+            try:
+                rename_failed = False
+                if new_name and new_name != Path(old).name:
+                    target = self._rename_and_record(old, new_name, conn) or old
+                    rename_failed = target == old
+                m = get_media_by_path(conn, target)
+                if m:
+                    upsert_media_metadata(
+                        conn, m["id"], "", desc, notes, "", "", ai_prompt, ai_negative_prompt, ai_params, commit=False
+                    )
+                    update_media_dates(
+                        conn,
+                        m["id"],
+                        exif_date_taken=exif_date_taken.strip() or None,
+                        metadata_date=metadata_date.strip() or None,
+                        commit=False,
+                    )
+                    set_media_tags(conn, m["id"], tags, commit=False)
+                    conn.commit()
+                    self._invalidate_reconcile_cache()
+                    # A failed rename still saves the fields, on the old path.
+                    ok = not rename_failed
+            except Exception:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            finally:
+                conn.close()
+            self.mediaBundleSaved.emit(old, target, ok)
+
+        self._run_background(work)
 
     @Slot(str, result=str)
     def path_to_url(self, path: str) -> str:
@@ -1968,6 +2995,11 @@ class Bridge(QObject):
             is_move = op_type in ("move", "paste_move")
             sticky_action = None
             any_ok = False
+            # One listing of the target up front; collisions are then set lookups
+            # instead of an exists() per pasted file.
+            existing = self._dir_names(target_dir)
+            name_key = self._name_key
+            taken = (lambda p: name_key(p.name) in existing) if existing is not None else Path.exists
             
             try:
                 for src in src_paths:
@@ -1978,7 +3010,7 @@ class Bridge(QObject):
                     action = "keep_both"
                     final_dst = dst
                     
-                    if dst.exists():
+                    if taken(dst):
                         if dst.samefile(src):
                             continue
                         
@@ -2005,9 +3037,7 @@ class Bridge(QObject):
                         elif action == "keep_both":
                              # Use the new name from dialog if provided
                              new_name = res.get("new_incoming", src.name)
-                             final_dst = target_dir / new_name
-                             if final_dst.exists():
-                                 final_dst = self._unique_path(final_dst)
+                             final_dst = self._unique_path(target_dir / new_name, existing)
                     
                     # Execute with correct atomic logic
                     try:
@@ -2030,13 +3060,15 @@ class Bridge(QObject):
                             else: rename_media_path(self.conn, str(src), str(final_dst))
                         else:
                             # Copy operation
-                            if src.is_dir(): shutil.copytree(src, final_dst)
-                            else: shutil.copy2(src, final_dst)
+                            if src.is_dir(): shutil.copytree(src, final_dst, copy_function=_copy_file)
+                            else: _copy_file(src, final_dst)
                             
                             ext = final_dst.suffix.lower()
                             mtype = "image" if ext in {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"} else "video"
                             add_media_item(self.conn, str(final_dst), mtype)
                         
+                        if existing is not None:
+                            existing.add(name_key(final_dst.name))
                         any_ok = True
                     except Exception as e:
                         pass
@@ -2046,9 +3078,9 @@ class Bridge(QObject):
             except Exception as e:
                 self.fileOpFinished.emit(op_type, False, "", "")
             
-            self._disk_cache = {}; self._disk_cache_key = ""
+            self._invalidate_listing_caches()
 
-        threading.Thread(target=work, daemon=True).start()
+        self._run_background(work)
 
     @Slot(list, str)
     def move_paths_async(self, src_paths: list[str], target_folder: str) -> None:
@@ -2058,6 +3090,10 @@ class Bridge(QObject):
     def copy_paths_async(self, src_paths: list[str], target_folder: str) -> None:
         self._process_file_op("copy", [Path(p) for p in src_paths], Path(target_folder))
 
+    @Slot(bool)
+    def set_web_menu_open(self, is_open: bool) -> None:
+        self.web_menu_open = bool(is_open)
+
     @Slot(list, result=bool)
     def show_metadata(self, paths: list) -> bool:
         try: self.metadataRequested.emit(paths); return True
@@ -2069,21 +3105,29 @@ class Bridge(QObject):
             p_obj = Path(path).absolute()
             p = str(p_obj).replace("/", "\\")
             if not p_obj.exists(): return
-            if p_obj.is_dir(): os.startfile(p)
-            else: subprocess.Popen(f'explorer.exe /select,"{p}"', shell=True)
+            is_dir = p_obj.is_dir()
+            if _shell_reveal(p, is_dir): return
+            if is_dir: os.startfile(p)
+            else: subprocess.Popen(["explorer.exe", f"/select,{p}"])
         except Exception: pass
 
     def _build_dropfiles_w(self, abs_paths: list[str]) -> bytes:
-        import struct
         header = struct.pack("IiiII", 20, 0, 0, 0, 1)
-        files_data = b"".join([p.encode("utf-16-le") + b"\x00\x00" for p in abs_paths]) + b"\x00\x00"
-        return header + files_data
+        # NUL-separated, double-NUL-terminated list, encoded in one pass.
+        names = "\0".join(abs_paths) + "\0\0" if abs_paths else "\0"
+        return header + names.encode("utf-16-le")
+
+    @staticmethod
+    def _clipboard_paths(paths: list[str]) -> list[str]:
+        # abspath is pure string normalization; gallery paths are already absolute,
+        # so Path.resolve()'s realpath/stat per file buys nothing here.
+        return [os.path.abspath(str(p)) for p in paths]
 
     @Slot(list)
     def copy_to_clipboard(self, paths: list[str]) -> None:
         try:
             clipboard, mime = QApplication.clipboard(), QMimeData()
-            abs_paths = [str(Path(p).resolve()) for p in paths]
+            abs_paths = self._clipboard_paths(paths)
             mime.setUrls([QUrl.fromLocalFile(p) for p in abs_paths])
             mime.setText("\n".join(abs_paths))
             mime.setData("Preferred DropEffect", b'\x05\x00\x00\x00')
@@ -2095,7 +3139,7 @@ class Bridge(QObject):
     def cut_to_clipboard(self, paths: list[str]) -> None:
         try:
             clipboard, mime = QApplication.clipboard(), QMimeData()
-            abs_paths = [str(Path(p).resolve()) for p in paths]
+            abs_paths = self._clipboard_paths(paths)
             mime.setUrls([QUrl.fromLocalFile(p) for p in abs_paths])
             mime.setText("\n".join(abs_paths))
             mime.setData("Preferred DropEffect", b'\x02\x00\x00\x00')
@@ -2108,23 +3152,56 @@ class Bridge(QObject):
         try: return QApplication.clipboard().mimeData().hasUrls()
         except Exception: return False
 
-    @Slot(str, result=bool)
-    def delete_path(self, path_str: str) -> bool:
+    def _delete_paths(self, targets: list[str]) -> list[bool]:
+        """Delete each path from disk, then drop all their rows in one transaction."""
+        from app.mediamanager.utils.pathing import normalize_windows_path
+        results = [False] * len(targets)
+        removed: list[int] = []
+        for i, path_str in enumerate(targets):
+            try:
+                p = Path(path_str)
+                if not p.exists(): continue
+                if p.is_dir(): shutil.rmtree(p)
+                else: p.unlink()
+                self._forget_probes(path_str)
+                removed.append(i)
+            except Exception:
+                self.fileOpFinished.emit("delete", False, path_str, "")
+        if not removed:
+            return results
         try:
-            p = Path(path_str)
-            if not p.exists(): return False
-            if p.is_dir(): shutil.rmtree(p)
-            else: p.unlink()
-            from app.mediamanager.utils.pathing import normalize_windows_path
-            self.conn.execute("DELETE FROM media_items WHERE path = ?", (normalize_windows_path(path_str),))
-            self.conn.commit()
-            self._disk_cache = {}
-            self._disk_cache_key = ""
-            self.fileOpFinished.emit("delete", True, path_str, "")
-            return True
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM media_items WHERE path = ?",
+                    [(normalize_windows_path(targets[i]),) for i in removed],
+                )
+            ok = True
         except Exception:
-            self.fileOpFinished.emit("delete", False, path_str, "")
-            return False
+            ok = False
+        self._invalidate_listing_caches()
+        for i in removed:
+            results[i] = ok
+            self.fileOpFinished.emit("delete", ok, targets[i], "")
+        return results
+
+    def _delete_path(self, path_str: str) -> bool:
+        return self._delete_paths([path_str])[0]
+
+    @Slot(str, result=bool)
+    def delete_path(self, path_str: str) -> bool:
+        return self._delete_path(path_str)
+
+    @Slot(list)
+    def delete_paths_async(self, paths: list) -> None:
+        """Delete files/folders on a worker thread; each result arrives via fileOpFinished."""
+        targets = [str(p) for p in paths if str(p or "").strip()]
+        if not targets:
+            return
+
+        def work() -> None:
+            self._delete_paths(targets)
+
+        self._run_background(work)
 
     @Slot(str, str, result=str)
     def create_folder(self, parent_path: str, name: str) -> str:
@@ -2149,8 +3226,33 @@ class Bridge(QObject):
         except Exception:
             self.fileOpFinished.emit("paste", False, "", "")
 
+    def _cached_probe(self, kind: str, video_path: str, probe, empty):
+        """Run an ffprobe helper once per (path, mtime, size); failed probes are not cached."""
+        path = str(video_path)
+        try:
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return probe(path)
+        cached = self._probe_cache.get((kind, path))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        result = probe(path)
+        if result != empty:
+            if len(self._probe_cache) > 4096:
+                self._probe_cache.clear()
+            self._probe_cache[(kind, path)] = (stamp, result)
+        return result
+
+    def _forget_probes(self, path: str) -> None:
+        for kind in ("duration", "size"):
+            self._probe_cache.pop((kind, str(path)), None)
+
     @Slot(str, result=float)
     def get_video_duration_seconds(self, video_path: str) -> float:
+        return self._cached_probe("duration", video_path, self._probe_video_duration, 0.0)
+
+    def _probe_video_duration(self, video_path: str) -> float:
         try:
             ffprobe = self._ffprobe_bin()
             if not ffprobe: return 0.0
@@ -2160,11 +3262,20 @@ class Bridge(QObject):
         except Exception: return 0.0
 
     def _probe_video_size(self, video_path: str) -> tuple[int, int, bool]:
+        return self._cached_probe("size", video_path, self._probe_video_size_uncached, (0, 0, False))
+
+    def _probe_video_size_uncached(self, video_path: str) -> tuple[int, int, bool]:
+        from app.mediamanager.metadata.containers.mp4_atoms import MP4_SUFFIXES, read_mp4_video_size
+        if self._lower_suffix(str(video_path)) in MP4_SUFFIXES:
+            # Plain MP4/MOV tracks: read tkhd/stsd directly instead of spawning ffprobe.
+            native = read_mp4_video_size(Path(video_path))
+            if native:
+                w, h = max(2, native[0]), max(2, native[1])
+                return (w, h, (w % 2 != 0 or h % 2 != 0))
         ffprobe = self._ffprobe_bin()
         if not ffprobe: return (0, 0, False)
         cmd = [ffprobe, "-v", "quiet", "-print_format", "json", "-show_streams", str(video_path)]
         try:
-            import json
             r = _run_hidden_subprocess(cmd, capture_output=True, text=True, timeout=5)
             data = json.loads(r.stdout)
             streams = data.get("streams", [])
@@ -2212,12 +3323,12 @@ class Bridge(QObject):
                     try:
                         fixed = self._preprocess_to_even_dims(video_path, w, h)
                         if fixed:
-                            pw, ph, _ = self._probe_video_size(fixed)
+                            fixed, pw, ph = fixed
                             self.videoPreprocessingStatus.emit("")
                             self.openVideoRequested.emit(str(fixed), bool(autoplay), bool(loop), bool(muted), int(pw), int(ph))
                         else: self.videoPreprocessingStatus.emit("Error preparing video.")
                     except Exception: self.videoPreprocessingStatus.emit("Error preparing video.")
-                threading.Thread(target=work, daemon=True).start()
+                self._run_background(work)
             else: self.openVideoRequested.emit(str(video_path), bool(autoplay), bool(loop), bool(muted), int(w), int(h))
             return True
         except Exception: return False
@@ -2245,12 +3356,12 @@ class Bridge(QObject):
                     try:
                         fixed = self._preprocess_to_even_dims(video_path, vw, vh)
                         if fixed:
-                            pw, ph, _ = self._probe_video_size(fixed)
+                            fixed, pw, ph = fixed
                             self.videoPreprocessingStatus.emit("")
                             self.openVideoInPlaceRequested.emit(str(fixed), int(x), int(y), int(w), int(h), bool(autoplay), bool(loop), bool(muted), int(pw), int(ph))
                         else: self.videoPreprocessingStatus.emit("Error preparing video.")
                     except Exception: self.videoPreprocessingStatus.emit("Error preparing video.")
-                threading.Thread(target=work, daemon=True).start()
+                self._run_background(work)
             else:
                 self.openVideoInPlaceRequested.emit(str(video_path), int(x), int(y), int(w), int(h), bool(autoplay), bool(loop), bool(muted), int(vw), int(vh))
         except Exception:
@@ -2275,7 +3386,7 @@ class Bridge(QObject):
                 # 3. Future: Warm up QMediaPlayer instance if needed
             except Exception:
                 pass
-        threading.Thread(target=work, daemon=True).start()
+        self._run_background(work)
 
     @Slot(int, int, int, int)
     def update_native_video_rect(self, x, y, w, h):
@@ -2289,19 +3400,23 @@ class Bridge(QObject):
     def set_video_paused(self, paused: bool) -> None:
         self.videoPausedChanged.emit(paused)
 
-    def _preprocess_to_even_dims(self, video_path: str, w: int, h: int) -> str | None:
-        import tempfile
+    def _preprocess_to_even_dims(self, video_path: str, w: int, h: int) -> tuple[str, int, int] | None:
+        """Re-encode to even dimensions; returns (out_path, width, height) of the result."""
         ffmpeg = self._ffmpeg_bin()
         if not ffmpeg: return None
         ew, eh = (w if w % 2 == 0 else w - 1), (h if h % 2 == 0 else h - 1)
         if ew <= 0 or eh <= 0: return None
-        tmp = tempfile.NamedTemporaryFile(prefix="mmx_fixed_", suffix=".mkv", delete=False)
+        tmp = tempfile.NamedTemporaryFile(prefix=_FIXED_VIDEO_PREFIX, suffix=".mkv", delete=False)
         tmp.close()
         out_path = tmp.name
         vf = f"scale={ew}:{eh},setsar=1,format=yuv420p"
-        cmd = [ffmpeg, "-y", "-hide_banner", "-loglevel", "warning", "-i", str(video_path), "-vf", vf, "-c:v", "mjpeg", "-q:v", "3", "-c:a", "copy", out_path]
+        # Odd dimensions can't be fixed by stream copy, so this must re-encode; let
+        # ffmpeg pick a hardware decoder (it falls back to software on its own) and
+        # use every core for the MJPEG encode.
+        cmd = [ffmpeg, "-y", "-hide_banner", "-loglevel", "warning", "-hwaccel", "auto", "-i", str(video_path), "-vf", vf, "-c:v", "mjpeg", "-q:v", "3", "-threads", "0", "-c:a", "copy", out_path]
         try:
-            if _run_hidden_subprocess(cmd, capture_output=True, timeout=60).returncode == 0: return out_path
+            # The scale filter fixes the output size, so no need to ffprobe the result.
+            if _run_ffmpeg(cmd, timeout=60)[0] == 0: return (out_path, ew, eh)
         except Exception: pass
         return None
 
@@ -2312,6 +3427,25 @@ class Bridge(QObject):
 
     @Slot(str, result=dict)
     def get_media_metadata(self, path: str) -> dict:
+        return self._media_metadata_payload(self.conn, path)
+
+    def read_media_metadata(self, path: str) -> dict:
+        """get_media_metadata for worker threads.
+
+        Building the payload can insert the item and persist its AI metadata, so
+        workers go through the bridge's own metadata connection (one at a time)
+        instead of writing on self.conn alongside the GUI thread and the pools.
+        """
+        from app.mediamanager.db.connect import connect_db
+        with self._meta_conn_lock:
+            try:
+                if self._meta_conn is None:
+                    self._meta_conn = connect_db(str(self.db_path))
+            except Exception:
+                return {}
+            return self._media_metadata_payload(self._meta_conn, path)
+
+    def _media_metadata_payload(self, conn, path: str) -> dict:
         image_exts = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"}
         from app.mediamanager.db.media_repo import get_media_by_path
         from app.mediamanager.db.ai_metadata_repo import (
@@ -2324,15 +3458,16 @@ class Bridge(QObject):
         from app.mediamanager.metadata.persistence import inspect_and_persist_if_supported
         from app.mediamanager.db.tags_repo import list_media_tags
         try:
-            m = get_media_by_path(self.conn, path)
+            m = get_media_by_path(conn, path)
             if not m:
                 p = Path(path)
                 if not p.exists():
                     return {}
                 from app.mediamanager.db.media_repo import add_media_item
                 media_type = "image" if p.suffix.lower() in image_exts else "video"
-                add_media_item(self.conn, path, media_type)
-                m = get_media_by_path(self.conn, path)
+                add_media_item(conn, path, media_type)
+                self._invalidate_reconcile_cache()
+                m = get_media_by_path(conn, path)
                 if not m:
                     return {}
             p = Path(path)
@@ -2345,11 +3480,11 @@ class Bridge(QObject):
                         m["modified_time"] = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).replace(microsecond=0).isoformat()
                 except Exception:
                     pass
-            meta = get_media_metadata(self.conn, m["id"]) or {}
-            ai_meta = get_media_ai_metadata(self.conn, m["id"]) or {}
+            meta = get_media_metadata(conn, m["id"]) or {}
+            ai_meta = get_media_ai_metadata(conn, m["id"]) or {}
             if not ai_meta:
-                inspect_and_persist_if_supported(self.conn, m["id"], path, m.get("media_type"))
-                ai_meta = get_media_ai_metadata(self.conn, m["id"]) or {}
+                inspect_and_persist_if_supported(conn, m["id"], path, m.get("media_type"))
+                ai_meta = get_media_ai_metadata(conn, m["id"]) or {}
             ai_ui = build_media_ai_ui_fields(ai_meta)
 
             description = meta.get("description") or ai_meta.get("description") or ""
@@ -2362,7 +3497,7 @@ class Bridge(QObject):
                 "embedded_tags": meta.get("embedded_tags") or "", "embedded_comments": meta.get("embedded_comments") or "",
                 "ai_prompt": ai_prompt, "ai_negative_prompt": ai_negative_prompt,
                 "ai_params": ai_params, "ai_tool_summary": ai_tool_summary,
-                "tags": list_media_tags(self.conn, m["id"]), "has_metadata": bool(meta or ai_meta),
+                "tags": list_media_tags(conn, m["id"]), "has_metadata": bool(meta or ai_meta),
                 "exif_date_taken": m.get("exif_date_taken") or "",
                 "metadata_date": m.get("metadata_date") or "",
                 "file_created_time": m.get("file_created_time") or "",
@@ -2380,6 +3515,7 @@ class Bridge(QObject):
             m = get_media_by_path(self.conn, path)
             if m: upsert_media_metadata(self.conn, m["id"], title, desc, notes, etags, ecomm, aip, ainp, aiparam)
         except Exception: pass
+        self._invalidate_reconcile_cache()
 
     @Slot(str, str, str)
     def update_media_dates(self, path: str, exif_date_taken: str, metadata_date: str) -> None:
@@ -2395,6 +3531,7 @@ class Bridge(QObject):
                 )
         except Exception:
             pass
+        self._invalidate_reconcile_cache()
 
     @Slot(str, list)
     def set_media_tags(self, path: str, tags: list) -> None:
@@ -2404,6 +3541,7 @@ class Bridge(QObject):
             m = get_media_by_path(self.conn, path)
             if m: set_media_tags(self.conn, m["id"], tags)
         except Exception: pass
+        self._invalidate_reconcile_cache()
 
     @Slot(str, list)
     def attach_media_tags(self, path: str, tags: list) -> None:
@@ -2413,6 +3551,7 @@ class Bridge(QObject):
             m = get_media_by_path(self.conn, path)
             if m: attach_tags(self.conn, m["id"], tags)
         except Exception: pass
+        self._invalidate_reconcile_cache()
 
     @Slot(str)
     def clear_media_tags(self, path: str) -> None:
@@ -2422,9 +3561,11 @@ class Bridge(QObject):
             m = get_media_by_path(self.conn, path)
             if m: clear_all_media_tags(self.conn, m["id"])
         except Exception: pass
+        self._invalidate_reconcile_cache()
 
     @Slot(list, int, int, str, str, str, result=list)
     def list_media(self, folders, limit=100, offset=0, sort_by="name_asc", filter_type="all", search_query="") -> list:
+        from app.mediamanager.utils.pathing import local_file_url
         try:
             candidates = self._get_gallery_entries(folders, sort_by, filter_type, search_query)
             start, end = max(0, int(offset)), max(0, int(offset)) + max(0, int(limit))
@@ -2454,10 +3595,10 @@ class Bridge(QObject):
                         }
                     )
                     continue
-                real = r.get("_real_path")
-                p = real if isinstance(real, Path) else Path(r["path"])
+                # normpath gives the same native string str(Path(...)) did, minus the object.
+                p = os.path.normpath(r.get("_real_path") or r["path"])
                 try:
-                    stat = p.stat()
+                    stat = os.stat(p)
                     mtime = int(stat.st_mtime_ns)
                     ctime = int(stat.st_ctime_ns)
                 except Exception:
@@ -2466,8 +3607,8 @@ class Bridge(QObject):
                 auto_date = int(r.get("preferred_date") or self._preferred_date_ns(r))
                     
                 out.append({
-                    "path": str(p), 
-                    "url": f"{QUrl.fromLocalFile(str(p)).toString()}?t={mtime}", 
+                    "path": p, 
+                    "url": f"{local_file_url(p)}?t={mtime}", 
                     "media_type": r["media_type"], 
                     "is_folder": False,
                     "is_hidden": bool(r.get("is_hidden")),
@@ -2499,14 +3640,43 @@ class Bridge(QObject):
             items = self.list_media(folder_list, lim, off, sort, ftype, query)
             self.mediaListed.emit(req, items or [])
 
-        threading.Thread(target=work, daemon=True).start()
+        self._submit_io(work)
 
     @Slot(list, str, str, result=int)
     def count_media(self, folders: list, filter_type: str = "all", search_query: str = "") -> int:
         try:
+            if folders and not search_query.strip():
+                return self._count_scope_entries(folders, filter_type)
             return len(self._get_gallery_entries(folders, "name_asc", filter_type, search_query))
         except Exception: return 0
 
+    def _count_scope_entries(self, folders: list, filter_type: str = "all") -> int:
+        """Same total as _get_gallery_entries for a folder scope without a search, without building row dicts."""
+        from app.mediamanager.db.media_repo import list_media_paths_in_scope
+        from app.mediamanager.utils.pathing import normalize_windows_path
+        key = self._reconcile_key(folders, filter_type, "")
+        with self._reconcile_lock:
+            # Waits out an in-flight list_media walk, then reuses whatever it cached.
+            cached = self._cached_reconcile(key)
+            disk_files = self._disk_files_for(folders) if cached is None else {}
+        if cached is not None:
+            total = len(cached)
+        else:
+            show_hidden = self._show_hidden_enabled()
+            keep = self._type_predicate(filter_type) or (lambda _path: True)
+            total, covered = 0, set()
+            for path, is_hidden in list_media_paths_in_scope(self.conn, folders):
+                norm = normalize_windows_path(path)
+                covered.add(norm)
+                if is_hidden and not show_hidden:
+                    continue
+                if (norm in disk_files or os.path.isfile(path)) and keep(path):
+                    total += 1
+            total += sum(1 for norm, real_path in disk_files.items() if norm not in covered and keep(real_path))
+        if self._gallery_view_mode() != "masonry":
+            total += len(self._list_folder_entries(folders, ""))
+        return total
+
     @Slot(str, list, str, str)
     def count_media_async(self, request_id: str, folders: list, filter_type: str = "all", search_query: str = "") -> None:
         req = str(request_id or "")
@@ -2518,29 +3688,160 @@ class Bridge(QObject):
             count = self.count_media(folder_list, ftype, query)
             self.mediaCounted.emit(req, int(count or 0))
 
-        threading.Thread(target=work, daemon=True).start()
+        self._submit_io(work)
+
+    def _run_background(self, fn) -> None:
+        """Run one-off work on the shared background pool instead of a fresh thread."""
+        try:
+            self._bg_pool.submit(fn)
+        except RuntimeError:
+            pass  # pool already shut down during exit
+
+    def shutdown_pools(self) -> None:
+        """Stop background work on exit so the pool threads can be joined promptly.
+
+        Queued jobs are dropped, scans and poster batches stop at their next
+        check of the closing flag, and running ffmpeg children are killed.
+        A file operation already running (copy, move, delete) is let finish.
+        """
+        self._closing.set()
+        with self._scan_lock:
+            if self._scan_cancel is not None:
+                self._scan_cancel.set()
+        _kill_live_procs()
+        for pool in (self._bg_pool, self._io_pool, self._poster_pool):
+            if pool is not None:
+                try:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                except Exception:
+                    pass
+
+    def _submit_io(self, fn) -> None:
+        """Run a gallery list/count request on the shared I/O pool."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mmx-io")
+        self._io_pool.submit(fn)
+
+    _IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"})
+    _VIDEO_EXTS = frozenset({".mp4", ".m4v", ".webm", ".mov", ".mkv", ".avi", ".wmv"})
+    _MEDIA_EXTS = _IMAGE_EXTS | _VIDEO_EXTS
+
+    @staticmethod
+    def _lower_suffix(name: str) -> str:
+        """Lowercased extension of a file name or path, matching Path.suffix rules."""
+        dot = name.rfind(".")
+        if dot <= 0 or name[dot - 1] in "/\\" or "/" in name[dot:] or "\\" in name[dot:]:
+            return ""
+        return name[dot:].lower()
+
+    @staticmethod
+    def _iter_media_files(root: str, exts: frozenset[str], dirs_out: list[str] | None = None):
+        """Yield media file paths under root using os.scandir (no per-file stat).
+
+        If dirs_out is given, every directory visited is appended to it.
+        """
+        lower_suffix = Bridge._lower_suffix
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            if dirs_out is not None:
+                dirs_out.append(current)
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                stack.append(entry.path)
+                            elif lower_suffix(entry.name) in exts:
+                                yield entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def _disk_files_for(self, folders: list) -> dict[str, str]:
+        """Normalized path -> real path for media under folders, cached per folder set."""
+        current_key = tuple(sorted(folders))
+        if self._disk_cache and self._disk_cache_key == current_key:
+            return self._disk_cache
+        disk_files, walked = {}, []
+        for folder in folders:
+            # Walking from a normpath'd root means every yielded path is already
+            # clean, so normalize_windows_path reduces to separator swap + casefold.
+            root = os.path.normpath(str(folder))
+            if not os.path.isdir(root): continue
+            try:
+                for entry_path in self._iter_media_files(root, self._MEDIA_EXTS, walked):
+                    disk_files[entry_path.replace("\\", "/").casefold()] = entry_path
+            except Exception: pass
+        self._disk_cache, self._disk_cache_key = disk_files, current_key
+        self._watchDirsRequested.emit(walked[:self._MAX_WATCHED_DIRS])
+        return disk_files
+
+    _MAX_WATCHED_DIRS = 512  # each watched dir costs an OS change handle
+
+    @Slot(str)
+    def _on_watched_dir_changed(self, _path: str) -> None:
+        self._dir_change_timer.start()
+
+    @Slot(list)
+    def _set_watched_dirs(self, dirs: list) -> None:
+        try:
+            # The watcher may report paths with different separators; compare normalized.
+            current = {os.path.normpath(d): d for d in self._dir_watcher.directories()}
+            wanted = {os.path.normpath(d) for d in dirs}
+            stale = [orig for norm, orig in current.items() if norm not in wanted]
+            if stale:
+                self._dir_watcher.removePaths(stale)
+            fresh = [d for d in wanted if d not in current]
+            if fresh:
+                self._dir_watcher.addPaths(fresh)
+        except Exception:
+            pass
+
+    _RECONCILE_TTL = 1.5  # seconds
+
+    def _invalidate_listing_caches(self, *args) -> None:
+        self._disk_cache = {}
+        self._disk_cache_key = ""
+        self._invalidate_reconcile_cache()
+
+    def _invalidate_reconcile_cache(self) -> None:
+        """Drop reconciled listings after a DB write; also stops in-flight ones from being cached."""
+        self._reconcile_generation += 1
+        self._reconcile_cache.clear()
+
+    def _reconcile_key(self, folders: list, filter_type: str, search_query: str) -> tuple:
+        return (tuple(sorted(str(f) for f in folders)), filter_type, search_query, self._show_hidden_enabled())
+
+    def _cached_reconcile(self, key: tuple) -> list[dict] | None:
+        hit = self._reconcile_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self._RECONCILE_TTL:
+            return hit[1]
+        return None
 
     def _get_reconciled_candidates(self, folders: list, filter_type: str = "all", search_query: str = "") -> list[dict]:
+        if not folders: return []
+        key = self._reconcile_key(folders, filter_type, search_query)
+        cached = self._cached_reconcile(key)
+        if cached is None:
+            with self._reconcile_lock:
+                cached = self._cached_reconcile(key)
+                if cached is None:
+                    generation = self._reconcile_generation
+                    cached = self._reconcile_candidates(folders, filter_type, search_query)
+                    if generation == self._reconcile_generation:
+                        if len(self._reconcile_cache) > 16:
+                            self._reconcile_cache.clear()
+                        self._reconcile_cache[key] = (time.monotonic(), cached)
+        # Callers sort and annotate the rows; the cached dicts must stay untouched.
+        return [dict(r) for r in cached]
+
+    def _reconcile_candidates(self, folders: list, filter_type: str = "all", search_query: str = "") -> list[dict]:
         from app.mediamanager.db.media_repo import list_media_in_scope
         from app.mediamanager.utils.pathing import normalize_windows_path
-        ALL_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif", ".mp4", ".m4v", ".webm", ".mov", ".mkv", ".avi", ".wmv"}
-        image_exts = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"}
-        if not folders: return []
-        current_key = hashlib.sha1(",".join(sorted(folders)).encode()).hexdigest()
-        if self._disk_cache and self._disk_cache_key == current_key: disk_files = self._disk_cache
-        else:
-            disk_files = {}
-            for folder in folders:
-                folder_path = Path(folder)
-                if not folder_path.is_dir(): continue
-                try:
-                    for root_dir, _, files in os.walk(str(folder_path), followlinks=True):
-                        curr_root = Path(root_dir)
-                        for f in files:
-                            p = curr_root / f
-                            if p.suffix.lower() in ALL_EXTS: disk_files[normalize_windows_path(str(p))] = p
-                except Exception: pass
-            self._disk_cache, self._disk_cache_key = disk_files, current_key
+        image_exts = self._IMAGE_EXTS
+        disk_files = self._disk_files_for(folders)
         db_candidates = list_media_in_scope(self.conn, folders)
         surviving, covered = [], set()
         show_hidden = self._show_hidden_enabled()
@@ -2550,32 +3851,47 @@ class Bridge(QObject):
             covered.add(norm)
             if not show_hidden and r.get("is_hidden"):
                 continue
-            path_obj = disk_files.get(norm) or Path(r["path"])
-            if path_obj.exists() and path_obj.is_dir():
+            real = disk_files.get(norm)
+            if real is not None:
+                # Found as a file by the walk just now; no need to stat it again.
+                r = dict(r)
+                r["_real_path"] = real
+                surviving.append(r)
                 continue
-            if norm in disk_files or path_obj.exists():
-                if norm in disk_files:
-                    r = dict(r)
-                    r["_real_path"] = disk_files[norm]
+            if os.path.isfile(r["path"]):
                 surviving.append(r)
         
-        for norm, p_obj in disk_files.items():
+        for norm, real in disk_files.items():
             if norm not in covered:
                 # Items only on disk are not hidden yet
-                surviving.append({"id": -1, "path": norm, "media_type": ("image" if p_obj.suffix.lower() in image_exts else "video"), "file_size": None, "modified_time": None, "duration": None, "_real_path": p_obj})
+                surviving.append({"id": -1, "path": norm, "media_type": ("image" if self._lower_suffix(norm) in image_exts else "video"), "file_size": None, "modified_time": None, "duration": None, "_real_path": real})
         
-        candidates = surviving
-        if filter_type == "image": candidates = [r for r in candidates if r["path"].lower().endswith(tuple(image_exts)) and not self._is_animated(Path(r["path"]))]
-        elif filter_type == "video": candidates = [r for r in candidates if not r["path"].lower().endswith(tuple(image_exts))]
-        elif filter_type == "animated": candidates = [r for r in candidates if self._is_animated(Path(r["path"]))]
+        candidates = self._filter_by_type(surviving, filter_type)
         
         if search_query.strip():
             candidates = [r for r in candidates if self._matches_media_search(r, search_query)]
         return candidates
 
+    def _type_predicate(self, filter_type: str):
+        """Path predicate for the gallery's image/video/animated filter; None for "all"."""
+        image_exts, lower_suffix, is_animated = self._IMAGE_EXTS, self._lower_suffix, self._is_animated
+        if filter_type == "video":
+            return lambda path: lower_suffix(path) not in image_exts
+        if filter_type == "image":
+            return lambda path: lower_suffix(path) in image_exts and not is_animated(path)
+        if filter_type == "animated":
+            return is_animated
+        return None
+
+    def _filter_by_type(self, candidates: list[dict], filter_type: str) -> list[dict]:
+        """Apply the gallery's image/video/animated filter, deriving each suffix once."""
+        keep = self._type_predicate(filter_type)
+        if keep is None:
+            return candidates
+        return [r for r in candidates if keep(r["path"])]
+
     def _get_collection_candidates(self, collection_id: int, filter_type: str = "all", search_query: str = "") -> list[dict]:
         from app.mediamanager.db.media_repo import list_media_in_collection
-        image_exts = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"}
         show_hidden = self._show_hidden_enabled()
         
         raw_candidates = list_media_in_collection(self.conn, int(collection_id))
@@ -2583,16 +3899,10 @@ class Bridge(QObject):
         for r in raw_candidates:
             if not show_hidden and r.get("is_hidden"):
                 continue
-            path_obj = Path(r["path"])
-            if path_obj.exists() and path_obj.is_file():
+            if os.path.isfile(r["path"]):
                 candidates.append(r)
                 
-        if filter_type == "image":
-            candidates = [r for r in candidates if r["path"].lower().endswith(tuple(image_exts)) and not self._is_animated(Path(r["path"]))]
-        elif filter_type == "video":
-            candidates = [r for r in candidates if not r["path"].lower().endswith(tuple(image_exts))]
-        elif filter_type == "animated":
-            candidates = [r for r in candidates if self._is_animated(Path(r["path"]))]
+        candidates = self._filter_by_type(candidates, filter_type)
             
         if search_query.strip():
             candidates = [r for r in candidates if self._matches_media_search(r, search_query)]
@@ -2639,25 +3949,27 @@ class Bridge(QObject):
         entries: list[dict] = []
 
         for folder in folders:
-            root = Path(folder)
-            if not root.is_dir():
+            root = str(Path(folder))
+            if not os.path.isdir(root):
                 continue
             try:
-                for child in root.iterdir():
-                    if not child.is_dir():
-                        continue
-                    norm = str(child).lower().replace("\\", "/")
+                with os.scandir(root) as it:
+                    children = [entry for entry in it if entry.is_dir()]
+                for child in children:
+                    child_path = child.path
+                    norm = child_path.lower().replace("\\", "/")
                     if norm in seen:
                         continue
-                    is_hidden = self.repo.is_path_hidden(str(child))
+                    is_hidden = self.repo.is_path_hidden(child_path)
                     if not show_hidden and is_hidden:
                         continue
                     if query:
-                        haystack = f"{child.name} {child}".lower()
+                        haystack = f"{child.name} {child_path}".lower()
                         if query not in haystack:
                             continue
                     seen.add(norm)
                     try:
+                        # DirEntry.stat() is served from the directory listing on Windows.
                         stat = child.stat()
                         modified_time = int(stat.st_mtime_ns)
                         created_time = int(stat.st_ctime_ns)
@@ -2666,7 +3978,7 @@ class Bridge(QObject):
                         created_time = 0
                     entries.append(
                         {
-                            "path": str(child),
+                            "path": child_path,
                             "media_type": "folder",
                             "is_folder": True,
                             "is_hidden": is_hidden,
@@ -2685,15 +3997,35 @@ class Bridge(QObject):
         return entries
 
     def _sort_gallery_entries(self, entries: list[dict], sort_by: str) -> list[dict]:
-        name_key = lambda row: Path(str(row.get("path", ""))).name.lower()
-        date_key = lambda row: row.get("preferred_date") or self._preferred_date_ns(row)
-        size_key = lambda row: row.get("file_size") or 0
+        # Keys are computed once per row and stored on it (rows are reused from the
+        # reconcile cache across re-sorts), then read back with C-level itemgetters.
+        for row in entries:
+            if "_name_key" not in row:
+                path = str(row.get("path", "")).rstrip("/\\")
+                row["_name_key"] = path[max(path.rfind("/"), path.rfind("\\")) + 1:].lower()
+        if sort_by.startswith("date_"):
+            for row in entries:
+                if "_date_key" not in row:
+                    row["_date_key"] = (row.get("preferred_date") or self._preferred_date_ns(row), row["_name_key"])
+        elif sort_by.startswith("size_"):
+            for row in entries:
+                if "_size_key" not in row:
+                    row["_size_key"] = (row.get("file_size") or 0, row["_name_key"])
+        name_key = operator.itemgetter("_name_key")
         folders = [row for row in entries if row.get("is_folder")]
         media = [row for row in entries if not row.get("is_folder")]
 
         if self._randomize_enabled() and sort_by == "name_asc":
             folders.sort(key=name_key)
-            random.Random(self._session_shuffle_seed).shuffle(media)
+            # Sorting on a per-session hash of the path shuffles in C rather than
+            # with a Python-level Fisher-Yates, and the stored keys make every later
+            # page of the same listing a cheap re-sort.
+            seed = self._session_shuffle_seed
+            for row in media:
+                if row.get("_shuffle_seed") != seed:
+                    row["_shuffle_seed"] = seed
+                    row["_shuffle_key"] = hash((seed, str(row.get("path", ""))))
+            media.sort(key=operator.itemgetter("_shuffle_key"))
             return folders + media
 
         if sort_by == "name_desc":
@@ -2701,20 +4033,24 @@ class Bridge(QObject):
             media.sort(key=name_key, reverse=True)
             return folders + media
         if sort_by == "date_desc":
-            folders.sort(key=lambda row: (date_key(row), name_key(row)), reverse=True)
-            media.sort(key=lambda row: (date_key(row), name_key(row)), reverse=True)
+            date_key = operator.itemgetter("_date_key")
+            folders.sort(key=date_key, reverse=True)
+            media.sort(key=date_key, reverse=True)
             return folders + media
         if sort_by == "date_asc":
-            folders.sort(key=lambda row: (date_key(row), name_key(row)))
-            media.sort(key=lambda row: (date_key(row), name_key(row)))
+            date_key = operator.itemgetter("_date_key")
+            folders.sort(key=date_key)
+            media.sort(key=date_key)
             return folders + media
         if sort_by == "size_desc":
-            folders.sort(key=lambda row: (size_key(row), name_key(row)), reverse=True)
-            media.sort(key=lambda row: (size_key(row), name_key(row)), reverse=True)
+            size_key = operator.itemgetter("_size_key")
+            folders.sort(key=size_key, reverse=True)
+            media.sort(key=size_key, reverse=True)
             return folders + media
         if sort_by == "size_asc":
-            folders.sort(key=lambda row: (size_key(row), name_key(row)))
-            media.sort(key=lambda row: (size_key(row), name_key(row)))
+            size_key = operator.itemgetter("_size_key")
+            folders.sort(key=size_key)
+            media.sort(key=size_key)
             return folders + media
         folders.sort(key=name_key)
         media.sort(key=name_key)
@@ -2735,14 +4071,25 @@ class Bridge(QObject):
     def start_scan(self, folders: list, search_query: str = "") -> None:
         if not folders:
             return
-        scan_key = hashlib.sha1(",".join(sorted(str(folder) for folder in folders)).encode()).hexdigest()
+        scan_key = tuple(sorted(str(folder) for folder in folders))
         if self._last_full_scan_key == scan_key:
             return
-        self._scan_abort = True
-        def work():
+        with self._scan_lock:
+            if self._scan_cancel is not None:
+                self._scan_cancel.set()
+            cancel = threading.Event()
+            self._scan_cancel = cancel
+            self._scan_queue.put((list(folders), search_query, scan_key, cancel))
+            if self._scan_thread is None:
+                self._scan_thread = threading.Thread(target=self._scan_worker, daemon=True, name="media-scan")
+                self._scan_thread.start()
+
+    def _scan_worker(self) -> None:
+        while True:
+            folders, search_query, scan_key, cancel = self._scan_queue.get()
+            if cancel.is_set():
+                continue
             try:
-                time.sleep(0.1)
-                self._scan_abort = False
                 primary = folders[0] if folders else ""
                 self.scanStarted.emit(primary)
                 from app.mediamanager.db.connect import connect_db
@@ -2752,9 +4099,10 @@ class Bridge(QObject):
                     if not paths and folders:
                         self._get_reconciled_candidates(folders, "all", search_query)
                         paths = list(self._disk_cache.values())
-                    self._do_full_scan(paths, scan_conn, emit_progress=True)
-                    self._last_full_scan_key = scan_key
-                    self.scanFinished.emit(primary, len(self._get_reconciled_candidates(folders, "all", search_query)))
+                    self._do_full_scan(paths, scan_conn, emit_progress=True, cancel=cancel)
+                    if not cancel.is_set():
+                        self._last_full_scan_key = scan_key
+                        self.scanFinished.emit(primary, len(self._get_reconciled_candidates(folders, "all", search_query)))
                 finally:
                     scan_conn.close()
             except Exception as exc:
@@ -2762,11 +4110,10 @@ class Bridge(QObject):
                     self._log(f"Background scan failed: {exc}")
                 except Exception:
                     pass
-        threading.Thread(target=work, daemon=True).start()
 
     @Slot(list)
     def start_scan_paths(self, paths: list[str]) -> None:
-        clean_paths = [Path(path) for path in paths if str(path or "").strip()]
+        clean_paths = [str(path) for path in paths if str(path or "").strip()]
         if not clean_paths:
             return
         def work():
@@ -2774,7 +4121,7 @@ class Bridge(QObject):
                 from app.mediamanager.db.connect import connect_db
                 scan_conn = connect_db(str(self.db_path))
                 try:
-                    self._do_full_scan(clean_paths, scan_conn, emit_progress=False)
+                    self._do_full_scan(clean_paths, scan_conn, emit_progress=False, cancel=self._closing)
                 finally:
                     scan_conn.close()
             except Exception as exc:
@@ -2782,64 +4129,180 @@ class Bridge(QObject):
                     self._log(f"Page scan failed: {exc}")
                 except Exception:
                     pass
-        threading.Thread(target=work, daemon=True).start()
+        self._run_background(work)
+
+    _SCAN_CHUNK = 500
+
+    def _probe_scan_item(self, p: str, mtype: str, existing: dict | None) -> tuple | None:
+        """Gather the on-disk facts for one scan item; safe to run on a worker thread.
+
+        Returns None when the stored row is already current, otherwise
+        (media_type, fingerprint, width, height, duration_ms).
+        """
+        from app.mediamanager.utils.hashing import fast_fingerprint, is_fast_fingerprint
+        stat = os.stat(p)
+        # Rows still keyed by a full SHA-256 are re-fingerprinted even when unchanged.
+        if existing and is_fast_fingerprint(existing.get("content_hash")):
+            curr_mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).replace(microsecond=0).isoformat()
+            if existing["file_size"] == stat.st_size and existing.get("modified_time") == curr_mtime:
+                if existing.get("width") and existing.get("height"):
+                    return None
+
+        width, height, d_ms = None, None, None
+
+        if mtype == "image":
+            reader = QImageReader(str(p))
+            if reader.canRead():
+                sz = reader.size()
+                if sz.isValid():
+                    width, height = sz.width(), sz.height()
+
+            # Fallback for formats like AVIF that Qt can't read natively
+            if width is None or height is None:
+                w, h, _ = self._probe_video_size(str(p))
+                if w > 0 and h > 0:
+                    width, height = w, h
+        else:
+            w, h, _ = self._probe_video_size(str(p))
+            if w > 0 and h > 0:
+                width, height = w, h
+            # Capture duration for looping logic
+            d_s = self.get_video_duration_seconds(str(p))
+            if d_s > 0:
+                d_ms = int(d_s * 1000)
+        return mtype, fast_fingerprint(p), width, height, d_ms
+
+    def _do_full_scan(self, paths: list[str], conn, emit_progress: bool = True, cancel: threading.Event | None = None) -> int:
+        from app.mediamanager.db.media_repo import get_media_by_path, upsert_media_item, upsert_media_items_bulk
+        from app.mediamanager.metadata.persistence import inspect_and_persist_if_supported
+        image_exts = self._IMAGE_EXTS
+        total, count = len(paths), 0
+        aborted = cancel.is_set if cancel is not None else (lambda: False)
+
+        def probe(item: tuple[str, str, dict | None]):
+            if aborted():
+                return None
+            try:
+                return self._probe_scan_item(*item)
+            except Exception as exc:
+                return exc
+
+        # File I/O and ffprobe calls run on a small pool; SQLite stays on this thread
+        # and each chunk of upserts is written in one transaction.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+            for base in range(0, total, self._SCAN_CHUNK):
+                if aborted(): break
+                chunk = paths[base:base + self._SCAN_CHUNK]
+                # Media type is derived once per item and reused for probe and inspection.
+                mtypes = ["image" if self._lower_suffix(p) in image_exts else "video" for p in chunk]
+                existing_rows = [get_media_by_path(conn, p) for p in chunk]
+                probed = list(pool.map(probe, zip(chunk, mtypes, existing_rows)))
+                if aborted(): break
+
+                media_ids: list[int | None] = []
+                pending: list[tuple[int, tuple]] = []  # (index in chunk, upsert row)
+                for idx, (p, existing, result) in enumerate(zip(chunk, existing_rows, probed)):
+                    media_ids.append(existing["id"] if existing else None)
+                    if isinstance(result, Exception):
+                        media_ids[idx] = None
+                        try:
+                            self._log(f"Background scan item failed for {p}: {result}")
+                        except Exception:
+                            pass
+                    elif result is not None:
+                        pending.append((idx, (p, *result)))
+
+                if pending:
+                    try:
+                        ids = upsert_media_items_bulk(conn, [row for _, row in pending])
+                    except Exception:
+                        # One bad row rolls back the batch; redo it item by item.
+                        ids = []
+                        for _, row in pending:
+                            try:
+                                ids.append(upsert_media_item(conn, row[0], row[1], row[2], width=row[3], height=row[4], duration_ms=row[5]))
+                            except Exception as exc:
+                                ids.append(None)
+                                try:
+                                    self._log(f"Background scan item failed for {row[0]}: {exc}")
+                                except Exception:
+                                    pass
+                    for (idx, _), media_id in zip(pending, ids):
+                        media_ids[idx] = media_id
+
+                for offset, (p, mtype, media_id) in enumerate(zip(chunk, mtypes, media_ids)):
+                    if aborted(): break
+                    if emit_progress:
+                        i = base + offset
+                        self.scanProgress.emit(os.path.basename(p), int(((i + 1) / total) * 100) if total > 0 else 100)
+                    if media_id is None:
+                        continue
+                    try:
+                        inspect_and_persist_if_supported(conn, media_id, p, mtype)
+                        count += 1
+                    except Exception as exc:
+                        try:
+                            self._log(f"Background scan item failed for {p}: {exc}")
+                        except Exception:
+                            pass
+        # Rows were added/updated; listings reconciled before this are stale.
+        self._invalidate_reconcile_cache()
+        return count
+
+    def _poster_url(self, out: Path) -> str:
+        from app.mediamanager.utils.pathing import local_file_url
+        try:
+            mtime = int(out.stat().st_mtime_ns)
+        except Exception:
+            mtime = int(time.time() * 1000)
+        return f"{local_file_url(str(out))}?t={mtime}"
+
+    def _ffmpeg_jpeg_bytes(self, video_path: Path) -> bytes | None:
+        """Decode a poster frame straight to JPEG bytes on ffmpeg's stdout."""
+        ffmpeg = self._ffmpeg_bin()
+        if not ffmpeg:
+            return None
+        is_vid = video_path.suffix.lower() in self._VIDEO_EXTS
+        vf = "thumbnail,scale=min(640\\,iw):-2" if is_vid else "scale=min(640\\,iw):-2"
+        cmd = [ffmpeg, "-hide_banner", "-loglevel", "error", "-fflags", "+nobuffer", "-analyzeduration", "100k", "-probesize", "100k", "-threads", "1"]
+        if is_vid:
+            cmd += ["-ss", "0.5"]
+        cmd += ["-i", str(video_path), "-an", "-sn", "-dn", "-frames:v", "1", "-vf", vf, "-q:v", "4", "-f", "mjpeg", "pipe:1"]
+        try:
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                bufsize=8 * 1024 * 1024, **_WINDOWS_NO_CONSOLE_SUBPROCESS_KWARGS,
+            )
+            _track_proc(proc)
+            try:
+                data, _ = proc.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return None
+            finally:
+                _untrack_proc(proc)
+            return data if proc.returncode == 0 and data else None
+        except Exception:
+            return None
 
-    def _do_full_scan(self, paths: list[Path], conn, emit_progress: bool = True) -> int:
-        from app.mediamanager.db.media_repo import get_media_by_path, upsert_media_item
-        from app.mediamanager.metadata.persistence import inspect_and_persist_if_supported
-        from app.mediamanager.utils.hashing import calculate_file_hash
-        from datetime import datetime, timezone
-        image_exts = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".avif"}
-        total, count = len(paths), 0
-        for i, p in enumerate(paths):
-            if self._scan_abort: break
-            if emit_progress:
-                self.scanProgress.emit(p.name, int(((i + 1) / total) * 100) if total > 0 else 100)
+    def _persist_poster_async(self, out: Path, data: bytes) -> None:
+        def work() -> None:
+            tmp = None
             try:
-                stat = p.stat()
-                existing, skip = get_media_by_path(conn, str(p)), False
-                media_id = existing["id"] if existing else None
-                if existing:
-                    curr_mtime = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).replace(microsecond=0).isoformat()
-                    if existing["file_size"] == stat.st_size and existing.get("modified_time") == curr_mtime:
-                        if existing.get("width") and existing.get("height"):
-                            skip = True
-                
-                if not skip:
-                    width, height, d_ms = None, None, None
-                    mtype = "image" if p.suffix.lower() in image_exts else "video"
-                    
-                    if mtype == "image":
-                        reader = QImageReader(str(p))
-                        if reader.canRead():
-                            sz = reader.size()
-                            if sz.isValid():
-                                width, height = sz.width(), sz.height()
-                        
-                        # Fallback for formats like AVIF that Qt can't read natively
-                        if width is None or height is None:
-                            w, h, _ = self._probe_video_size(str(p))
-                            if w > 0 and h > 0:
-                                width, height = w, h
-                    else:
-                        w, h, _ = self._probe_video_size(str(p))
-                        if w > 0 and h > 0:
-                            width, height = w, h
-                        # Capture duration for looping logic
-                        d_s = self.get_video_duration_seconds(str(p))
-                        if d_s > 0:
-                            d_ms = int(d_s * 1000)
-                            
-                    media_id = upsert_media_item(conn, str(p), mtype, calculate_file_hash(p), width=width, height=height, duration_ms=d_ms)
-                if media_id is not None:
-                    inspect_and_persist_if_supported(conn, media_id, str(p), "image" if p.suffix.lower() in image_exts else "video")
-                count += 1
-            except Exception as exc:
-                try:
-                    self._log(f"Background scan item failed for {p}: {exc}")
-                except Exception:
-                    pass
-        return count
+                out.parent.mkdir(parents=True, exist_ok=True)
+                # Unique per writer: two cold requests for one video may race here.
+                with tempfile.NamedTemporaryFile(dir=out.parent, prefix=f"{out.stem}.", suffix=".tmp", delete=False) as f:
+                    tmp = Path(f.name)
+                    f.write(data)
+                os.replace(tmp, out)
+            except Exception:
+                if tmp is not None:
+                    try:
+                        tmp.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+        self._run_background(work)
 
     @Slot(str, result=str)
     def get_video_poster(self, video_path: str) -> str:
@@ -2847,20 +4310,108 @@ class Bridge(QObject):
             p = Path(video_path)
             if not p.exists() or not p.is_file():
                 return ""
+            out = self._video_poster_path(p)
+            if not out.exists() and not self._legacy_video_poster_path(p).exists():
+                # Cold poster: hand the bytes to the page directly and write the
+                # cache file in the background instead of write-then-reload.
+                jpg = self._ffmpeg_jpeg_bytes(p)
+                if jpg:
+                    self._persist_poster_async(out, jpg)
+                    return "data:image/jpeg;base64," + base64.b64encode(jpg).decode("ascii")
             out = self._ensure_video_poster(p)
             if out:
-                try:
-                    mtime = int(out.stat().st_mtime_ns)
-                except Exception:
-                    import time
-                    mtime = int(time.time() * 1000)
-                return f"{QUrl.fromLocalFile(str(out)).toString()}?t={mtime}"
+                return self._poster_url(out)
             return ""
         except Exception: return ""
 
+    _POSTER_BATCH = 32
+
+    @Slot(list)
+    def ensure_video_posters(self, video_paths: list[str]) -> None:
+        """Generate posters off the UI thread; each result arrives via videoPosterReady."""
+        clean = [str(p) for p in video_paths if str(p or "").strip()]
+        if not clean or self._closing.is_set():
+            return
+        if self._poster_pool is None:
+            # Each worker drives one ffmpeg with single-threaded decoders, so half
+            # the cores keeps the machine busy without oversubscribing it.
+            workers = max(2, (os.cpu_count() or 4) // 2)
+            self._poster_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="poster")
+        for base in range(0, len(clean), self._POSTER_BATCH):
+            self._poster_pool.submit(self._run_poster_batch, clean[base:base + self._POSTER_BATCH])
+
+    def _run_poster_batch(self, video_paths: list[str]) -> None:
+        video_exts = {".mp4", ".m4v", ".webm", ".mov", ".mkv", ".avi", ".wmv"}
+        try:
+            missing = [
+                Path(vp) for vp in video_paths
+                if Path(vp).suffix.lower() in video_exts
+                and not self._video_poster_path(Path(vp)).exists()
+                and not self._legacy_video_poster_path(Path(vp)).exists()
+                and Path(vp).is_file()
+            ]
+            ffmpeg = self._ffmpeg_bin()
+            if ffmpeg and len(missing) > 1:
+                # One ffmpeg process decodes a frame from every input, amortizing
+                # process start-up and codec init across the batch.
+                vf = "thumbnail,scale=min(640\\,iw):-2"
+                # Outputs go to temp names and are moved into place only after a
+                # clean exit, so a killed or failed run never leaves a truncated
+                # poster that later lookups would take as finished.
+                outputs = [self._video_poster_path(p) for p in missing]
+                temps = [out.with_name(f"{out.stem}.part{out.suffix}") for out in outputs]
+                cmd = [ffmpeg, "-y", "-hide_banner", "-loglevel", "error"]
+                for p in missing:
+                    cmd += ["-analyzeduration", "1M", "-probesize", "1M", "-threads", "1", "-ss", "0.5", "-i", str(p)]
+                for i, tmp in enumerate(temps):
+                    cmd += ["-map", f"{i}:v:0", "-frames:v", "1", "-vf", vf, "-q:v", "4", str(tmp)]
+                self._thumb_dir.mkdir(parents=True, exist_ok=True)
+                try:
+                    returncode, _ = _run_ffmpeg(cmd)
+                    if returncode == 0:
+                        for tmp, out in zip(temps, outputs):
+                            if tmp.is_file() and tmp.stat().st_size > 0:
+                                os.replace(tmp, out)
+                finally:
+                    for tmp in temps:
+                        try:
+                            tmp.unlink(missing_ok=True)
+                        except OSError:
+                            pass
+        except Exception as exc:
+            try:
+                self._log(f"Batched poster generation failed: {exc}")
+            except Exception:
+                pass
+        # Anything the batch could not produce falls back to the single-file path.
+        for vp in video_paths:
+            if self._closing.is_set():
+                return
+            url = ""
+            try:
+                p = Path(vp)
+                if p.is_file():
+                    out = self._ensure_video_poster(p)
+                    if out:
+                        url = self._poster_url(out)
+            except Exception:
+                pass
+            self.videoPosterReady.emit(vp, url)
+
     @Slot(result=dict)
     def get_tools_status(self) -> dict:
-        return {"ffmpeg": bool(self._ffmpeg_bin()), "ffmpeg_path": self._ffmpeg_bin() or "", "ffprobe": bool(self._ffprobe_bin()), "ffprobe_path": self._ffprobe_bin() or "", "thumb_dir": str(self._thumb_dir)}
+        ffmpeg, ffprobe = self._ffmpeg_bin(), self._ffprobe_bin()
+        return {"ffmpeg": bool(ffmpeg), "ffmpeg_path": ffmpeg or "", "ffprobe": bool(ffprobe), "ffprobe_path": ffprobe or "", "thumb_dir": str(self._thumb_dir)}
+
+    @Slot(result=dict)
+    def refresh_tools_status(self) -> dict:
+        """Forget pinned and missed tool lookups and resolve them again."""
+        self._tool_paths.clear()
+        _TOOL_HITS.clear()
+        _TOOL_MISSES.clear()
+        status = self.get_tools_status()
+        self.toolsStatusChanged.emit()
+        return status
 
 
 class NativeDragTooltip(QWidget):
@@ -2942,6 +4493,69 @@ class NativeSeparator(QWidget):
         painter.drawLine(0, y, self.width(), y)
 
 
+_UI_SCHEME = b"mmx"
+_UI_INDEX_URL = "mmx://ui/index.html"
+_UI_SCHEME_REGISTERED = False
+
+
+def _register_ui_scheme() -> None:
+    """Register mmx:// for the bundled web UI; Qt only allows this before QApplication exists.
+
+    LocalAccessAllowed keeps the page able to load the gallery's file:// media.
+    """
+    global _UI_SCHEME_REGISTERED
+    try:
+        scheme = QWebEngineUrlScheme(_UI_SCHEME)
+        scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+        scheme.setFlags(
+            QWebEngineUrlScheme.Flag.SecureScheme
+            | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        )
+        QWebEngineUrlScheme.registerScheme(scheme)
+        _UI_SCHEME_REGISTERED = True
+    except Exception:
+        _UI_SCHEME_REGISTERED = False
+
+
+class WebUiSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serve the web/ directory for mmx://ui/ out of memory.
+
+    Each asset is read from disk on its first request and kept as bytes, so
+    reloading the UI doesn't reopen index.html, app.js, style.css and the icons.
+    """
+
+    def __init__(self, root: Path, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._root = root
+        self._files: dict[str, tuple[bytes, bytes]] = {}  # rel path -> (mime, data)
+
+    def _asset(self, rel: str) -> tuple[bytes, bytes] | None:
+        cached = self._files.get(rel)
+        if cached is None:
+            try:
+                data = (self._root / rel).read_bytes()
+            except OSError:
+                return None
+            mime = mimetypes.guess_type(rel)[0] or "application/octet-stream"
+            cached = self._files[rel] = (mime.encode("ascii"), data)
+        return cached
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+        rel = posixpath.normpath(job.requestUrl().path()).lstrip("/")
+        if not rel or rel == "." or rel.startswith(".."):
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        asset = self._asset(rel)
+        if asset is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        mime, data = asset
+        buf = QBuffer(job)
+        buf.setData(data)
+        buf.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(mime, buf)
+
+
 class GalleryView(QWebEngineView):
     """Gallery view that accepts drag and drop from external file explorers."""
     def __init__(self, parent=None):
@@ -2954,13 +4568,9 @@ class GalleryView(QWebEngineView):
         if not bridge:
             return
 
-        script = (
-            "(() => {"
-            f"  const el = document.elementFromPoint({int(x)}, {int(y)});"
-            "  const card = el && el.closest ? el.closest('.folder-card[data-path]') : null;"
-            "  return card ? card.getAttribute('data-path') : '';"
-            "})()"
-        )
+        # Runs on every drag move; the lookup itself lives in app.js so only a
+        # one-line call is parsed per event.
+        script = f"window.__mmx_folderAt ? window.__mmx_folderAt({int(x)}, {int(y)}) : ''"
 
         def _apply_target(target_path: str) -> None:
             try:
@@ -3091,11 +4701,41 @@ class GalleryView(QWebEngineView):
         super().dropEvent(event)
 
 
+_FAVICON_CACHE: dict[bool, QIcon | None] = {}
+
+
+def _favicon(is_light: bool) -> QIcon | None:
+    """Window icon for the light/dark theme, loaded once per variant (None if missing)."""
+    if is_light not in _FAVICON_CACHE:
+        icon_path = Path(__file__).with_name("web") / ("favicon-black.png" if is_light else "favicon.png")
+        _FAVICON_CACHE[is_light] = QIcon(str(icon_path)) if icon_path.exists() else None
+    return _FAVICON_CACHE[is_light]
+
+
+_SIZE_UNITS = ((1 << 30, "GB"), (1 << 20, "MB"))
+
+
+def _format_file_size(size: int) -> str:
+    """Human-readable size in integer math: one decimal for MB/GB, whole KB, else bytes."""
+    for threshold, unit in _SIZE_UNITS:
+        if size >= threshold:
+            tenths = (size * 10 + threshold // 2) // threshold
+            return f"{tenths // 10}.{tenths % 10} {unit}"
+    if size >= 1024:
+        return f"{(size + 512) // 1024} KB"
+    return f"{size} B"
+
+
 class MainWindow(QMainWindow):
     _DEFAULT_LEFT_PANEL_WIDTH = 200
     _DEFAULT_CENTER_WIDTH = 700
     _DEFAULT_RIGHT_PANEL_WIDTH = 300
     _DEFAULT_BOTTOM_PANEL_HEIGHT = 220
+    _IMAGE_SIZE_CACHE_MAX = 512
+    _FILE_SIZE_CACHE_MAX = 4096
+
+    _imageSizeProbed = Signal(int, int, int)  # token, width, height (worker -> GUI thread)
+    _dbMetadataFetched = Signal(int, object)  # token, get_media_metadata() dict (worker -> GUI thread)
 
     def __init__(self) -> None:
         super().__init__()
@@ -3125,6 +4765,10 @@ class MainWindow(QMainWindow):
         self.bridge.navigateUpRequested.connect(self._navigate_up)
         self.bridge.refreshFolderRequested.connect(self._refresh_current_folder)
         self.bridge.accentColorChanged.connect(self._on_accent_changed)
+        self.bridge.fileOpFinished.connect(self._on_file_op_finished)
+        self.bridge.toolsStatusChanged.connect(self._on_tools_status_changed)
+        self.bridge.mediaBundleSaved.connect(self._on_media_bundle_saved)
+        self._about_text: str | None = None
         self._current_accent = Theme.ACCENT_DEFAULT
         self._folder_history: list[str] = []
         self._folder_history_index: int = -1
@@ -3132,6 +4776,39 @@ class MainWindow(QMainWindow):
         self._tree_root_path: str = ""
         self._pending_tree_sync_path: str = ""
         self._pending_tree_reroot: bool = False
+        # Image resolution for the metadata panel is read on a worker; the token
+        # drops results for a selection the user has already moved past.
+        self._probe_token = 0
+        self._image_size_cache: dict[tuple[str, int, int], tuple[int, int]] = {}
+        self._imageSizeProbed.connect(self._on_image_size_probed)
+        # Same token scheme for the DB-backed editors; while a fetch is pending the
+        # editors are blank, so saves are held off until it lands.
+        self._meta_token = 0
+        self._meta_pending = False
+        self._meta_save_queued = False  # Save pressed while pending; runs when the fetch lands
+        self._dbMetadataFetched.connect(self._on_db_metadata_fetched)
+        # Set by user edits to the tags field; the tag soft-save only fires when dirty.
+        self._meta_dirty = False
+        self._meta_save_timer = QTimer(self)
+        self._meta_save_timer.setSingleShot(True)
+        self._meta_save_timer.setInterval(250)
+        self._meta_save_timer.timeout.connect(self._save_native_metadata)
+        # Formatted "File Size" per path; flushed whenever the app changes files.
+        self._file_size_cache: dict[str, str] = {}
+
+        self._reselect_timer = QTimer(self)
+        self._reselect_timer.setSingleShot(True)
+        self._reselect_timer.setInterval(50)
+        self._reselect_timer.timeout.connect(self._reselect_current_card)
+
+        # Splitter sizes are persisted once a drag settles, not per pixel, and
+        # only if a splitter was actually dragged since the last save.
+        self._splitter_dirty = False
+        self._splitter_save_timer = QTimer(self)
+        self._splitter_save_timer.setSingleShot(True)
+        self._splitter_save_timer.setInterval(250)
+        self._splitter_save_timer.timeout.connect(self._save_splitter_state)
+
         self._tree_sync_timer = QTimer(self)
         self._tree_sync_timer.setSingleShot(True)
         self._tree_sync_timer.timeout.connect(self._apply_pending_tree_sync)
@@ -3148,8 +4825,8 @@ class MainWindow(QMainWindow):
         for m in (self.menuBar().findChildren(QMenu)):
              m.aboutToShow.connect(self._dismiss_web_menus)
              
-        # Global listener to dismiss web menus when any native part of the app is clicked
-        QApplication.instance().installEventFilter(self)
+        # The listener that dismisses web menus when a native part of the window is
+        # clicked is installed on the window handle in showEvent, once it exists.
 
         # Update connections
         self.bridge.updateAvailable.connect(self._on_update_available)
@@ -3241,19 +4918,19 @@ class MainWindow(QMainWindow):
 
         self.act_toggle_left_panel = QAction("Show Left Panel", self)
         self.act_toggle_left_panel.setCheckable(True)
-        self.act_toggle_left_panel.setChecked(bool(self.bridge.settings.value("ui/show_left_panel", True, type=bool)))
+        self.act_toggle_left_panel.setChecked(bool(self.bridge._cached("ui/show_left_panel", True, bool)))
         self.act_toggle_left_panel.triggered.connect(lambda checked=False: self._toggle_panel_setting("ui/show_left_panel"))
         view_menu.addAction(self.act_toggle_left_panel)
 
         self.act_toggle_bottom_panel = QAction("Show Bottom Panel", self)
         self.act_toggle_bottom_panel.setCheckable(True)
-        self.act_toggle_bottom_panel.setChecked(bool(self.bridge.settings.value("ui/show_bottom_panel", True, type=bool)))
+        self.act_toggle_bottom_panel.setChecked(bool(self.bridge._cached("ui/show_bottom_panel", True, bool)))
         self.act_toggle_bottom_panel.triggered.connect(lambda checked=False: self._toggle_panel_setting("ui/show_bottom_panel"))
         view_menu.addAction(self.act_toggle_bottom_panel)
 
         self.act_toggle_right_panel = QAction("Show Right Panel", self)
         self.act_toggle_right_panel.setCheckable(True)
-        self.act_toggle_right_panel.setChecked(bool(self.bridge.settings.value("ui/show_right_panel", True, type=bool)))
+        self.act_toggle_right_panel.setChecked(bool(self.bridge._cached("ui/show_right_panel", True, bool)))
         self.act_toggle_right_panel.triggered.connect(lambda checked=False: self._toggle_panel_setting("ui/show_right_panel"))
         view_menu.addAction(self.act_toggle_right_panel)
 
@@ -3384,8 +5061,7 @@ class MainWindow(QMainWindow):
         msg = f"Are you sure you want to delete {count} items?" if count > 1 else f"Are you sure you want to delete '{Path(paths[0]).name}'?"
         ret = QMessageBox.question(self, "Confirm Delete", msg, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if ret == QMessageBox.StandardButton.Yes:
-            for p in paths:
-                self.bridge.delete_path(p)
+            self.bridge.delete_paths_async(paths)
 
     def _on_rename_shortcut(self) -> None:
         if self._is_input_focused(): return
@@ -3395,7 +5071,7 @@ class MainWindow(QMainWindow):
                 self._on_tree_context_menu_rename(idx)
         else:
             # Tell web gallery to rename its selected item (usually just the first if multiple)
-            self.web.page().runJavaScript("if(window.triggerRename) window.triggerRename();")
+            self._web_command("triggerRename")
 
     def _on_select_all_shortcut(self) -> None:
         if self._is_input_focused(): return
@@ -3403,7 +5079,7 @@ class MainWindow(QMainWindow):
             # Standard tree Select All? usually doesn't exist but we could select all under parent
             pass
         else:
-            self.web.page().runJavaScript("if(window.selectAll) window.selectAll();")
+            self._web_command("selectAll")
 
     def _build_layout(self) -> None:
         try:
@@ -3448,20 +5124,26 @@ class MainWindow(QMainWindow):
             default_root = Path.home()
 
         self.bridge._log(f"Tree: Initializing with root={default_root}")
-        self.fs_model = QFileSystemModel(self)
-        self.fs_model.setFilter(QDir.Filter.AllDirs | QDir.Filter.NoDotAndDotDot | QDir.Filter.Drives)
-        self.fs_model.setRootPath(str(default_root))
+        self.fs_model = LazyFsModel(self)
 
         # Use a proxy model to show the root folder itself at the top.
         self.proxy_model = RootFilterProxyModel(self.bridge, self)
         self.proxy_model.setSourceModel(self.fs_model)
         self.proxy_model.setRootPath(str(default_root))
+        # Filter re-evaluations are coalesced: hiding a folder from the tree, for
+        # example, requests one here and again via fileOpFinished.
+        self._invalidate_timer = QTimer(self)
+        self._invalidate_timer.setSingleShot(True)
+        self._invalidate_timer.setInterval(80)
+        self._invalidate_timer.timeout.connect(self.proxy_model.invalidateFilter)
 
         self.tree = FolderTreeView()
         self.tree.setModel(self.proxy_model)
+        # The model doesn't watch the disk; an expand picks up folders changed since.
+        self.tree.expanded.connect(lambda idx: self.fs_model.revalidate(self.proxy_model.mapToSource(idx)))
         
-        # Set the tree root to the PARENT of our desired root folder
-        # root_parent needs to be loaded by fs_model for visibility.
+        # Set the tree root to the PARENT of our desired root folder.
+        # setRootPath lists the folders on the way, so the index is valid at once.
         root_parent = default_root.parent
         self.bridge._log(f"Tree: Setting root index to parent={root_parent}")
         parent_idx = self.fs_model.setRootPath(str(root_parent))
@@ -3475,16 +5157,15 @@ class MainWindow(QMainWindow):
         self.bridge._log(f"Tree: Root index valid={root_idx.isValid()}")
         if root_idx.isValid():
             self.tree.expand(root_idx)
-        else:
-            # If still invalid, it might be because the model hasn't loaded the parent yet.
-            # We'll rely on directoryLoaded to fix this.
-            self.bridge._log(f"Tree: Root index (late load pending) for {default_root}")
         
         self.tree.setHeaderHidden(True)
-        self.tree.setAnimated(True)
+        # No expand animation, and one row height for every row so the view
+        # doesn't measure each row of a large folder.
+        self.tree.setAnimated(False)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.tree.setIndentation(14)
         self.tree.setExpandsOnDoubleClick(True)
-        from PySide6.QtWidgets import QAbstractItemView
         self.tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
 
         # Hide columns: keep only name (indices are on the proxy model)
@@ -3495,9 +5176,6 @@ class MainWindow(QMainWindow):
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._on_tree_context_menu)
 
-        # Connect to directoryLoaded so we can refresh icons/expansion once ready
-        self.fs_model.directoryLoaded.connect(self._on_directory_loaded)
-
         self.left_sections_splitter = CustomSplitter(Qt.Orientation.Vertical)
         self.left_sections_splitter.setObjectName("leftSectionsSplitter")
         self.left_sections_splitter.setChildrenCollapsible(False)
@@ -3535,7 +5213,7 @@ class MainWindow(QMainWindow):
             self.left_sections_splitter.restoreState(left_sections_state)
         else:
             self.left_sections_splitter.setSizes([430, 170])
-        self.left_sections_splitter.splitterMoved.connect(lambda *args: self._save_splitter_state())
+        self.left_sections_splitter.splitterMoved.connect(self._on_left_sections_splitter_moved)
 
         left_layout.addWidget(self.left_sections_splitter, 1)
 
@@ -3546,7 +5224,7 @@ class MainWindow(QMainWindow):
 
         # Apply UI flags from settings
         try:
-            show_left = bool(self.bridge.settings.value("ui/show_left_panel", True, type=bool))
+            show_left = bool(self.bridge._cached("ui/show_left_panel", True, bool))
             self._apply_ui_flag("ui.show_left_panel", show_left)
         except Exception:
             pass
@@ -3567,7 +5245,7 @@ class MainWindow(QMainWindow):
         center_layout = QVBoxLayout(center)
         center_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.web = GalleryView(self)
+        self.web = _take_warm_web(self) or GalleryView(self)
         center_layout.addWidget(self.web)
 
         # Native loading overlay shown while the WebEngine page itself is loading.
@@ -3902,6 +5580,7 @@ class MainWindow(QMainWindow):
         self.meta_tags = QLineEdit()
         self.meta_tags.setPlaceholderText("tag1, tag2...")
         self.meta_tags.editingFinished.connect(self._save_native_tags)
+        self.meta_tags.textEdited.connect(self._mark_metadata_dirty)
 
         self.lbl_ai_prompt_cap = QLabel("AI Prompt:")
         self.lbl_ai_prompt_cap.setObjectName("metaAIPromptCaption")
@@ -4050,11 +5729,25 @@ class MainWindow(QMainWindow):
         # Web loading signals (with minimum on-screen time to avoid flashing)
         self._web_loading_shown_ms: int | None = None
         self._web_loading_min_ms = 1000
-        self.web.loadStarted.connect(lambda: self._set_web_loading(True))
+        self._web_loading_hide_timer = QTimer(self)
+        self._web_loading_hide_timer.setSingleShot(True)
+        self._web_loading_hide_timer.timeout.connect(self._finish_web_loading)
+        self.web.loadStarted.connect(self._on_web_load_started)
         self.web.loadProgress.connect(self._on_web_load_progress)
-        self.web.loadFinished.connect(lambda _ok: self._set_web_loading(False))
+        self.web.loadFinished.connect(self._on_web_load_finished)
 
-        self.web.setUrl(QUrl.fromLocalFile(str(index_path.resolve())))
+        # Loaded from showEvent so the native shell paints before Chromium
+        # starts parsing and running the gallery's JS. Served from memory over
+        # mmx:// when the scheme could be registered, else straight from disk.
+        self._pending_index_url = QUrl.fromLocalFile(str(index_path.resolve()))
+        if _UI_SCHEME_REGISTERED:
+            try:
+                self._web_ui_handler = WebUiSchemeHandler(index_path.parent, self)
+                self.web.page().profile().installUrlSchemeHandler(_UI_SCHEME, self._web_ui_handler)
+                self._pending_index_url = QUrl(_UI_INDEX_URL)
+            except Exception:
+                pass
+        self._initial_load_started = False
 
         self.bottom_panel = QWidget()
         self.bottom_panel.setObjectName("bottomPanel")
@@ -4089,8 +5782,8 @@ class MainWindow(QMainWindow):
         self._restore_main_splitter_sizes()
         self._restore_center_splitter_sizes()
 
-        splitter.splitterMoved.connect(lambda *args: self._on_splitter_moved())
-        center_splitter.splitterMoved.connect(lambda *args: self._on_splitter_moved())
+        splitter.splitterMoved.connect(self._on_splitter_moved)
+        center_splitter.splitterMoved.connect(self._on_splitter_moved)
 
         self.setCentralWidget(splitter)
 
@@ -4099,12 +5792,12 @@ class MainWindow(QMainWindow):
 
         # Apply right panel flag from settings
         try:
-            show_right = bool(self.bridge.settings.value("ui/show_right_panel", True, type=bool))
+            show_right = bool(self.bridge._cached("ui/show_right_panel", True, bool))
             self._apply_ui_flag("ui.show_right_panel", show_right)
         except Exception:
             pass
         try:
-            show_bottom = bool(self.bridge.settings.value("ui/show_bottom_panel", True, type=bool))
+            show_bottom = bool(self.bridge._cached("ui/show_bottom_panel", True, bool))
             self._apply_ui_flag("ui.show_bottom_panel", show_bottom)
         except Exception:
             pass
@@ -4182,8 +5875,8 @@ class MainWindow(QMainWindow):
 
     def _restore_main_splitter_sizes(self) -> None:
         try:
-            show_left = bool(self.bridge.settings.value("ui/show_left_panel", True, type=bool))
-            show_right = bool(self.bridge.settings.value("ui/show_right_panel", True, type=bool))
+            show_left = bool(self.bridge._cached("ui/show_left_panel", True, bool))
+            show_right = bool(self.bridge._cached("ui/show_right_panel", True, bool))
             left_width = self._get_saved_panel_width("ui/left_panel_width", self._DEFAULT_LEFT_PANEL_WIDTH)
             right_width = self._get_saved_panel_width("ui/right_panel_width", self._DEFAULT_RIGHT_PANEL_WIDTH)
             sizes = [
@@ -4197,7 +5890,7 @@ class MainWindow(QMainWindow):
 
     def _restore_center_splitter_sizes(self) -> None:
         try:
-            show_bottom = bool(self.bridge.settings.value("ui/show_bottom_panel", True, type=bool))
+            show_bottom = bool(self.bridge._cached("ui/show_bottom_panel", True, bool))
             bottom_height = self._get_saved_panel_height("ui/bottom_panel_height", self._DEFAULT_BOTTOM_PANEL_HEIGHT)
             sizes = [
                 self._DEFAULT_CENTER_WIDTH,
@@ -4442,41 +6135,23 @@ class MainWindow(QMainWindow):
             return
         self._navigate_to_folder(current_path, record_history=False, refresh=True)
 
-    def _on_directory_loaded(self, path: str) -> None:
-        """Triggered when QFileSystemModel finishes loading a directory's contents."""
-        self.bridge._log(f"Tree: Directory loaded: {path}")
-        self.proxy_model.invalidate()
-        
-        # If the tree's root index is still invalid, try to fix it now
-        if not self.tree.rootIndex().isValid():
-            root_path_str = self.proxy_model._root_path
-            root_parent = Path(root_path_str).parent
-            parent_idx = self.fs_model.index(str(root_parent))
-            
-            self.bridge._log(f"Tree: Late loading check - parent_idx valid={parent_idx.isValid()} for {root_parent}")
-            
-            if parent_idx.isValid():
-                proxy_idx = self.proxy_model.mapFromSource(parent_idx)
-                if proxy_idx.isValid():
-                    self.bridge._log(f"Tree: Setting root index from directoryLoaded (late load success) for {root_parent}")
-                    self.tree.setRootIndex(proxy_idx)
-                else:
-                    self.bridge._log(f"Tree: Proxy index still invalid for {root_parent}")
-        
-        # Also ensure the actual root is expanded
-        root_path_str = self.proxy_model._root_path
-        root_idx = self.proxy_model.mapFromSource(self.fs_model.index(root_path_str))
-        if root_idx.isValid():
-            if not self.tree.isExpanded(root_idx):
-                self.bridge._log(f"Tree: Expanding root index for {root_path_str}")
-                self.tree.expand(root_idx)
-        else:
-            # Try with normalized path if exact match fails
-            norm_root = root_path_str.rstrip("/")
-            root_idx = self.proxy_model.mapFromSource(self.fs_model.index(norm_root))
-            if root_idx.isValid() and not self.tree.isExpanded(root_idx):
-                self.bridge._log(f"Tree: Expanding root index (normalized) for {norm_root}")
-                self.tree.expand(root_idx)
+    def _on_file_op_finished(self, op: str, ok: bool, old_path: str, new_path: str) -> None:
+        if ok:
+            self._file_size_cache.clear()
+        # The tree caches its hidden-path filter decisions; drop them when the web
+        # gallery hides or unhides something.
+        if ok and op in ("hide", "unhide") and hasattr(self, "_invalidate_timer"):
+            self._invalidate_timer.start()
+        # The folder tree only lists a folder when it is expanded; re-list the
+        # already-expanded folders an operation touched.
+        if ok and hasattr(self, "fs_model"):
+            if op in ("move", "paste"):
+                self.fs_model.refresh_loaded()  # sources aren't reported, only the target
+            elif op in ("rename", "delete", "copy"):
+                for p in {old_path, new_path} - {""}:
+                    self.fs_model.refresh(str(Path(p).parent))
+                    if op == "copy":
+                        self.fs_model.refresh(p)
 
     def _on_tree_selection(self, *_args) -> None:
         if self._suppress_tree_selection_history:
@@ -4557,7 +6232,7 @@ class MainWindow(QMainWindow):
 
     def _on_collections_context_menu(self, pos: QPoint) -> None:
         item = self.collections_list.itemAt(pos)
-        menu = QMenu(self)
+        menu = self._new_context_menu()
         act_new = menu.addAction("New Collection...")
         act_rename = None
         act_delete = None
@@ -4660,8 +6335,8 @@ class MainWindow(QMainWindow):
                 else:
                     self._clear_metadata_panel()
             elif key == "gallery.show_hidden":
-                if hasattr(self, "proxy_model"):
-                    self.proxy_model.invalidateFilter()
+                if hasattr(self, "_invalidate_timer"):
+                    self._invalidate_timer.start()
             if key == "ui.show_left_panel" and hasattr(self, "act_toggle_left_panel"):
                 self.act_toggle_left_panel.setChecked(bool(value))
         except Exception:
@@ -4944,6 +6619,7 @@ class MainWindow(QMainWindow):
         if new_name == p.name:
             return
         new_path = p.parent / new_name
+        self._file_size_cache.pop(self._current_path, None)
         try:
             self.bridge.rename_path_async(self._current_path, new_name)
             self._current_path = str(new_path)
@@ -4961,41 +6637,47 @@ class MainWindow(QMainWindow):
             return
 
         is_bulk = len(paths) > 1
+        if not is_bulk and self._meta_pending:
+            # The editors haven't been filled from the DB yet; saving now would
+            # overwrite the stored description/notes/tags with blanks. Save once
+            # the fetch lands instead.
+            self._meta_save_queued = True
+            self.meta_status_lbl.setText("Saving…")
+            return
         tags_str = self.meta_tags.text()
         tags = self._normalize_tag_list(tags_str)
 
+        self._meta_save_timer.stop()
+        self._meta_dirty = False
         if not is_bulk:
             path = paths[0]
             # --- Rename if the filename was changed ---
+            # _current_path follows the rename in _on_media_bundle_saved, once it happened.
             new_name = self.meta_filename_edit.text().strip()
-            p = Path(path)
-            if new_name and new_name != p.name:
-                new_path = p.parent / new_name
-                try:
-                    self.bridge.rename_path_async(path, new_name)
-                    path = str(new_path)
-                    self._current_path = path
-                    self._current_paths = [path]
-                except Exception:
-                    pass
+            if new_name == Path(path).name:
+                new_name = ""
 
             # --- Save metadata fields ---
-            desc = self.meta_desc.toPlainText()
-            notes = self.meta_notes.toPlainText()
-            
-            ai_prompt = self.meta_ai_prompt_edit.toPlainText()
-            ai_neg_prompt = self.meta_ai_negative_prompt_edit.toPlainText()
-            ai_params = self.meta_ai_params_edit.toPlainText()
-            exif_date_taken = self._normalize_metadata_datetime(self.meta_exif_date_taken_edit.text())
-            metadata_date = self._normalize_metadata_datetime(self.meta_metadata_date_edit.text())
-
+            # Save Changes is DB-only. Embedded fields are file-only and should not be persisted here.
+            # Rename + metadata + dates + tags run as one worker job / one DB transaction.
             try:
-                # Save Changes is DB-only. Embedded fields are file-only and should not be persisted here.
-                self.bridge.update_media_metadata(path, "", desc, notes, "", "", ai_prompt, ai_neg_prompt, ai_params)
-                self.bridge.update_media_dates(path, exif_date_taken, metadata_date)
-                self.bridge.set_media_tags(path, tags)
+                self.bridge.save_media_bundle_async(
+                    path,
+                    new_name,
+                    self.meta_desc.toPlainText(),
+                    self.meta_notes.toPlainText(),
+                    self.meta_ai_prompt_edit.toPlainText(),
+                    self.meta_ai_negative_prompt_edit.toPlainText(),
+                    self.meta_ai_params_edit.toPlainText(),
+                    self._normalize_metadata_datetime(self.meta_exif_date_taken_edit.text()),
+                    self._normalize_metadata_datetime(self.meta_metadata_date_edit.text()),
+                    tags,
+                )
             except Exception:
-                pass
+                self._show_meta_save_status(False)
+                return
+            # Confirmed (or reported as failed) by _on_media_bundle_saved.
+            self.meta_status_lbl.setText("Saving…")
         else:
             for p in paths:
                 try:
@@ -5003,11 +6685,23 @@ class MainWindow(QMainWindow):
                     self.bridge.set_media_tags(p, self._merge_tag_lists(existing, tags))
                 except Exception:
                     pass
+            self._show_meta_save_status(True, "Tags")
 
-        # --- Show confirmation then auto-clear after 3s ---
-        self.meta_status_lbl.setText(f"✓ {'Tags' if is_bulk else 'Changes'} saved")
+    def _show_meta_save_status(self, ok: bool, what: str = "Changes") -> None:
+        """Show the save confirmation (or failure) under the editors, then auto-clear after 3s."""
+        self.meta_status_lbl.setText(f"✓ {what} saved" if ok else f"× {what} not saved")
         QTimer.singleShot(3000, lambda: self.meta_status_lbl.setText(""))
 
+    @Slot(str, str, bool)
+    def _on_media_bundle_saved(self, old_path: str, new_path: str, ok: bool) -> None:
+        if new_path and new_path != old_path:
+            self._file_size_cache.pop(old_path, None)
+            if self._current_path == old_path:
+                self._current_path = new_path
+                self._current_paths = [new_path]
+        if self._current_path in (old_path, new_path):
+            self._show_meta_save_status(ok)
+
     def _harvest_universal_metadata(self, img) -> dict:
         """Systematically extract tags/comments from XMP, IPTC, and all EXIF IFDs."""
         from PIL import ExifTags, IptcImagePlugin
@@ -5400,7 +7094,6 @@ class MainWindow(QMainWindow):
         """Parse a bracketed-header comment string into a dict of sections.
         Recognizes [Description], [Comments], [AI Prompt], [AI Negative Prompt], [AI Params], [Notes].
         If no headers are found, treats entire text as [Comments]."""
-        import re
         result = {"description": "", "comments": "", "ai_prompt": "", "ai_negative_prompt": "", "ai_params": "", "notes": ""}
         pattern = re.compile(r'^\[([^\]]+)\]\s*$', re.MULTILINE)
         parts = pattern.split(text)
@@ -5557,6 +7250,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def _save_to_exif_cmd(self) -> None:
         """Embed tags and comments from the 'Embedded' UI fields INTO the file."""
+        self._file_size_cache.clear()  # rewriting the file changes its size
         paths = getattr(self, "_current_paths", [])
         if len(paths) > 1:
             self._embed_bulk_tags_to_files(paths, self._normalize_tag_list(self.meta_tags.text()))
@@ -5572,7 +7266,6 @@ class MainWindow(QMainWindow):
 
         try:
             from PIL import Image, PngImagePlugin
-            import tempfile, os
 
             # Isolation Rule: Only use the 'Embedded' UI boxes for actual embedding
             tags_raw = self.meta_embedded_tags_edit.text().strip()
@@ -5752,7 +7445,6 @@ class MainWindow(QMainWindow):
         if not paths:
             return
 
-        from PySide6.QtWidgets import QMessageBox
         msg = f"Are you sure you want to remove ALL tags from {len(paths)} selected files?"
         ret = QMessageBox.warning(
             self, "Clear All Tags", msg, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
@@ -5773,17 +7465,27 @@ class MainWindow(QMainWindow):
         self.meta_tags.setText("")
 
     def _save_native_tags(self) -> None:
-        # We delegate to the main metadata saver to avoid logic duplication
-        # (Editing tags triggers a soft save).
-        self._save_native_metadata()
+        # Editing tags triggers a soft save; it is deferred so that clicking Save
+        # right after leaving the field results in one save, not two.
+        if self._meta_dirty:
+            self._meta_save_timer.start()
+
+    def _mark_metadata_dirty(self, *_args) -> None:
+        self._meta_dirty = True
 
     def _show_metadata_for_path(self, paths: list[str]) -> None:
+        # A tag soft-save still waiting on its timer belongs to the outgoing selection.
+        if self._meta_save_timer.isActive():
+            self._save_native_metadata()
         # Ignore empty lists (e.g. from background clicks that deselect cards).
         if not paths:
+            self._meta_token += 1
+            self._meta_pending = False
             self._clear_metadata_panel()
             return
 
         is_bulk = len(paths) > 1
+        self._meta_dirty = False
         self._set_metadata_empty_state(False)
         self._current_paths = paths # Store list for bulk save
         self._current_path = paths[0] if not is_bulk else None
@@ -5986,80 +7688,26 @@ class MainWindow(QMainWindow):
         self.meta_tags.setVisible(not is_bulk and ("tags" in active_fields and self._is_metadata_enabled_for_kind(metadata_kind, "tags", True)))
         self.btn_clear_bulk_tags.setVisible(is_bulk)
         
-        self.meta_filename_edit.blockSignals(True)
-        self.meta_desc.blockSignals(True)
-        self.meta_tags.blockSignals(True)
-        self.meta_notes.blockSignals(True)
-        self.meta_exif_date_taken_edit.blockSignals(True)
-        self.meta_metadata_date_edit.blockSignals(True)
+        # Released when this method returns.
+        _blockers = [QSignalBlocker(w) for w in self._db_metadata_editors()]
 
         if not is_bulk:
             path = paths[0]
             p = Path(path)
             self.meta_filename_edit.setText(p.name)
             self.meta_path_lbl.setText(f"Folder: {p.parent}")
-            data = {}
-
-            # 1. Database Metadata (Load FIRST)
-            try:
-                data = self.bridge.get_media_metadata(path)
-                self.meta_desc.setPlainText(data.get("description", ""))
-                self.meta_notes.setPlainText(data.get("notes", ""))
-                
-                db_prompt = data.get('ai_prompt', '')
-                if db_prompt: self.meta_ai_prompt_edit.setPlainText(db_prompt)
-
-                db_neg_prompt = data.get('ai_negative_prompt', '')
-                if db_neg_prompt: self.meta_ai_negative_prompt_edit.setPlainText(db_neg_prompt)
-                
-                db_params = data.get('ai_params', '')
-                if db_params: self.meta_ai_params_edit.setPlainText(db_params)
-
-                self.meta_ai_status_edit.setText(data.get("ai_status_summary", ""))
-                self.meta_ai_source_edit.setPlainText(data.get("ai_source_summary", ""))
-                self.meta_ai_families_edit.setText(data.get("ai_families_summary", ""))
-                self.meta_ai_detection_reasons_edit.setPlainText(data.get("ai_detection_reasons_summary", ""))
-                self.meta_ai_loras_edit.setPlainText(data.get("ai_loras_summary", ""))
-                self.meta_ai_model_edit.setText(data.get("ai_model_summary", ""))
-                self.meta_ai_checkpoint_edit.setText(data.get("ai_checkpoint_summary", ""))
-                self.meta_ai_sampler_edit.setText(data.get("ai_sampler_summary", ""))
-                self.meta_ai_scheduler_edit.setText(data.get("ai_scheduler_summary", ""))
-                self.meta_ai_cfg_edit.setText(data.get("ai_cfg_summary", ""))
-                self.meta_ai_steps_edit.setText(data.get("ai_steps_summary", ""))
-                self.meta_ai_seed_edit.setText(data.get("ai_seed_summary", ""))
-                self.meta_ai_upscaler_edit.setText(data.get("ai_upscaler_summary", ""))
-                self.meta_ai_denoise_edit.setText(data.get("ai_denoise_summary", ""))
-                self.meta_ai_workflows_edit.setPlainText(data.get("ai_workflows_summary", ""))
-                self.meta_ai_provenance_edit.setPlainText(data.get("ai_provenance_summary", ""))
-                self.meta_ai_character_cards_edit.setPlainText(data.get("ai_character_cards_summary", ""))
-                self.meta_ai_raw_paths_edit.setPlainText(data.get("ai_raw_paths_summary", ""))
-                
-                self.meta_tags.setText(", ".join(data.get("tags", [])))
-                exif_date_taken = self._format_editable_datetime(data.get("exif_date_taken"))
-                if exif_date_taken:
-                    self.meta_exif_date_taken_edit.setText(exif_date_taken)
-                metadata_date = self._format_editable_datetime(data.get("metadata_date"))
-                if metadata_date:
-                    self.meta_metadata_date_edit.setText(metadata_date)
-                file_created_date = self._format_sidebar_datetime(data.get("file_created_time"))
-                if file_created_date:
-                    self.meta_file_created_date_lbl.setText(f"Date Created: {file_created_date}")
-                file_modified_date = self._format_sidebar_datetime(data.get("modified_time"))
-                if file_modified_date:
-                    self.meta_file_modified_date_lbl.setText(f"Date Modified: {file_modified_date}")
-                
-            except Exception:
-                pass
+            # 1. Database Metadata: fetched on a worker (it may also parse the file
+            # and persist what it finds); _on_db_metadata_fetched fills the editors.
+            self._request_db_metadata(path)
 
             # 2. File size
             try:
-                size_bytes = p.stat().st_size
-                if size_bytes >= 1048576:
-                    size_str = f"{size_bytes / 1048576:.1f} MB"
-                elif size_bytes >= 1024:
-                    size_str = f"{size_bytes / 1024:.0f} KB"
-                else:
-                    size_str = f"{size_bytes} B"
+                size_str = self._file_size_cache.get(str(p))
+                if size_str is None:
+                    size_str = _format_file_size(p.stat().st_size)
+                    if len(self._file_size_cache) >= self._FILE_SIZE_CACHE_MAX:
+                        self._file_size_cache.clear()
+                    self._file_size_cache[str(p)] = size_str
                 self.meta_size_lbl.setText(f"File Size: {size_str}")
             except Exception:
                 self.meta_size_lbl.setText("File Size:")
@@ -6067,15 +7715,7 @@ class MainWindow(QMainWindow):
             # 3. Real-time Harvest (Update/Enrich Labels)
             ext = p.suffix.lower()
             if ext in {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp"}:
-                try:
-                    reader = QImageReader(str(p))
-                    sz = reader.size()
-                    if sz.isValid():
-                        self.meta_res_lbl.setText(f"Resolution: {sz.width()} × {sz.height()} px")
-                    else:
-                        self.meta_res_lbl.setText("Resolution: ")
-                except Exception:
-                    self.meta_res_lbl.setText("Resolution: ")
+                self._probe_image_size_async(str(p))
 
                 # Additional info via Pillow
                 try:
@@ -6152,6 +7792,7 @@ class MainWindow(QMainWindow):
                 except Exception as e:
                     print(f"Metadata Read Error for {p.name}: {e}")
             else:
+                self._probe_token += 1  # drop any image probe still in flight
                 vw, vh, _ = self.bridge._probe_video_size(str(p))
                 if vw > 0 and vh > 0:
                     self.meta_res_lbl.setText(f"Resolution: {vw} × {vh} px")
@@ -6174,15 +7815,139 @@ class MainWindow(QMainWindow):
             self._update_sidebar_action_buttons()
         else:
             # Bulk mode
+            self._meta_token += 1
+            self._meta_pending = False
             self.meta_tags.setText("")
             self._configure_bulk_tag_editor(len(paths))
 
-        self.meta_filename_edit.blockSignals(False)
-        self.meta_desc.blockSignals(False)
-        self.meta_tags.blockSignals(False)
-        self.meta_notes.blockSignals(False)
-        self.meta_exif_date_taken_edit.blockSignals(False)
-        self.meta_metadata_date_edit.blockSignals(False)
+    def _db_metadata_editors(self) -> tuple:
+        return (
+            self.meta_filename_edit,
+            self.meta_desc,
+            self.meta_tags,
+            self.meta_notes,
+            self.meta_exif_date_taken_edit,
+            self.meta_metadata_date_edit,
+        )
+
+    def _request_db_metadata(self, path: str) -> None:
+        self._meta_token += 1
+        token = self._meta_token
+        self._meta_pending = True
+        self._meta_save_queued = False
+        get_metadata = self.bridge.read_media_metadata
+
+        def fetch() -> None:
+            try:
+                data = get_metadata(path)
+            except Exception:
+                data = {}
+            try:
+                self._dbMetadataFetched.emit(token, data)
+            except RuntimeError:
+                pass  # window already destroyed
+
+        QThreadPool.globalInstance().start(fetch)
+
+    def _on_db_metadata_fetched(self, token: int, data: dict) -> None:
+        """Fill the DB-backed editors, unless the selection has moved on since the fetch."""
+        if token != self._meta_token:
+            return
+        self._meta_pending = False
+        _blockers = [QSignalBlocker(w) for w in self._db_metadata_editors()]
+        try:
+            self.meta_desc.setPlainText(data.get("description", ""))
+            self.meta_notes.setPlainText(data.get("notes", ""))
+
+            db_prompt = data.get('ai_prompt', '')
+            if db_prompt: self.meta_ai_prompt_edit.setPlainText(db_prompt)
+
+            db_neg_prompt = data.get('ai_negative_prompt', '')
+            if db_neg_prompt: self.meta_ai_negative_prompt_edit.setPlainText(db_neg_prompt)
+
+            db_params = data.get('ai_params', '')
+            if db_params: self.meta_ai_params_edit.setPlainText(db_params)
+
+            self.meta_ai_status_edit.setText(data.get("ai_status_summary", ""))
+            self.meta_ai_source_edit.setPlainText(data.get("ai_source_summary", ""))
+            self.meta_ai_families_edit.setText(data.get("ai_families_summary", ""))
+            self.meta_ai_detection_reasons_edit.setPlainText(data.get("ai_detection_reasons_summary", ""))
+            self.meta_ai_loras_edit.setPlainText(data.get("ai_loras_summary", ""))
+            self.meta_ai_model_edit.setText(data.get("ai_model_summary", ""))
+            self.meta_ai_checkpoint_edit.setText(data.get("ai_checkpoint_summary", ""))
+            self.meta_ai_sampler_edit.setText(data.get("ai_sampler_summary", ""))
+            self.meta_ai_scheduler_edit.setText(data.get("ai_scheduler_summary", ""))
+            self.meta_ai_cfg_edit.setText(data.get("ai_cfg_summary", ""))
+            self.meta_ai_steps_edit.setText(data.get("ai_steps_summary", ""))
+            self.meta_ai_seed_edit.setText(data.get("ai_seed_summary", ""))
+            self.meta_ai_upscaler_edit.setText(data.get("ai_upscaler_summary", ""))
+            self.meta_ai_denoise_edit.setText(data.get("ai_denoise_summary", ""))
+            self.meta_ai_workflows_edit.setPlainText(data.get("ai_workflows_summary", ""))
+            self.meta_ai_provenance_edit.setPlainText(data.get("ai_provenance_summary", ""))
+            self.meta_ai_character_cards_edit.setPlainText(data.get("ai_character_cards_summary", ""))
+            self.meta_ai_raw_paths_edit.setPlainText(data.get("ai_raw_paths_summary", ""))
+
+            self.meta_tags.setText(", ".join(data.get("tags", [])))
+            exif_date_taken = self._format_editable_datetime(data.get("exif_date_taken"))
+            if exif_date_taken:
+                self.meta_exif_date_taken_edit.setText(exif_date_taken)
+            metadata_date = self._format_editable_datetime(data.get("metadata_date"))
+            if metadata_date:
+                self.meta_metadata_date_edit.setText(metadata_date)
+            file_created_date = self._format_sidebar_datetime(data.get("file_created_time"))
+            if file_created_date:
+                self.meta_file_created_date_lbl.setText(f"Date Created: {file_created_date}")
+            file_modified_date = self._format_sidebar_datetime(data.get("modified_time"))
+            if file_modified_date:
+                self.meta_file_modified_date_lbl.setText(f"Date Modified: {file_modified_date}")
+        except Exception:
+            pass
+        if self._meta_save_queued:
+            self._meta_save_queued = False
+            self._save_native_metadata()
+
+    def _probe_image_size_async(self, path: str) -> None:
+        """Fill the resolution label from a QImageReader header read on a worker thread."""
+        self._probe_token += 1
+        token = self._probe_token
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        cached = self._image_size_cache.get(key) if key else None
+        if cached is not None:
+            self._on_image_size_probed(token, *cached)
+            return
+        self.meta_res_lbl.setText("Resolution: ")
+        cache = self._image_size_cache
+
+        def probe() -> None:
+            w = h = 0
+            try:
+                sz = QImageReader(path).size()
+                if sz.isValid():
+                    w, h = sz.width(), sz.height()
+            except Exception:
+                pass
+            if key is not None and w > 0 and h > 0:
+                if len(cache) >= self._IMAGE_SIZE_CACHE_MAX:
+                    cache.clear()
+                cache[key] = (w, h)
+            try:
+                self._imageSizeProbed.emit(token, w, h)
+            except RuntimeError:
+                pass  # window already destroyed
+
+        QThreadPool.globalInstance().start(probe)
+
+    def _on_image_size_probed(self, token: int, width: int, height: int) -> None:
+        if token != self._probe_token:
+            return
+        if width > 0 and height > 0:
+            self.meta_res_lbl.setText(f"Resolution: {width} × {height} px")
+        else:
+            self.meta_res_lbl.setText("Resolution: ")
 
     def _clear_embedded_labels(self):
         self.meta_camera_lbl.setText("Camera: ")
@@ -6665,22 +8430,24 @@ class MainWindow(QMainWindow):
         self.meta_status_lbl.setText("")
         self._set_metadata_empty_state(True)
 
-    def _on_splitter_moved(self) -> None:
+    def _on_left_sections_splitter_moved(self, _pos: int, _index: int) -> None:
+        self._splitter_dirty = True
+        self._splitter_save_timer.start()
+
+    def _on_splitter_moved(self, _pos: int = 0, _index: int = 0) -> None:
         """Save splitter state and re-apply card selection if the resize caused a deselect."""
-        self._save_splitter_state()
+        self._splitter_dirty = True
+        self._splitter_save_timer.start()
         self._update_sidebar_action_buttons()
         self._update_sidebar_input_widths()
         self._update_preview_display()
-        # Re-apply card selection via JS so resize doesn't visually deselect the last item
-        if hasattr(self, "_current_path") and self._current_path:
-            escaped = self._current_path.replace("\\", "\\\\").replace('"', '\\"')
-            self.web.page().runJavaScript(
-                f'(function(){{'  
-                f'  var c = document.querySelector(\'.card[data-path="{escaped}"]\');'  
-                f'  if (c) {{ document.querySelectorAll(\'.card.selected\').forEach(function(x){{x.classList.remove(\'selected\')}});'  
-                f'    c.classList.add(\'selected\'); }}'
-                f'}})();'
-            )
+        # Re-apply card selection over the channel so resize doesn't visually
+        # deselect the last item; once the drag pauses rather than on every move.
+        self._reselect_timer.start()
+
+    def _reselect_current_card(self) -> None:
+        if getattr(self, "_current_path", None):
+            self.bridge.currentPathChanged.emit(self._current_path)
 
     def _on_tree_context_menu(self, pos: QPoint) -> None:
         idx = self.tree.indexAt(pos)
@@ -6692,9 +8459,9 @@ class MainWindow(QMainWindow):
         if not folder_path:
             return
 
-        menu = QMenu(self)
+        menu = self._new_context_menu()
 
-        name = Path(folder_path).name
+        folder_name = os.path.basename(folder_path)
         is_hidden = self.bridge.repo.is_path_hidden(folder_path)
 
         act_hide = None
@@ -6718,6 +8485,7 @@ class MainWindow(QMainWindow):
         
         menu.addSeparator()
         act_select_all = menu.addAction("Select All Files in Folder")
+        act_refresh = menu.addAction("Refresh")
         
         # Disable paste if no files in clipboard
         if not self.bridge.has_files_in_clipboard():
@@ -6728,23 +8496,26 @@ class MainWindow(QMainWindow):
         if chosen == act_hide:
             success = self.bridge.set_folder_hidden(folder_path, True)
             if success:
-                self.proxy_model.invalidateFilter()
+                self._invalidate_timer.start()
 
         if chosen == act_unhide:
             success = self.bridge.set_folder_hidden(folder_path, False)
             if success:
-                self.proxy_model.invalidateFilter()
+                self._invalidate_timer.start()
 
         if chosen == act_select_all:
-             self.web.page().runJavaScript("if(window.selectAll) window.selectAll();")
+             self._web_command("selectAll")
+
+        if chosen == act_refresh:
+            # The tree doesn't watch the disk; re-list this folder on demand.
+            self.fs_model.refresh(folder_path)
 
         if chosen == act_rename:
-            cur = Path(folder_path).name
-            next_name, ok = QInputDialog.getText(self, "Rename folder", "New name:", text=cur)
-            if ok and next_name and next_name != cur:
+            next_name, ok = QInputDialog.getText(self, "Rename folder", "New name:", text=folder_name)
+            if ok and next_name and next_name != folder_name:
                 new_path = self.bridge.rename_path(folder_path, next_name)
                 if new_path:
-                    parent = str(Path(new_path).parent)
+                    parent = os.path.dirname(new_path)
                     self.tree.setCurrentIndex(self.proxy_model.mapFromSource(self.fs_model.index(parent)))
                     self._set_selected_folders([parent])
 
@@ -6771,8 +8542,7 @@ class MainWindow(QMainWindow):
         if ok and name:
             new_path = self.bridge.create_folder(parent_path, name)
             if new_path:
-                 # QFileSystemModel auto-updates, but we might want to select it
-                 pass
+                self.fs_model.refresh(parent_path)
 
     def _delete_item(self, path_str: str):
         p = Path(path_str)
@@ -6785,7 +8555,7 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
         
-        self.bridge.delete_path(path_str)
+        self.bridge.delete_paths_async([path_str])
 
     def choose_folder(self) -> None:
         folder = QFileDialog.getExistingDirectory(self, "Choose a media folder")
@@ -6798,10 +8568,7 @@ class MainWindow(QMainWindow):
         # Track temp files created by preprocessing so we can delete on close
         if not hasattr(self, "_temp_video_path"):
             self._temp_video_path: str | None = None
-        import tempfile, pathlib
-        if pathlib.Path(path).parent == pathlib.Path(tempfile.gettempdir()) and path.startswith(
-            str(pathlib.Path(tempfile.gettempdir()) / "mmx_fixed_")
-        ):
+        if path.startswith(_TMP_PREFIX) and Path(path).parent == _TMPDIR:
             self._temp_video_path = path
         else:
             self._cleanup_temp_video()
@@ -6910,9 +8677,7 @@ class MainWindow(QMainWindow):
     def _close_web_lightbox(self) -> None:
         # Ask the web UI to close its lightbox chrome without re-triggering native close.
         try:
-            self.web.page().runJavaScript(
-                "try{ window.__mmx_closeLightboxFromNative && window.__mmx_closeLightboxFromNative(); }catch(e){}"
-            )
+            self._web_command("__mmx_closeLightboxFromNative")
         except Exception:
             pass
 
@@ -6929,32 +8694,26 @@ class MainWindow(QMainWindow):
         if hasattr(self, "center_splitter"):
             self.center_splitter.setHandleWidth(7)
         
-        # We no longer need stylesheets or manual loops here because 
-        # CustomSplitterHandle.paintEvent handles everything natively.
-        for i in range(self.splitter.count()):
-            h = self.splitter.handle(i)
-            if h:
-                h.update()
-        if hasattr(self, "center_splitter"):
-            for i in range(self.center_splitter.count()):
-                h = self.center_splitter.handle(i)
-                if h:
-                    h.update()
+        # CustomSplitterHandle paints natively; just hand it the resolved colors.
+        for name in ("splitter", "left_sections_splitter", "center_splitter"):
+            splitter = getattr(self, name, None)
+            if splitter is None:
+                continue
+            for i in range(splitter.count()):
+                h = splitter.handle(i)
+                if isinstance(h, CustomSplitterHandle):
+                    h.set_accent(accent_color)
 
     def _on_accent_changed(self, accent_color: str) -> None:
         """Called when the bridge emits accentColorChanged."""
         self._current_accent = accent_color
+        Theme.invalidate()
         self._update_native_styles(accent_color)
         self._update_splitter_style(accent_color)
         
         # Update tooltip theme
         if hasattr(self, "native_tooltip"):
             self.native_tooltip.update_style(QColor(accent_color), Theme.get_is_light())
-        
-        # Belt and suspenders: force update web layer via injection
-        js = f"document.documentElement.style.setProperty('--accent', '{accent_color}');"
-        if hasattr(self, "webview") and self.webview.page():
-            self.webview.page().runJavaScript(js)
 
     def _on_update_tooltip(self, count: int, is_copy: bool, target_folder: str) -> None:
         if not hasattr(self, "native_tooltip"):
@@ -6975,58 +8734,49 @@ class MainWindow(QMainWindow):
 
     def _set_window_title_bar_theme(self, is_dark: bool, bg_color: QColor | None = None) -> None:
         """Enable immersive dark mode and set custom caption color for the Windows title bar."""
-        if sys.platform != "win32":
+        set_attr = _dwm_set_attribute()
+        if set_attr is None:
             return
         try:
             hwnd = int(self.winId())
-            # Immersive Dark Mode
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            # Some older win10 builds use 19
-            DWMWA_USE_IMMERSIVE_DARK_MODE_OLD = 19
+            # Each call is a round-trip to the compositor; skip when nothing changed
+            # for this window handle.
+            state = (hwnd, is_dark, bg_color.rgb() if bg_color else None)
+            if state == getattr(self, "_last_dwm_state", None):
+                return
+
+            # Immersive Dark Mode; attribute 19 only on builds that reject 20.
             value = ctypes.c_int(1 if is_dark else 0)
-            
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, 
-                ctypes.byref(value), ctypes.sizeof(value)
-            )
-            # Try 19 as fallback? Usually unnecessary on modern systems but safe.
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE_OLD, 
-                ctypes.byref(value), ctypes.sizeof(value)
-            )
+            if set_attr(hwnd, _DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(value), _C_INT_SIZE) != 0:
+                set_attr(hwnd, _DWMWA_USE_IMMERSIVE_DARK_MODE_OLD, ctypes.byref(value), _C_INT_SIZE)
 
             # Windows 11+ Title Bar Colors
             if bg_color:
-                DWMWA_CAPTION_COLOR = 35
-                DWMWA_TEXT_COLOR = 36
-                
                 # Background
-                bg_ref = (bg_color.blue() << 16) | (bg_color.green() << 8) | bg_color.red()
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd, DWMWA_CAPTION_COLOR,
-                    ctypes.byref(ctypes.c_int(bg_ref)),
-                    ctypes.sizeof(ctypes.c_int(bg_ref))
-                )
-                
+                bg_ref = ctypes.c_int((bg_color.blue() << 16) | (bg_color.green() << 8) | bg_color.red())
+                set_attr(hwnd, _DWMWA_CAPTION_COLOR, ctypes.byref(bg_ref), _C_INT_SIZE)
+
                 # Text (Contrast)
-                fg_ref = 0x00000000 if not is_dark else 0x00FFFFFF
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd, DWMWA_TEXT_COLOR,
-                    ctypes.byref(ctypes.c_int(fg_ref)),
-                    ctypes.sizeof(ctypes.c_int(fg_ref))
-                )
+                fg_ref = ctypes.c_int(0x00000000 if not is_dark else 0x00FFFFFF)
+                set_attr(hwnd, _DWMWA_TEXT_COLOR, ctypes.byref(fg_ref), _C_INT_SIZE)
+            self._last_dwm_state = state
         except Exception:
             pass
 
     def _update_native_styles(self, accent_str: str) -> None:
         """Apply neutral native surfaces and reserve accent for interaction states."""
+        is_light = Theme.get_is_light()
+        # Every setStyleSheet below re-polishes the whole panel; skip the lot when
+        # neither the accent nor the theme mode changed since the last apply.
+        style_key = (accent_str, is_light)
+        if style_key == getattr(self, "_native_style_key", None):
+            return
         accent = QColor(accent_str)
         sb_bg_str = Theme.get_sidebar_bg(accent)
         sb_bg = QColor(sb_bg_str)
         scrollbar_style = self._get_native_scrollbar_style(accent)
         text = Theme.get_text_color()
         text_muted = Theme.get_text_muted()
-        is_light = Theme.get_is_light()
         
         # Windows Title Bar
         self._set_window_title_bar_theme(not is_light, sb_bg)
@@ -7036,10 +8786,11 @@ class MainWindow(QMainWindow):
             self.native_tooltip.update_style(accent, is_light)
         
         # Theme-aware Window Icon
-        icon_name = "favicon-black.png" if is_light else "favicon.png"
-        icon_path = Path(__file__).with_name("web") / icon_name
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        if is_light != getattr(self, "_window_icon_is_light", None):
+            icon = _favicon(is_light)
+            if icon is not None:
+                self.setWindowIcon(icon)
+                self._window_icon_is_light = is_light
         
         # Loading Screen
         load_fg = "rgba(0,0,0,200)" if is_light else "rgba(255,255,255,200)"
@@ -7163,6 +8914,7 @@ class MainWindow(QMainWindow):
         """)
         
         self._update_app_style(accent)
+        self._native_style_key = style_key
 
     def _add_sep(self, obj_name: str) -> NativeSeparator:
         """Create a 1 physical-pixel robust separator widget."""
@@ -7172,168 +8924,84 @@ class MainWindow(QMainWindow):
 
 
     def showEvent(self, event) -> None:
-        """Trigger native style update when window actually becomes visible to ensure valid winId for DWM."""
+        """Theme the Windows title bar on first show, once winId is valid for DWM.
+
+        The stylesheets were already applied during construction and are only
+        re-applied when the accent or theme mode changes.
+        """
         super().showEvent(event)
-        try:
-            accent = getattr(self, "_current_accent", Theme.ACCENT_DEFAULT)
-            self._update_native_styles(accent)
-        except Exception:
-            pass
+        if not getattr(self, "_styles_applied_once", False):
+            self._styles_applied_once = True
+            try:
+                accent = QColor(getattr(self, "_current_accent", Theme.ACCENT_DEFAULT))
+                self._set_window_title_bar_theme(not Theme.get_is_light(), QColor(Theme.get_sidebar_bg(accent)))
+            except Exception:
+                pass
+            # Every mouse press in this window passes through its QWindow before
+            # reaching a child widget, so filtering there sees the same clicks as
+            # an application-wide filter without every other event in the process.
+            handle = self.windowHandle()
+            if handle is not None:
+                handle.installEventFilter(self)
+            else:
+                QApplication.instance().installEventFilter(self)
+        if not self._initial_load_started:
+            self._initial_load_started = True
+            QTimer.singleShot(0, lambda: self.web.setUrl(self._pending_index_url))
 
     def _update_app_style(self, accent: QColor) -> None:
-        """Update global application styles like tinted native menus."""
+        """Tint the native menus.
+
+        Scoped to the menu bar (its drop-down menus are its children) and to the
+        context menus from _new_context_menu, instead of a QApplication-wide
+        sheet that re-polishes every widget in the process on each accent change.
+        """
         sb_bg = Theme.get_sidebar_bg(accent)
         border = Theme.get_border(accent)
         text = Theme.get_text_color()
-        is_light = Theme.get_is_light()
         highlight_bg = Theme.get_accent_soft(accent)
-        
-        QApplication.instance().setStyleSheet(f"""
-            QMenuBar {{
-                background-color: {sb_bg};
-                color: {text};
-                border-bottom: 1px solid {border};
-            }}
-            QMenuBar::item {{
-                background: transparent;
-                padding: 4px 10px;
-            }}
-            QMenuBar::item:selected {{
-                background: {highlight_bg};
-            }}
-            QMenu {{
-                background-color: {sb_bg};
-                color: {text};
-                border: 1px solid {border};
-                padding: 4px 0;
-            }}
-            QMenu::item {{
-                padding: 4px 24px 4px 14px;
-            }}
-            QMenu::item:selected {{
-                background-color: {highlight_bg};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background: {border};
-                margin: 4px 0;
-            }}
-        """)
+
+        self._menu_qss = _menu_qss(sb_bg, text, border, highlight_bg)
+        self.menuBar().setStyleSheet(_menubar_qss(sb_bg, text, border, highlight_bg))
+
+    def _new_context_menu(self) -> QMenu:
+        menu = QMenu(self)
+        menu.setStyleSheet(getattr(self, "_menu_qss", ""))
+        return menu
 
     def _get_native_scrollbar_style(self, accent: QColor) -> str:
         """Generate neutral native scrollbars with accent reserved for content states."""
-        track = Theme.get_scrollbar_track(accent)
-        is_light = Theme.get_is_light()
-        
-        # We use physical SVG files for maximum compatibility with Qt's QSS engine,
-        # which often fails to render SVG data URIs.
-        base_svg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web", "scrollbar_arrows").replace("\\", "/")
-        mode = "light" if is_light else "dark"
-        
-        up_path = f"{base_svg_path}/{mode}_up.svg"
-        dn_path = f"{base_svg_path}/{mode}_down.svg"
-        lt_path = f"{base_svg_path}/{mode}_left.svg"
-        rt_path = f"{base_svg_path}/{mode}_right.svg"
-
-        thumb_bg = Theme.get_scrollbar_thumb(accent)
-        thumb_hover_bg = Theme.get_scrollbar_thumb_hover(accent)
-        
-        return f"""
-            QScrollBar:vertical {{
-                background: {track};
-                width: 12px;
-                margin: 12px 0 12px 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {thumb_bg};
-                min-height: 20px;
-                border-radius: 10px;
-                border: 2px solid {track};
-            }}
-            QScrollBar::handle:vertical:hover, QScrollBar::handle:vertical:pressed {{
-                background: {thumb_hover_bg};
-            }}
-            QScrollBar::add-line:vertical {{
-                background: {track};
-                height: 12px;
-                subcontrol-position: bottom;
-                subcontrol-origin: margin;
-            }}
-            QScrollBar::sub-line:vertical {{
-                background: {track};
-                height: 12px;
-                subcontrol-position: top;
-                subcontrol-origin: margin;
-            }}
-            QScrollBar::up-arrow:vertical {{
-                image: url("{up_path}");
-                width: 8px;
-                height: 8px;
-            }}
-            QScrollBar::down-arrow:vertical {{
-                image: url("{dn_path}");
-                width: 8px;
-                height: 8px;
-            }}
-            
-            QScrollBar:horizontal {{
-                background: {track};
-                height: 12px;
-                margin: 0 12px 0 12px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {thumb_bg};
-                min-width: 20px;
-                border-radius: 10px;
-                border: 2px solid {track};
-            }}
-            QScrollBar::handle:horizontal:hover, QScrollBar::handle:horizontal:pressed {{
-                background: {thumb_hover_bg};
-            }}
-            QScrollBar::add-line:horizontal {{
-                background: {track};
-                width: 12px;
-                subcontrol-position: right;
-                subcontrol-origin: margin;
-            }}
-            QScrollBar::sub-line:horizontal {{
-                background: {track};
-                width: 12px;
-                subcontrol-position: left;
-                subcontrol-origin: margin;
-            }}
-            QScrollBar::left-arrow:horizontal {{
-                image: url("{lt_path}");
-                width: 8px;
-                height: 8px;
-            }}
-            QScrollBar::right-arrow:horizontal {{
-                image: url("{rt_path}");
-                width: 8px;
-                height: 8px;
-            }}
-            QScrollBar::add-page, QScrollBar::sub-page {{
-                background: none;
-            }}
-        """
+        return _scrollbar_qss((accent.red(), accent.green(), accent.blue(), accent.alpha()), Theme.get_is_light())
 
     def _on_video_prev(self) -> None:
         try:
-            self.web.page().runJavaScript("try{ window.lightboxPrev && window.lightboxPrev(); }catch(e){}")
+            self._web_command("lightboxPrev")
         except Exception:
             pass
 
     def _on_video_next(self) -> None:
         try:
-            self.web.page().runJavaScript("try{ window.lightboxNext && window.lightboxNext(); }catch(e){}")
+            self._web_command("lightboxNext")
         except Exception:
             pass
 
+    def _on_web_load_started(self) -> None:
+        # A fresh page starts with its context menu closed.
+        self.bridge.web_menu_open = False
+        self._set_web_loading(True)
+
+    def _on_web_load_finished(self, _ok: bool) -> None:
+        self._set_web_loading(False)
+
     def _set_web_loading(self, on: bool) -> None:
         try:
             if on:
-                self._web_loading_shown_ms = int(__import__("time").time() * 1000)
-                self.web_loading.setGeometry(self.web.rect())
+                # A new load supersedes a hide still waiting out the minimum time.
+                self._web_loading_hide_timer.stop()
+                self._web_loading_shown_ms = int(time.monotonic() * 1000)
+                web_rect = self.web.rect()
+                if self.web_loading.geometry() != web_rect:
+                    self.web_loading.setGeometry(web_rect)
                 self.web_loading.setVisible(True)
                 self.web_loading.raise_()
                 if self.video_overlay.isVisible():
@@ -7341,40 +9009,49 @@ class MainWindow(QMainWindow):
                 return
 
             # off: enforce minimum display time to avoid flashing
-            now = int(__import__("time").time() * 1000)
+            now = int(time.monotonic() * 1000)
             shown = self._web_loading_shown_ms or now
             remaining = self._web_loading_min_ms - (now - shown)
             if remaining > 0:
-                from PySide6.QtCore import QTimer
-
-                QTimer.singleShot(int(remaining), lambda: self._set_web_loading(False))
+                self._web_loading_hide_timer.start(int(remaining))
                 return
 
-            self.web_loading.setVisible(False)
+            self._finish_web_loading()
         except Exception:
             pass
 
+    def _finish_web_loading(self) -> None:
+        self.web_loading.setVisible(False)
+
     def _on_web_load_progress(self, pct: int) -> None:
         try:
-            self.web_loading_bar.setValue(int(pct))
+            pct = int(pct)
+            # Chromium reports every percent; repaint the bar in 2% steps, but
+            # always land exactly on the start and end values.
+            if pct not in (0, 100) and abs(pct - self.web_loading_bar.value()) < 2:
+                return
+            self.web_loading_bar.setValue(pct)
         except Exception:
             pass
 
     def _toggle_panel_setting(self, qkey: str) -> None:
         try:
-            cur = bool(self.bridge.settings.value(qkey, True, type=bool))
+            cur = bool(self.bridge._cached(qkey, True, bool))
             new = not cur
             if not new:
                 if qkey == "ui/show_bottom_panel":
                     self._save_bottom_panel_height()
                 else:
                     self._save_main_panel_widths()
-            self.bridge.settings.setValue(qkey, new)
+            self.bridge._store_setting(qkey, new)
             self.bridge.uiFlagChanged.emit(qkey.replace("/", "."), new)
         except Exception:
             pass
 
     def _save_splitter_state(self) -> None:
+        if not self._splitter_dirty:
+            return
+        self._splitter_dirty = False
         try:
             self._save_main_panel_widths()
             self._save_bottom_panel_height()
@@ -7384,19 +9061,20 @@ class MainWindow(QMainWindow):
             pass
 
     def closeEvent(self, event) -> None:
+        self._splitter_save_timer.stop()
         self._save_splitter_state()
+        self.bridge._flush_settings()
+        self.bridge.shutdown_pools()
         super().closeEvent(event)
 
     def open_settings(self) -> None:
         try:
-            self.web.page().runJavaScript(
-                "try{ window.__mmx_openSettings && window.__mmx_openSettings(); }catch(e){}"
-            )
+            self._web_command("__mmx_openSettings")
         except Exception:
             pass
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.MouseButtonPress:
+        if event.type() == _MOUSE_BUTTON_PRESS:
             # 1. Ignore ALL mouse buttons if a native popup/menu is active.
             # This protects against "Select All Files in Folder" from the tree context menu.
             if QApplication.activePopupWidget() is not None:
@@ -7412,8 +9090,9 @@ class MainWindow(QMainWindow):
 
             # Use a more robust geometric check instead of recursive object parent lookup.
             # This is safer and avoids potential crashes in transient widget states.
-            from PySide6.QtGui import QCursor
-            rel_pos = self.web.mapFromGlobal(QCursor.pos())
+            # The press carries its own screen position; no cursor query needed.
+            cursor_pos = event.globalPosition().toPoint() if hasattr(event, "globalPosition") else QCursor.pos()
+            rel_pos = self.web.mapFromGlobal(cursor_pos)
             is_web = self.web.rect().contains(rel_pos)
             
             if not is_web:
@@ -7423,12 +9102,12 @@ class MainWindow(QMainWindow):
                 # Deselect web items, UNLESS the click was in the right metadata/tags panel
                 is_right_panel = False
                 if self.right_panel.isVisible():
-                    rp_pos = self.right_panel.mapFromGlobal(QCursor.pos())
+                    rp_pos = self.right_panel.mapFromGlobal(cursor_pos)
                     is_right_panel = self.right_panel.rect().contains(rp_pos)
 
                 is_bottom_panel = False
                 if hasattr(self, "bottom_panel") and self.bottom_panel.isVisible():
-                    bp_pos = self.bottom_panel.mapFromGlobal(QCursor.pos())
+                    bp_pos = self.bottom_panel.mapFromGlobal(cursor_pos)
                     is_bottom_panel = self.bottom_panel.rect().contains(bp_pos)
 
                 if not is_right_panel and not is_bottom_panel:
@@ -7438,60 +9117,86 @@ class MainWindow(QMainWindow):
                     
         return False # Accept the event and let others handle it
 
+    def _web_command(self, name: str) -> None:
+        """Call window.<name>() in the gallery over the web channel.
+
+        Cheaper than runJavaScript for these fixed calls: no script string is
+        shipped to the renderer and compiled per click.
+        """
+        self.bridge.webCommand.emit(name)
+
     def _dismiss_web_menus(self) -> None:
-        """Tell the web gallery to hide its custom context menu."""
+        """Tell the web gallery to hide its custom context menu, if it is open."""
+        if not self.bridge.web_menu_open:
+            return
         try:
-            self.web.page().runJavaScript("window.hideCtx && window.hideCtx();")
+            self._web_command("hideCtx")
         except Exception:
             pass
 
     def _deselect_web_items(self) -> None:
         """Tell the web gallery to deselect any currently selected media items."""
         try:
-            self.web.page().runJavaScript("window.deselectAll && window.deselectAll();")
+            self._web_command("deselectAll")
         except Exception:
             pass
 
     def toggle_devtools(self) -> None:
         if self._devtools is None:
-            self._devtools = QWebEngineView()
+            # Parented so it is torn down with the main window; still its own window.
+            self._devtools = QWebEngineView(self)
+            self._devtools.setWindowFlag(Qt.WindowType.Window, True)
             self._devtools.setWindowTitle("MediaManagerX DevTools")
             self._devtools.resize(1100, 700)
-            self.web.page().setDevToolsPage(self._devtools.page())
             self._devtools.show()
+            # Attaching starts Chromium's inspector backend; do it after the
+            # window is up rather than inside the click.
+            QTimer.singleShot(0, self._attach_devtools)
         else:
+            self.web.page().setDevToolsPage(None)
             self._devtools.close()
+            self._devtools.deleteLater()
             self._devtools = None
 
+    def _attach_devtools(self) -> None:
+        if self._devtools is not None:
+            self.web.page().setDevToolsPage(self._devtools.page())
+
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
         self._update_sidebar_action_buttons()
         self._update_sidebar_input_widths()
-        # Keep overlays pinned to the web view.
-        if hasattr(self, "web_loading"):
-            self.web_loading.setGeometry(self.web.rect())
-            if self.web_loading.isVisible():
-                self.web_loading.raise_()
+        # Keep visible overlays pinned to the web view. Hidden ones are sized
+        # when shown, and both are raised when shown, so a resize (which fires
+        # continuously during a drag) never needs to touch the stacking order.
+        web_rect = self.web.rect()
+        if hasattr(self, "web_loading") and self.web_loading.isVisible():
+            if self.web_loading.geometry() != web_rect:
+                self.web_loading.setGeometry(web_rect)
 
         if hasattr(self, "video_overlay") and self.video_overlay.isVisible():
             # In inplace mode, the geometry is set by JS, so we don't want to reset it here.
             # Only reset if it's in full overlay mode.
-            if not self.video_overlay.is_inplace_mode():
-                self.video_overlay.setGeometry(self.web.rect())
-            self.video_overlay.raise_()
+            if not self.video_overlay.is_inplace_mode() and self.video_overlay.geometry() != web_rect:
+                self.video_overlay.setGeometry(web_rect)
         if hasattr(self, "preview_image_lbl"):
             self._update_preview_display()
 
+    @Slot()
+    def _on_tools_status_changed(self) -> None:
+        self._about_text = None
+
     def about(self) -> None:
+        if self._about_text is not None:
+            self._show_themed_dialog("About MediaManagerX", self._about_text, is_markdown=True)
+            return
+
         st = self.bridge.get_tools_status()
         ff = "✓" if st.get("ffmpeg") else "×"
         fp = "✓" if st.get("ffprobe") else "×"
-        
-        try:
-            from PySide6.QtMultimedia import QMediaFormat
-            backend = "Qt6 Default (FFmpeg)"
-        except ImportError:
-            backend = "Unknown"
+        # video_overlay already requires QtMultimedia to import at all, so there
+        # is nothing left to probe here.
+        backend = "Qt6 Default (FFmpeg)"
 
         info = (
             "# MediaManagerX\n\n"
@@ -7505,6 +9210,10 @@ class MainWindow(QMainWindow):
             f"- **ffprobe**: {fp} ({st.get('ffprobe_path', 'not found')})\n"
             f"- **Thumbnails**: {st.get('thumb_dir')}"
         )
+        # Keep the text once both tools are resolved; with one missing, the next
+        # About looks it up again. toolsStatusChanged drops the memo.
+        if st.get("ffmpeg") and st.get("ffprobe"):
+            self._about_text = info
 
         self._show_themed_dialog("About MediaManagerX", info, is_markdown=True)
 
@@ -7685,19 +9394,72 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "Update Error", message)
 
 
+_WARM_WEB: "GalleryView | None" = None
+
+
+def _prewarm_web_engine(app: QApplication) -> None:
+    """Start Chromium (hidden, on about:blank) before MainWindow builds its widgets.
+
+    Renderer start-up then overlaps with Qt widget construction instead of
+    happening behind the loading overlay; MainWindow adopts the view.
+    """
+    global _WARM_WEB
+    try:
+        view = GalleryView()
+        view.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, True)
+        view.setUrl(QUrl("about:blank"))
+        app.processEvents()
+        _WARM_WEB = view
+    except Exception:
+        _WARM_WEB = None
+
+
+def _take_warm_web(parent: QWidget) -> "GalleryView | None":
+    global _WARM_WEB
+    view, _WARM_WEB = _WARM_WEB, None
+    if view is not None:
+        view.setParent(parent)
+        view.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, False)
+    return view
+
+
 def main() -> None:
+    # The gallery shell only loads a local page; skip Chromium features it never uses,
+    # and keep compiled gallery JS resident instead of letting V8 flush idle bytecode.
+    os.environ.setdefault(
+        "QTWEBENGINE_CHROMIUM_FLAGS",
+        "--disable-features=WebUSB,WebOTP,PictureInPicture --disable-speech-api --disable-gpu-vsync"
+        " --js-flags=--no-flush-bytecode",
+    )
+    os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
+    # QWidgetPrivate::subtractOpaqueSiblings (qwidget.cpp) clips each paint against
+    # every opaque sibling above it; with the web view, its overlays and the
+    # splitter panes that region walk costs more than the few pixels it saves.
+    # Read once by QtWidgets at startup, so it has to be set before QApplication.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
+    _register_ui_scheme()
     app = QApplication(sys.argv)
-    
-    # Global styling is now handled dynamically in MainWindow
-    app.setStyleSheet("")
+
+    # Global styling is now handled dynamically in MainWindow. Only clear a sheet
+    # that was actually supplied (e.g. -stylesheet on the command line); setting
+    # an empty one still re-polishes every widget.
+    if app.styleSheet():
+        app.setStyleSheet("")
 
     # Ensure QStandardPaths.AppDataLocation resolves to a stable, app-specific dir.
     app.setOrganizationName("G1enB1and")
     app.setApplicationName("MediaManagerX")
 
+    _prewarm_web_engine(app)
     win = MainWindow()
     win.show()
-    sys.exit(app.exec())
+    rc = app.exec()
+    # Tear the window (and its web page) down while QApplication still exists,
+    # rather than leaving the order to interpreter shutdown. Not os._exit: the
+    # stderr relay, stdio buffers and in-flight pool work still need to finish.
+    del win
+    sys.exit(rc)
 
 
 if __name__ == "__main__":
@@ -810,37 +810,72 @@ function loadImage(el, imgSrc) {
   el.src = imgSrc;
 }
 
+function applyVideoPoster(el, posterUrl) {
+  const card = el.closest('.card');
+  if (posterUrl) {
+    // Preload via tempImg so the browser caches it — then show instantly
+    const tempImg = new Image();
+    tempImg.onload = () => {
+      el.src = posterUrl;
+      gLoadedOnPage++;
+      // Push opacity change one frame out so the CSS transition fires
+      requestAnimationFrame(() => { el.style.opacity = '1'; });
+      if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
+    };
+    tempImg.onerror = () => {
+      el.removeAttribute('src');
+      gLoadedOnPage++;
+      requestAnimationFrame(() => { el.style.opacity = '1'; });
+      if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
+    };
+    tempImg.src = posterUrl;
+  } else {
+    el.removeAttribute('src');
+    gLoadedOnPage++;
+    requestAnimationFrame(() => { el.style.opacity = '1'; });
+    if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
+  }
+}
+
+// Poster requests made in the same tick are sent to the bridge as one batch;
+// results come back through the videoPosterReady signal.
+let gPosterWaiters = new Map(); // path -> [el, ...]
+let gPosterBatch = [];
+let gPosterBatchTimer = null;
+
+function flushPosterBatch() {
+  gPosterBatchTimer = null;
+  const batch = gPosterBatch;
+  gPosterBatch = [];
+  if (batch.length && gBridge && gBridge.ensure_video_posters) {
+    gBridge.ensure_video_posters(batch);
+  }
+}
+
+function onVideoPosterReady(path, posterUrl) {
+  const waiting = gPosterWaiters.get(path);
+  if (!waiting) return;
+  gPosterWaiters.delete(path);
+  for (const el of waiting) applyVideoPoster(el, posterUrl);
+}
+
 function loadVideoPoster(el, path) {
   if (gPosterRequested.has(el)) return;
   gPosterRequested.add(el);
   // Hide immediately so the card's shimmer shows through until the poster arrives
   el.style.opacity = '0';
-  if (gBridge && gBridge.get_video_poster) {
+  if (gBridge && gBridge.ensure_video_posters && gBridge.videoPosterReady) {
+    const waiting = gPosterWaiters.get(path);
+    if (waiting) {
+      waiting.push(el);
+      return;
+    }
+    gPosterWaiters.set(path, [el]);
+    gPosterBatch.push(path);
+    if (!gPosterBatchTimer) gPosterBatchTimer = setTimeout(flushPosterBatch, 0);
+  } else if (gBridge && gBridge.get_video_poster) {
     gBridge.get_video_poster(path, function (posterUrl) {
-      const card = el.closest('.card');
-      if (posterUrl) {
-        // Preload via tempImg so the browser caches it — then show instantly
-        const tempImg = new Image();
-        tempImg.onload = () => {
-          el.src = posterUrl;
-          gLoadedOnPage++;
-          // Push opacity change one frame out so the CSS transition fires
-          requestAnimationFrame(() => { el.style.opacity = '1'; });
-          if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
-        };
-        tempImg.onerror = () => {
-          el.removeAttribute('src');
-          gLoadedOnPage++;
-          requestAnimationFrame(() => { el.style.opacity = '1'; });
-          if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
-        };
-        tempImg.src = posterUrl;
-      } else {
-        el.removeAttribute('src');
-        gLoadedOnPage++;
-        requestAnimationFrame(() => { el.style.opacity = '1'; });
-        if (card) { card.classList.remove('loading'); card.classList.add('ready'); }
-      }
+      applyVideoPoster(el, posterUrl);
     });
   }
 }
@@ -992,7 +1027,10 @@ let gCtxFromLightbox = false;
 
 function hideCtx() {
   const ctx = document.getElementById('ctx');
-  if (ctx) ctx.hidden = true;
+  if (ctx && !ctx.hidden) {
+    ctx.hidden = true;
+    if (gBridge && gBridge.set_web_menu_open) gBridge.set_web_menu_open(false);
+  }
   gCtxItem = null;
   gCtxIndex = -1;
   gCtxFromLightbox = false;
@@ -1038,6 +1076,21 @@ function selectAll() {
 }
 window.selectAll = selectAll;
 
+// Native side re-marks the current card after a splitter drag re-lays out the grid.
+function reselectCard(path) {
+  const card = document.querySelector(`.card[data-path="${CSS.escape(path)}"]`);
+  if (!card) return;
+  document.querySelectorAll('.card.selected').forEach(c => c.classList.remove('selected'));
+  card.classList.add('selected');
+}
+
+// Folder card under a point, for native drag-over targeting; '' when none.
+window.__mmx_folderAt = function (x, y) {
+  const el = document.elementFromPoint(x, y);
+  const card = el && el.closest ? el.closest('.folder-card[data-path]') : null;
+  return card ? card.getAttribute('data-path') : '';
+};
+
 function triggerRename() {
   let path = null;
   if (gCtxItem && gCtxItem.path) {
@@ -2975,6 +3028,7 @@ function showCtx(x, y, item, idx, fromLightbox = false) {
   }
 
   const viewportPadding = 8;
+  if (ctx.hidden && gBridge && gBridge.set_web_menu_open) gBridge.set_web_menu_open(true);
   ctx.hidden = false;
   ctx.style.visibility = 'hidden';
   ctx.style.left = '0px';
@@ -3174,8 +3228,9 @@ function wireCtxMenu() {
         }
         break;
       case 'ctxDelete':
-        if (item && item.path && gBridge && gBridge.delete_path) {
-          gBridge.delete_path(item.path, (ok) => { if (ok) refreshFromBridge(gBridge); });
+        if (item && item.path && gBridge && gBridge.delete_paths_async) {
+          // fileOpFinished('delete', ...) triggers the refresh once the worker is done.
+          gBridge.delete_paths_async([item.path]);
         }
         break;
       case 'ctxCut':
@@ -4496,6 +4551,10 @@ async function main() {
     wireCtxMenu();
     wireGalleryBackground();
 
+    if (bridge.videoPosterReady) {
+      bridge.videoPosterReady.connect(onVideoPosterReady);
+    }
+
     if (bridge.dragOverFolder) {
       bridge.dragOverFolder.connect(function (folderName) {
         gCurrentTargetFolderName = folderName || '';
@@ -4785,6 +4844,18 @@ async function main() {
       });
     }
 
+    if (bridge.currentPathChanged) {
+      bridge.currentPathChanged.connect(reselectCard);
+    }
+
+    if (bridge.webCommand) {
+      bridge.webCommand.connect(function (name) {
+        const fn = window[name];
+        if (typeof fn !== 'function') return;
+        try { fn(); } catch (e) { }
+      });
+    }
+
     if (bridge.accentColorChanged) {
       bridge.accentColorChanged.connect(function (v) {
         document.documentElement.style.setProperty('--accent', v);
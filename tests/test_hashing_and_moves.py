@@ -7,7 +7,7 @@ import unittest
 from pathlib import Path
 from app.mediamanager.db.media_repo import upsert_media_item, get_media_by_path, get_media_by_hash
 from app.mediamanager.db.migrations import init_db
-from app.mediamanager.utils.hashing import calculate_file_hash
+from app.mediamanager.utils.hashing import calculate_file_hash, fast_fingerprint
 
 class TestHashingAndMoves(unittest.TestCase):
     def setUp(self) -> None:
@@ -92,5 +92,43 @@ class TestHashingAndMoves(unittest.TestCase):
         self.assertIsNotNone(f1_item)
         self.assertEqual(f1_item["id"], 1)
 
+    def test_move_of_legacy_sha256_row_keeps_its_id(self):
+        # Row stored before scans switched to fast fingerprints.
+        f1 = self.tmp_path / "legacy.jpg"
+        f1.write_bytes(os.urandom(5000))
+        legacy_id = upsert_media_item(self.conn, str(f1), "image", calculate_file_hash(f1))
+
+        f2 = self.tmp_path / "legacy_moved.jpg"
+        os.rename(f1, f2)
+        fp = fast_fingerprint(f2)
+        media_id = upsert_media_item(self.conn, str(f2), "image", fp)
+
+        self.assertEqual(media_id, legacy_id)
+        self.assertIsNone(get_media_by_path(self.conn, str(f1)))
+        self.assertEqual(get_media_by_path(self.conn, str(f2))["content_hash"], fp)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM media_items").fetchone()[0], 1)
+
+    def test_fast_fingerprint_survives_rename(self):
+        f1 = self.tmp_path / "clip.mp4"
+        f1.write_bytes(os.urandom(200_000))
+        fp1 = fast_fingerprint(f1)
+
+        f2 = self.tmp_path / "clip_renamed.mp4"
+        os.rename(f1, f2)
+        self.assertEqual(fast_fingerprint(f2), fp1)
+
+    def test_fast_fingerprint_changes_with_content(self):
+        f1 = self.tmp_path / "a.jpg"
+        f1.write_bytes(b"x" * 1000)
+        fp1 = fast_fingerprint(f1)
+
+        f1.write_bytes(b"y" * 1000)
+        os.utime(f1, ns=(0, os.stat(f1).st_mtime_ns))
+        self.assertNotEqual(fast_fingerprint(f1), fp1)
+
+        # Size is part of the fingerprint even when the sampled bytes match.
+        f1.write_bytes(b"y" * 1001)
+        self.assertNotEqual(fast_fingerprint(f1).split(":")[0], fp1.split(":")[0])
+
 if __name__ == "__main__":
     unittest.main()
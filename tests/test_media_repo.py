@@ -40,6 +40,65 @@ class TestMediaRepo(unittest.TestCase):
             scoped = list_media_in_scope(conn, [r"C:\\Media\\Cats", r"C:\\Media\\Dogs"])
             self.assertEqual([r['path'] for r in scoped], ['c:/media/cats/a.jpg', 'c:/media/dogs/b.jpg'])
 
+    def test_upsert_media_item_can_defer_commit(self) -> None:
+        from app.mediamanager.db.media_repo import upsert_media_item
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=MEMORY;")
+            upsert_media_item(conn, r"C:\\Media\\Cats\\a.jpg", 'image', 'h1', commit=False)
+            upsert_media_item(conn, r"C:\\Media\\Cats\\b.jpg", 'image', 'h2', commit=False)
+            self.assertTrue(conn.in_transaction)
+            conn.rollback()
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM media_items").fetchone()[0], 0)
+
+    def test_count_media_in_scope_matches_list(self) -> None:
+        from app.mediamanager.db.media_repo import count_media_in_scope, list_media_paths_in_scope
+        with sqlite3.connect(self.db_path) as conn:
+            add_media_item(conn, r"C:\\Media\\Cats\\a.jpg", 'image')
+            add_media_item(conn, r"C:\\Media\\Cats\\b.jpg", 'image')
+            add_media_item(conn, r"C:\\Media\\Dogs\\c.jpg", 'image')
+            conn.execute("UPDATE media_items SET is_hidden = 1 WHERE path LIKE '%/b.jpg'")
+
+            roots = [r"C:\\Media\\Cats"]
+            self.assertEqual(count_media_in_scope(conn, roots), len(list_media_in_scope(conn, roots)))
+            self.assertEqual(count_media_in_scope(conn, roots, include_hidden=False), 1)
+            self.assertEqual(
+                sorted(list_media_paths_in_scope(conn, roots)),
+                [("c:/media/cats/a.jpg", 0), ("c:/media/cats/b.jpg", 1)],
+            )
+
+    def test_upsert_media_items_bulk_is_atomic(self) -> None:
+        from app.mediamanager.db.media_repo import upsert_media_items_bulk
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=MEMORY;")
+            ids = upsert_media_items_bulk(conn, [
+                (r"C:\\Media\\Cats\\a.jpg", 'image', 'h1', 10, 20, None),
+                (r"C:\\Media\\Cats\\b.mp4", 'video', 'h2', 30, 40, 1500),
+            ])
+            self.assertEqual(ids, [1, 2])
+            self.assertFalse(conn.in_transaction)
+
+            with self.assertRaises(ValueError):
+                upsert_media_items_bulk(conn, [
+                    (r"C:\\Media\\Cats\\c.jpg", 'image', 'h3', None, None, None),
+                    ("bad-row",),
+                ])
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM media_items").fetchone()[0], 2)
+
+    def test_upsert_media_items_bulk_leaves_open_transaction_to_caller(self) -> None:
+        from app.mediamanager.db.media_repo import upsert_media_items_bulk
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=MEMORY;")
+            add_media_item(conn, r"C:\\Media\\Cats\\a.jpg", 'image', commit=False)
+            self.assertTrue(conn.in_transaction)
+
+            with self.assertRaises(ValueError):
+                upsert_media_items_bulk(conn, [("bad-row",)])
+            upsert_media_items_bulk(conn, [(r"C:\\Media\\Cats\\b.jpg", 'image', 'h2', None, None, None)])
+            self.assertTrue(conn.in_transaction)
+
+            conn.rollback()
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM media_items").fetchone()[0], 0)
+
     def test_list_media_in_scope_supports_limit_offset(self) -> None:
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("PRAGMA journal_mode=MEMORY;")
@@ -0,0 +1,60 @@
+import struct
+import unittest
+import uuid
+from pathlib import Path
+
+from app.mediamanager.metadata.containers.mp4_atoms import read_mp4_video_size
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _video_trak(width: int, height: int, rotate_90: bool = False, track_width: int | None = None) -> bytes:
+    matrix = [0, 0x10000, 0, -0x10000, 0, 0, 0, 0, 0x40000000] if rotate_90 else [0x10000, 0, 0, 0, 0x10000, 0, 0, 0, 0x40000000]
+    tkhd = bytes(4) + bytes(20) + bytes(16) + struct.pack(">9i", *matrix) + struct.pack(">II", (track_width or width) << 16, height << 16)
+    hdlr = bytes(8) + b"vide" + bytes(12)
+    entry = b"avc1" + bytes(24) + struct.pack(">HH", width, height) + bytes(50)
+    stsd = bytes(4) + struct.pack(">I", 1) + struct.pack(">I", 4 + len(entry)) + entry
+    stbl = _box(b"stsd", stsd)
+    minf = _box(b"stbl", stbl)
+    mdia = _box(b"hdlr", hdlr) + _box(b"minf", minf)
+    return _box(b"trak", _box(b"tkhd", tkhd) + _box(b"mdia", mdia))
+
+
+class TestMp4Atoms(unittest.TestCase):
+    def _write(self, data: bytes) -> Path:
+        tmp_dir = Path(".tmp-tests")
+        tmp_dir.mkdir(exist_ok=True)
+        path = tmp_dir / f"atoms-{uuid.uuid4()}.mp4"
+        path.write_bytes(data)
+        self.addCleanup(path.unlink)
+        return path
+
+    def test_reads_size_with_moov_after_mdat(self) -> None:
+        ftyp = _box(b"ftyp", b"isom" + bytes(4))
+        mdat = _box(b"mdat", bytes(4096))
+        path = self._write(ftyp + mdat + _box(b"moov", _video_trak(1920, 1081)))
+        self.assertEqual(read_mp4_video_size(path), (1920, 1081))
+
+    def test_rotation_swaps_dimensions(self) -> None:
+        path = self._write(_box(b"moov", _video_trak(1280, 720, rotate_90=True)))
+        self.assertEqual(read_mp4_video_size(path), (720, 1280))
+
+    def test_anamorphic_track_defers_to_ffprobe(self) -> None:
+        path = self._write(_box(b"moov", _video_trak(720, 480, track_width=853)))
+        self.assertIsNone(read_mp4_video_size(path))
+
+    def test_empty_tkhd_at_end_of_moov_returns_none(self) -> None:
+        hdlr = bytes(8) + b"vide" + bytes(12)
+        trak = _box(b"trak", _box(b"mdia", _box(b"hdlr", hdlr)) + _box(b"tkhd", b""))
+        path = self._write(_box(b"moov", trak))
+        self.assertIsNone(read_mp4_video_size(path))
+
+    def test_non_mp4_returns_none(self) -> None:
+        path = self._write(b"not a video at all")
+        self.assertIsNone(read_mp4_video_size(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from app.mediamanager.utils.pathing import is_under_root, normalize_windows_path
+from app.mediamanager.utils.pathing import is_under_root, local_file_url, normalize_windows_path
 
 
 class TestPathing(unittest.TestCase):
@@ -19,6 +19,11 @@ class TestPathing(unittest.TestCase):
         root = r"C:\\Users\\Glen\\Pics"
         self.assertFalse(is_under_root(r"C:\\Users\\Glen\\Pictures\\x.png", root))
 
+    def test_local_file_url_encodes_reserved_characters(self) -> None:
+        self.assertEqual(local_file_url("C:\\Pics\\a b#1.jpg"), "file:///C:/Pics/a%20b%231.jpg")
+        self.assertEqual(local_file_url("/home/glen/100%.png"), "file:///home/glen/100%25.png")
+        self.assertEqual(local_file_url("\\\\nas\\share\\x.mp4"), "file://nas/share/x.mp4")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 from pathlib import Path
 
 from app.mediamanager.db.migrations import init_db
-from app.mediamanager.db.tags_repo import attach_tags, list_media_tags
+from app.mediamanager.db.tags_repo import attach_tags, list_media_tags, set_media_tags
 
 
 class TestTagsRepo(unittest.TestCase):
@@ -38,6 +38,14 @@ class TestTagsRepo(unittest.TestCase):
             tags = list_media_tags(conn, 1)
         self.assertEqual(tags, ['cat'])
 
+    def test_set_media_tags_without_commit_leaves_transaction_to_caller(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            attach_tags(conn, 1, ['cat'])
+            set_media_tags(conn, 1, ['dog', 'puppy'], commit=False)
+            self.assertEqual(list_media_tags(conn, 1), ['dog', 'puppy'])
+            conn.rollback()
+            self.assertEqual(list_media_tags(conn, 1), ['cat'])
+
 
 if __name__ == '__main__':
     unittest.main()